@@ -23,3 +23,22 @@ class ReservationExpiredError(APIException):
     default_detail = 'Reservation has expired.'
     default_code = 'reservation_expired'
 
+
+class AuthBusyError(APIException):
+    """
+    Parola hash'leme havuzu dolu olduğunda fırlatılır (giriş/kayıt yükü).
+    HTTP 503 Service Unavailable döner.
+    """
+    status_code = 503
+    default_detail = 'Authentication is temporarily busy, please retry shortly.'
+    default_code = 'auth_busy'
+
+
+class CursorExpiredError(APIException):
+    """
+    Delta senkronizasyon cursor'ından sonraki değişiklik kayıtları silinmişse fırlatılır.
+    HTTP 410 Gone döner; istemci tam listeyi yeniden indirmelidir.
+    """
+    status_code = 410
+    default_detail = 'Change cursor has expired, re-download the event list.'
+    default_code = 'cursor_expired'
@@ -0,0 +1,150 @@
+"""
+Birden çok düğümde çalışan periyodik işler için süreli liderlik kilidi (lease).
+
+Her düğüm kendi beat/cron'u ile aynı işi tetiklese de işi aynı anda sadece kilidi alan
+düğüm çalıştırır; diğerleri atlar. Kilit paylaşılan önbellekte tutulur:
+- Alma: cache.add() (Redis'te SET NX PX)
+- Uzatma: iş sürerken arka plan thread'i LEADER_LEASE_SECONDS / 3 aralıkla süreyi yeniler;
+  Redis'te sahiplik kontrolü ve PEXPIRE tek bir Lua script ile atomik yapılır
+- Bırakma: sadece kilidin sahibi siler (Redis'te Lua ile)
+
+Düğüm çökerse kilit LEADER_LEASE_SECONDS sonra kendiliğinden düşer. Düğümler arası
+koordinasyon için CACHE_URL paylaşılan bir Redis'i göstermelidir; süreç içi bellek
+önbelleğinde kilit sadece aynı süreçteki çalışmaları dışlar.
+
+Her kilit için alınan, atlanan ve iş sürerken kaybedilen çalışmalar önbellekte sayılır
+(bkz. LeaderLease.stats ve `python manage.py leader_stats`).
+"""
+import functools
+import secrets
+import threading
+import time
+from typing import Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.backends.redis import RedisCache
+
+# Sahiplik kontrolü ile süre uzatma ve silme (KEYS[1]: anahtar, ARGV[1]: token, ARGV[2]: ms)
+RENEW_SCRIPT = (
+    "if redis.call('get', KEYS[1]) == ARGV[1] then "
+    "return redis.call('pexpire', KEYS[1], ARGV[2]) else return 0 end"
+)
+RELEASE_SCRIPT = (
+    "if redis.call('get', KEYS[1]) == ARGV[1] then "
+    "return redis.call('del', KEYS[1]) else return 0 end"
+)
+
+STAT_NAMES = ('acquired', 'skipped', 'lost')
+
+# single_leader ile korunan işlerin adları (leader_stats komutu için)
+registered_leases = set()
+
+
+def _redis_eval(script: str, key: str, *args) -> Optional[int]:
+    """Script'i Redis önbelleğinde çalıştırır; önbellek Redis değilse None döner."""
+    if not isinstance(cache, RedisCache):
+        return None
+    full_key = cache.make_and_validate_key(key)
+    client = cache._cache.get_client(full_key, write=True)
+    return client.eval(script, 1, full_key, *args)
+
+
+class LeaderLease:
+    """
+    Tek bir işin liderlik kilidi. Context manager olarak kullanılır:
+
+        with LeaderLease('expire_old_hold_reservations') as acquired:
+            if acquired:
+                ...
+
+    Token tamsayıdır; Django'nun Redis serializer'ı tamsayıları ham değer olarak yazdığı
+    için Lua script'leri token'ı doğrudan karşılaştırabilir.
+    """
+
+    def __init__(self, name: str, ttl: Optional[int] = None):
+        self.name = name
+        self.ttl = ttl or settings.LEADER_LEASE_SECONDS
+        self.key = f'leader:{name}'
+        self.token = secrets.randbits(62)
+        self.lost = False
+        self._stop = threading.Event()
+        self._renewer = None
+
+    def acquire(self) -> bool:
+        return cache.add(self.key, self.token, self.ttl)
+
+    def renew(self) -> bool:
+        """Kilit hala bizdeyse süresini yeniler; başka bir düğüme geçtiyse False döner."""
+        renewed = _redis_eval(RENEW_SCRIPT, self.key, self.token, self.ttl * 1000)
+        if renewed is not None:
+            return bool(renewed)
+        if cache.get(self.key) != self.token:
+            return False
+        return cache.touch(self.key, self.ttl)
+
+    def release(self) -> None:
+        if _redis_eval(RELEASE_SCRIPT, self.key, self.token) is None and cache.get(self.key) == self.token:
+            cache.delete(self.key)
+
+    def _keep_alive(self) -> None:
+        while not self._stop.wait(self.ttl / 3):
+            if not self.renew():
+                # İş durdurulamaz; kayıp sayılır, süre dolma gibi işler koşullu UPDATE'lerle korunur
+                self.lost = True
+                self.record('lost')
+                return
+
+    def __enter__(self) -> bool:
+        if not self.acquire():
+            self.record('skipped')
+            return False
+        self.record('acquired')
+        cache.set(f'{self.key}:last_run', time.time(), None)
+        self._renewer = threading.Thread(target=self._keep_alive, name=f'lease-{self.name}', daemon=True)
+        self._renewer.start()
+        return True
+
+    def __exit__(self, *exc_info) -> None:
+        if self._renewer is None:
+            return
+        self._stop.set()
+        self._renewer.join()
+        if not self.lost:
+            self.release()
+
+    def record(self, stat: str) -> None:
+        key = f'{self.key}:{stat}'
+        cache.add(key, 0, None)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Anahtar arada silindiyse (önbellek temizliği) sayaç yeniden başlar
+            cache.add(key, 1, None)
+
+    @staticmethod
+    def stats(name: str) -> Dict[str, Optional[float]]:
+        """İşin alınan/atlanan/kaybedilen çalışma sayıları ve son çalışma zamanı (Unix)."""
+        key = f'leader:{name}'
+        values = cache.get_many([f'{key}:{stat}' for stat in STAT_NAMES] + [f'{key}:last_run'])
+        result = {stat: values.get(f'{key}:{stat}', 0) for stat in STAT_NAMES}
+        result['last_run'] = values.get(f'{key}:last_run')
+        return result
+
+
+def single_leader(name: str, ttl: Optional[int] = None):
+    """
+    Fonksiyonu liderlik kilidi ile sarar; kilit başka bir düğümdeyse fonksiyon çalışmaz ve None döner.
+    Celery görevlerinde @shared_task'ın altına yazılır.
+    """
+    registered_leases.add(name)
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with LeaderLease(name, ttl) as acquired:
+                if not acquired:
+                    return None
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
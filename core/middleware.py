@@ -0,0 +1,68 @@
+"""
+Rezervasyon sistemi için ara katmanlar.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .routers import replica_configured, replica_reads
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+STICKY_COOKIE = 'db_primary_until'
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Salt okunur istekleri replikaya yönlendirir ve yazmalardan sonra okumaları birincilde tutar.
+    
+    Başarılı bir yazma isteğinden sonra istemci REPLICA_STICKY_SECONDS boyunca birincilden okur
+    (read-your-writes). İstemci iki yolla tanınır:
+    - `db_primary_until` çerezi (tarayıcı ve admin)
+    - Authorization başlığının özeti ile önbellek anahtarı (çerez saklamayan JWT istemcileri)
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not replica_configured():
+            return self.get_response(request)
+        
+        use_replica = request.method in SAFE_METHODS and not self._is_sticky(request)
+        with replica_reads(use_replica):
+            response = self.get_response(request)
+        
+        if request.method not in SAFE_METHODS and response.status_code < 400:
+            self._make_sticky(request, response)
+        return response
+
+    @staticmethod
+    def _client_key(request):
+        authorization = request.META.get('HTTP_AUTHORIZATION')
+        if not authorization:
+            return None
+        return f'db:primary:{hashlib.sha256(authorization.encode()).hexdigest()}'
+
+    def _is_sticky(self, request) -> bool:
+        try:
+            if float(request.COOKIES.get(STICKY_COOKIE, 0)) > time.time():
+                return True
+        except ValueError:
+            pass
+        key = self._client_key(request)
+        return key is not None and cache.get(key) is not None
+
+    def _make_sticky(self, request, response):
+        seconds = settings.REPLICA_STICKY_SECONDS
+        response.set_cookie(
+            STICKY_COOKIE,
+            str(time.time() + seconds),
+            max_age=seconds,
+            httponly=True,
+            samesite='Lax',
+        )
+        key = self._client_key(request)
+        if key is not None:
+            cache.set(key, True, seconds)
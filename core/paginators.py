@@ -0,0 +1,52 @@
+"""
+Büyük tablolar için sayfalama yardımcıları.
+"""
+import json
+
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    PostgreSQL'de büyük tablolarda `COUNT(*)` yerine planner tahminini kullanan paginator.
+    
+    Filtresiz listelerde tablo istatistiği (`pg_class.reltuples`), filtreli listelerde
+    `EXPLAIN` satır tahmini kullanılır. Tahmin EXACT_COUNT_THRESHOLD altındaysa veya
+    veritabanı PostgreSQL değilse tam sayım yapılır; küçük listeler her zaman doğru sayılır.
+    """
+    EXACT_COUNT_THRESHOLD = 10000
+
+    @cached_property
+    def count(self):
+        estimate = self._estimate()
+        if estimate is not None and estimate >= self.EXACT_COUNT_THRESHOLD:
+            return estimate
+        return super().count
+
+    def _estimate(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is None:
+            return None
+        connection = connections[self.object_list.db]
+        if connection.vendor != 'postgresql':
+            return None
+        
+        with connection.cursor() as cursor:
+            if not query.where:
+                # Partition'lı tablolarda satırlar alt tablolarda olduğu için onların tahminleri toplanır
+                table = connection.ops.quote_name(query.model._meta.db_table)
+                cursor.execute(
+                    "SELECT COALESCE(SUM(GREATEST(c.reltuples, 0)), 0)::bigint FROM pg_class c "
+                    "WHERE c.oid = to_regclass(%s) "
+                    "OR c.oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = to_regclass(%s))",
+                    [table, table]
+                )
+                return cursor.fetchone()[0]
+            sql, params = self.object_list.order_by().values('pk').query.sql_with_params()
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            return int(plan[0]['Plan']['Plan Rows'])
@@ -0,0 +1,37 @@
+"""
+DRF için hızlı JSON parser.
+
+orjson kuruluysa istek gövdeleri orjson ile çözülür; kurulu değilse DRF'in standart
+`json` tabanlı parser'ı kullanılır.
+"""
+import codecs
+import io
+
+from rest_framework.parsers import JSONParser, get_encoding
+
+from .renderers import FastJSONRenderer, orjson
+
+
+class FastJSONParser(JSONParser):
+    """
+    orjson tabanlı JSON parser.
+    
+    orjson'ın reddettiği her gövde (geçersiz JSON, 64 bitten büyük tamsayılar, eşleşmemiş
+    surrogate'lar vb.) standart parser ile yeniden denenir; böylece kabul edilen gövdeler ve
+    hata mesajları DRF `JSONParser` ile aynı kalır.
+    """
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+        
+        # Sadece metin kodlamalarına izin verilir (bkz. rest_framework.parsers.get_encoding)
+        encoding = get_encoding(parser_context or {})
+        body = stream.read()
+        try:
+            if codecs.lookup(encoding).name != 'utf-8':
+                return orjson.loads(body.decode(encoding))
+            return orjson.loads(body)
+        except (orjson.JSONDecodeError, UnicodeDecodeError):
+            return super().parse(io.BytesIO(body), media_type, parser_context)
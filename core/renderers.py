@@ -0,0 +1,53 @@
+"""
+DRF için hızlı JSON renderer.
+
+orjson kuruluysa yanıtlar orjson ile serileştirilir; kurulu değilse veya orjson bir değeri
+serileştiremezse DRF'in standart `json` tabanlı renderer'ına düşülür.
+"""
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson isteğe bağlı bağımlılıktır
+    orjson = None
+
+# orjson tarih/saatleri kendisi yazar; UTC değerler DRF'teki gibi 'Z' ile biter
+ORJSON_OPTIONS = orjson.OPT_UTC_Z if orjson else 0
+# orjson'ın doğrudan desteklemediği tipler (Decimal, timedelta, lazy string vb.) DRF kurallarıyla yazılır
+_default = encoders.JSONEncoder().default
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    Çıktısı DRF `JSONRenderer` ile aynı olan, orjson tabanlı renderer.
+    
+    - datetime, date ve time orjson tarafından yazılır (UTC için 'Z' son eki, mikrosaniyeler korunur)
+    - Decimal, timedelta, UUID ve lazy string gibi diğer tipler DRF'in JSONEncoder.default() metoduna gider
+    - U+2028 ve U+2029 DRF'teki gibi kaçışlanır
+    - Girintili çıktı (`Accept: application/json; indent=4`, browsable API) ve
+      UNICODE_JSON / COMPACT_JSON ayarları kapatıldığında standart renderer kullanılır
+    
+    Bilinen farklar: üslü float'lar `1e+16` yerine `1e16` yazılır (aynı değer) ve NaN/Infinity
+    STRICT_JSON altında hata vermek yerine `null` yazılır.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+        
+        try:
+            ret = orjson.dumps(data, default=_default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # 64 bitten büyük tamsayılar, str olmayan sözlük anahtarları vb.
+            return super().render(data, accepted_media_type, renderer_context)
+        
+        # JavaScript'in katı alt kümesi olması için (bkz. JSONRenderer.render)
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
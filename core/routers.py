@@ -0,0 +1,67 @@
+"""
+Birincil/replika veritabanı yönlendirmesi.
+
+Okuma sorguları sadece şu durumların hepsi sağlandığında `replica` aliasına gider:
+- `replica` veritabanı tanımlı (DB_REPLICA_HOST)
+- İstek salt okunur ve istemci son yazmasından sonraki yapışkan süre içinde değil
+  (bkz. core.middleware.ReplicaRoutingMiddleware)
+- Birincil veritabanında açık bir transaction yok (kilitli okumalar ve servis katmanı
+  işlemleri her zaman birincilde kalır)
+
+Celery görevleri, yönetim komutları ve yazma istekleri her zaman birincil veritabanını kullanır.
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+REPLICA_DB_ALIAS = 'replica'
+
+# Her zaman birincilden okunan uygulamalar (oturumlar replika gecikmesinden etkilenmemeli)
+PRIMARY_ONLY_APPS = {'sessions'}
+
+_replica_reads = ContextVar('replica_reads', default=False)
+
+
+def replica_configured() -> bool:
+    return REPLICA_DB_ALIAS in settings.DATABASES
+
+
+@contextmanager
+def replica_reads(enabled: bool = True):
+    """
+    Bu blok içindeki okumaların replikaya gidip gidemeyeceğini belirler.
+    ContextVar kullanıldığı için thread'ler ve async görevler birbirini etkilemez.
+    """
+    token = _replica_reads.set(enabled)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+class PrimaryReplicaRouter:
+    """
+    Yazmaları birincil veritabanına, izin verilen okumaları replikaya yönlendirir.
+    """
+
+    def db_for_read(self, model, **hints):
+        if not _replica_reads.get() or not replica_configured():
+            return DEFAULT_DB_ALIAS
+        if model._meta.app_label in PRIMARY_ONLY_APPS:
+            return DEFAULT_DB_ALIAS
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            # Transaction içindeki okumalar (select_for_update dahil) birincilde kalır
+            return DEFAULT_DB_ALIAS
+        return REPLICA_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replika birincilin kopyasıdır; iki alias'taki nesneler aynı veriyi temsil eder
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
@@ -0,0 +1,170 @@
+"""
+Paylaşılan serializer yardımcıları.
+"""
+from rest_framework import ISO_8601, relations, serializers
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.settings import api_settings
+
+
+def _split(value) -> set:
+    return {name.strip() for name in (value or '').split(',') if name.strip()}
+
+
+class SparseFieldsetMixin:
+    """
+    `?fields=` ve `?omit=` sorgu parametreleriyle yanıttaki alanları seçmeyi sağlayan serializer mixin'i.
+    
+    - `?fields=id,name,start_time`: sadece bu alanlar döner
+    - `?omit=description`: bu alanlar dışındaki tüm alanlar döner
+    
+    Seçim sadece okuma (GET/HEAD/OPTIONS) isteklerinde uygulanır; yazma isteklerinde alan kümesi
+    değişmez. Bilinmeyen alan adları yok sayılır. View'lar aynı seçimi `sparse_queryset()` ile
+    queryset'e de uygulamalıdır; böylece istenmeyen sütunlar ve ilişkiler hiç yüklenmez.
+    """
+    # Kaynağı tek bir model alanı olmayan alanların (ör. SerializerMethodField) ihtiyaç duyduğu model alanları
+    sparse_field_sources = {}
+
+    def __init__(self, *args, **kwargs):
+        fields = kwargs.pop('fields', None)
+        super().__init__(*args, **kwargs)
+        if fields is None:
+            fields = self._select(self.context.get('request'), self.fields)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @staticmethod
+    def _select(request, field_names):
+        if request is None or request.method not in SAFE_METHODS:
+            return None
+        params = getattr(request, 'query_params', request.GET)
+        fields, omit = _split(params.get('fields')), _split(params.get('omit'))
+        if not fields and not omit:
+            return None
+        return {name for name in field_names if (not fields or name in fields) and name not in omit}
+
+    @classmethod
+    def requested_fields(cls, request):
+        """
+        İstekte seçilen alan adlarını döndürür; `?fields=` ve `?omit=` yoksa None.
+        """
+        return cls._select(request, cls().fields)
+
+    @classmethod
+    def sparse_queryset(cls, queryset, fields):
+        """
+        Queryset'i sadece seçilen alanların ihtiyaç duyduğu sütunları yükleyecek şekilde daraltır.
+        
+        `event.name` gibi ilişki üzerinden okunan alanlar için ilişki `select_related()` ile
+        aynı sorguda alınır. Birincil anahtar her zaman yüklenir.
+        """
+        serializer_fields = cls().fields
+        only, related = set(), set()
+        for name in fields:
+            sources = cls.sparse_field_sources.get(name, (serializer_fields[name].source,))
+            for source in sources:
+                if source == '*':
+                    continue
+                path = source.replace('.', '__')
+                only.add(path)
+                if '__' in path:
+                    related.add(path.rsplit('__', 1)[0])
+        if related:
+            queryset = queryset.select_related(*related)
+        # Hiçbir alan seçilmediyse sadece birincil anahtar yüklenir (boş only() tüm sütunları yükler)
+        return queryset.only(*(only | related or {queryset.model._meta.pk.name}))
+
+
+def _datetime_converter(field):
+    """
+    DateTimeField.to_representation ile aynı çıktıyı veren, saat dilimi ve biçimi önceden çözülmüş dönüştürücü.
+    """
+    output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+    field_timezone = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+    if output_format is None or output_format.lower() != ISO_8601 or field_timezone is None:
+        return field.to_representation
+
+    def convert(value):
+        if value.tzinfo is None:
+            return field.to_representation(value)
+        value = value.astimezone(field_timezone).isoformat()
+        if value.endswith('+00:00'):
+            value = value[:-6] + 'Z'
+        return value
+    return convert
+
+
+def _identity(value):
+    return value
+
+
+# Veritabanından zaten doğru tipte gelen değerler için dönüşüm yapılmaz
+_CONVERTERS = {
+    serializers.IntegerField: _identity,
+    serializers.CharField: _identity,
+    serializers.BooleanField: bool,
+    serializers.DateTimeField: _datetime_converter,
+    relations.PrimaryKeyRelatedField: _identity,
+}
+
+
+class ValuesSerializer:
+    """
+    Liste endpoint'leri için `values()` satırlarından doğrudan çıktı üreten hafif okuma serializer'ı.
+    
+    `serializer_class` alanlarından bir kez erişimci listesi (çıktı adı, values() anahtarı,
+    dönüştürücü) derlenir; satır başına serializer veya alan nesnesi oluşturulmaz. Çıktı
+    `serializer_class` ile aynıdır. `?fields=` / `?omit=` seçimi `fields` ile verilir.
+    
+    Kaynağı model alanı olmayan alanlar (ör. SerializerMethodField) `computed_fields` içinde
+    ihtiyaç duydukları values() anahtarlarıyla tanımlanır ve `prepare()` ile satıra eklenir.
+    """
+    serializer_class = None
+    # {alan adı: ihtiyaç duyulan values() anahtarları}
+    computed_fields = {}
+
+    def __init__(self, fields=None):
+        serializer_fields = self.serializer_class(fields=fields).fields
+        self.keys = []
+        self.accessors = []
+        self.computed = set()
+        for name, field in serializer_fields.items():
+            if name in self.computed_fields:
+                self.computed.add(name)
+                keys = self.computed_fields[name]
+                convert = _identity
+                key = name
+            else:
+                key = field.source.replace('.', '__')
+                keys = (key,)
+                factory = _CONVERTERS.get(type(field))
+                if factory is None:
+                    convert = field.to_representation
+                elif factory is _datetime_converter:
+                    convert = factory(field)
+                else:
+                    convert = factory
+            self.keys.extend(key for key in keys if key not in self.keys)
+            self.accessors.append((name, key, convert))
+
+    def values(self, queryset):
+        """Queryset'i sadece gereken sütunları döndüren values() sorgusuna çevirir."""
+        return queryset.values(*self.keys)
+
+    def prepare(self, row: dict) -> dict:
+        """`computed_fields` değerlerini satıra ekler (alt sınıflar tarafından uygulanır)."""
+        return row
+
+    def to_representation(self, rows) -> list:
+        accessors = self.accessors
+        prepare = self.prepare if self.computed else None
+        data = []
+        for row in rows:
+            if prepare is not None:
+                row = prepare(row)
+            item = {}
+            for name, key, convert in accessors:
+                value = row[key]
+                item[name] = None if value is None else convert(value)
+            data.append(item)
+        return data
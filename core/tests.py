@@ -1,3 +1,246 @@
-from django.test import TestCase
+import datetime
+import decimal
+import io
+import time
+import uuid
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.utils.translation import gettext_lazy
+from django.core.cache import cache
+from django.db import transaction
+
+from events.models import Event, Reservation
+from reservation_system.celery import app as celery_app
+from events.serializers import EventSerializer, ReservationSerializer
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from .locks import LeaderLease, single_leader
+from .middleware import STICKY_COOKIE, ReplicaRoutingMiddleware
+from .parsers import FastJSONParser
+from .renderers import FastJSONRenderer
+from .routers import PrimaryReplicaRouter, replica_reads
+
+WITH_REPLICA = {**settings.DATABASES, 'replica': settings.DATABASES['default']}
+
+
+@override_settings(DATABASES=WITH_REPLICA, REPLICA_STICKY_SECONDS=5)
+class ReplicaRoutingTestCase(SimpleTestCase):
+    """
+    Birincil/replika yönlendirmesi ve read-your-writes yapışkanlığı için testler.
+    """
+    databases = {'default'}
+    
+    def setUp(self):
+        cache.clear()
+        self.router = PrimaryReplicaRouter()
+        self.factory = RequestFactory()
+    
+    def _route(self, request, status_code=200):
+        """İsteği ara katmandan geçirir; view içindeki okuma alias'ını ve yanıtı döndürür."""
+        seen = {}
+        
+        def view(request):
+            seen['alias'] = self.router.db_for_read(Event)
+            return HttpResponse(status=status_code)
+        
+        response = ReplicaRoutingMiddleware(view)(request)
+        return seen['alias'], response
+    
+    def test_reads_outside_requests_use_primary(self):
+        """İstek dışındaki okumaların (Celery, komutlar) birincile gittiğini test eder."""
+        self.assertEqual(self.router.db_for_read(Event), 'default')
+        self.assertEqual(self.router.db_for_write(Event), 'default')
+    
+    def test_atomic_reads_use_primary(self):
+        """Transaction içindeki okumaların birincilde kaldığını test eder."""
+        with replica_reads():
+            self.assertEqual(self.router.db_for_read(Event), 'replica')
+            with transaction.atomic():
+                self.assertEqual(self.router.db_for_read(Event), 'default')
+    
+    def test_safe_requests_read_from_replica(self):
+        """Salt okunur isteklerin replikaya, yazma isteklerinin birincile gittiğini test eder."""
+        alias, _ = self._route(self.factory.get('/api/events/'))
+        self.assertEqual(alias, 'replica')
+        
+        alias, _ = self._route(self.factory.post('/api/reservations/create_hold/'))
+        self.assertEqual(alias, 'default')
+    
+    def test_sticky_cookie_after_write(self):
+        """Başarılı yazmadan sonra çerezle okumaların birincilde kaldığını test eder."""
+        _, response = self._route(self.factory.post('/api/reservations/create_hold/'), status_code=201)
+        cookie = response.cookies[STICKY_COOKIE]
+        
+        request = self.factory.get('/api/reservations/')
+        request.COOKIES[STICKY_COOKIE] = cookie.value
+        alias, _ = self._route(request)
+        self.assertEqual(alias, 'default')
+    
+    def test_sticky_authorization_after_write(self):
+        """Çerez saklamayan JWT istemcilerinin de yazmadan sonra birincilden okuduğunu test eder."""
+        self._route(
+            self.factory.post('/api/reservations/create_hold/', HTTP_AUTHORIZATION='Bearer token-a'),
+            status_code=201
+        )
+        
+        alias, _ = self._route(self.factory.get('/api/reservations/', HTTP_AUTHORIZATION='Bearer token-a'))
+        self.assertEqual(alias, 'default')
+        alias, _ = self._route(self.factory.get('/api/reservations/', HTTP_AUTHORIZATION='Bearer token-b'))
+        self.assertEqual(alias, 'replica')
+    
+    def test_failed_write_is_not_sticky(self):
+        """Başarısız yazmaların istemciyi birincile bağlamadığını test eder."""
+        _, response = self._route(self.factory.post('/api/reservations/create_hold/'), status_code=400)
+        
+        self.assertNotIn(STICKY_COOKIE, response.cookies)
+
+
+
+class FastJSONTestCase(TestCase):
+    """
+    orjson tabanlı renderer/parser'ın DRF'in standart JSON sınıflarıyla aynı çıktıyı verdiğini test eder.
+    """
+    
+    def assertSameRendering(self, data, accepted_media_type=None):
+        self.assertEqual(
+            FastJSONRenderer().render(data, accepted_media_type),
+            JSONRenderer().render(data, accepted_media_type),
+        )
+    
+    def test_renders_like_drf_json_renderer(self):
+        """Tarih, Decimal, UUID, lazy string ve özel karakterlerin aynı yazıldığını test eder."""
+        utc = datetime.timezone.utc
+        self.assertSameRendering({
+            'aware': datetime.datetime(2025, 1, 2, 3, 4, 5, tzinfo=utc),
+            'micro': datetime.datetime(2025, 1, 2, 3, 4, 5, 123456, tzinfo=utc),
+            'offset': datetime.datetime(2025, 1, 2, 3, 4, 5, tzinfo=datetime.timezone(datetime.timedelta(hours=3))),
+            'naive': datetime.datetime(2025, 1, 2, 3, 4, 5),
+            'date': datetime.date(2025, 1, 2),
+            'time': datetime.time(3, 4, 5),
+            'duration': datetime.timedelta(minutes=5),
+            'price': decimal.Decimal('12.50'),
+            'uuid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'lazy': gettext_lazy('Event'),
+            'text': 'Konser \u2028 İstanbul \u2029 "ç" \\ \n',
+            'nested': [1, 2.5, True, None, {'a': []}],
+        })
+        self.assertSameRendering({'big': 2 ** 70, 1: 'int key'})
+        self.assertSameRendering([{'a': 1}], 'application/json; indent=4')
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+    
+    def test_serializer_payloads_match(self):
+        """Etkinlik ve rezervasyon serializer çıktılarının bayt bayt aynı olduğunu test eder."""
+        user = get_user_model().objects.create_user(username='jsonuser', email='json@example.com', password='x')
+        event = Event.objects.create(
+            name='Açık Hava Konseri',
+            description='Line\u2028separator',
+            capacity=10,
+            start_time=datetime.datetime(2025, 6, 1, 18, 30, tzinfo=datetime.timezone.utc),
+            end_time=datetime.datetime(2025, 6, 1, 21, 0, tzinfo=datetime.timezone.utc),
+        )
+        Reservation.objects.create(event=event, user=user, quantity=2)
+        
+        events = EventSerializer(Event.objects.with_capacity(), many=True).data
+        reservations = ReservationSerializer(Reservation.objects.select_related('event', 'user'), many=True).data
+        self.assertSameRendering({'count': 1, 'results': events})
+        self.assertSameRendering(reservations)
+    
+    def test_parses_like_drf_json_parser(self):
+        """Geçerli ve geçersiz gövdelerin standart parser ile aynı sonucu verdiğini test eder."""
+        for body in [b'{"event_id": 1, "quantity": 2}', '{"name": "Şehir"}'.encode(), b'[1e400, 123456789012345678901234]']:
+            self.assertEqual(
+                FastJSONParser().parse(io.BytesIO(body)),
+                JSONParser().parse(io.BytesIO(body)),
+            )
+        
+        self.assertEqual(
+            FastJSONParser().parse(io.BytesIO('{"a": "ç"}'.encode('latin-1')), parser_context={'encoding': 'latin-1'}),
+            {'a': 'ç'},
+        )
+        for body in [b'{"a": ', b'NaN', b'']:
+            with self.assertRaises(ParseError) as fast:
+                FastJSONParser().parse(io.BytesIO(body))
+            with self.assertRaises(ParseError) as standard:
+                JSONParser().parse(io.BytesIO(body))
+            self.assertEqual(str(fast.exception), str(standard.exception))
+        
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b'{}'), parser_context={'encoding': 'bz2_codec'})
+
+
+class CeleryRoutingTestCase(SimpleTestCase):
+    """
+    Celery görev kuyruğu yönlendirmesi için testler.
+    """
+    
+    def _queue(self, task_name):
+        return celery_app.amqp.router.route({}, task_name)['queue'].name
+    
+    def test_periodic_tasks_are_routed_to_dedicated_queues(self):
+        """Süre dolma taramasının bakım ve bildirim işlerinden ayrı kuyrukta olduğunu test eder."""
+        self.assertEqual(self._queue('expire_old_hold_reservations'), 'expiry')
+        self.assertEqual(self._queue('relay_outbox'), 'notifications')
+        self.assertEqual(self._queue('deliver_webhooks'), 'notifications')
+        self.assertEqual(self._queue('purge_expired_tokens'), 'maintenance')
+        self.assertEqual(self._queue('unknown_task'), 'celery')
+        
+        # Her kayıtlı görev tanımlı bir kuyruğa gider
+        queues = {queue.name for queue in celery_app.conf.task_queues}
+        for name in celery_app.tasks:
+            if not name.startswith('celery.'):
+                self.assertIn(self._queue(name), queues, name)
+    
+    def test_frequent_tasks_ignore_results(self):
+        """Sonucu okunmayan sık görevlerin result backend'e yazmadığını test eder."""
+        for name in ('expire_old_hold_reservations', 'relay_outbox', 'deliver_webhooks', 'build_featured_events'):
+            self.assertTrue(celery_app.tasks[name].ignore_result, name)
+
+
+class LeaderLeaseTestCase(SimpleTestCase):
+    """
+    Periyodik işler için liderlik kilidi testleri.
+    """
+    
+    def setUp(self):
+        cache.clear()
+    
+    def test_only_one_holder(self):
+        """Kilidin aynı anda tek sahibi olduğunu ve sadece sahibinin bırakabildiğini test eder."""
+        leader = LeaderLease('sweep')
+        follower = LeaderLease('sweep')
+        
+        self.assertTrue(leader.acquire())
+        self.assertFalse(follower.acquire())
+        follower.release()
+        self.assertFalse(follower.renew())
+        self.assertTrue(leader.renew())
+        
+        leader.release()
+        self.assertTrue(follower.acquire())
+    
+    def test_decorator_skips_and_counts(self):
+        """Kilit başkasındayken fonksiyonun çalışmadığını ve sayaçların arttığını test eder."""
+        @single_leader('sweep')
+        def sweep():
+            return 'done'
+        
+        self.assertEqual(sweep(), 'done')
+        with LeaderLease('sweep'):
+            self.assertIsNone(sweep())
+        self.assertEqual(sweep(), 'done')
+        
+        stats = LeaderLease.stats('sweep')
+        self.assertEqual((stats['acquired'], stats['skipped'], stats['lost']), (3, 1, 0))
+        self.assertIsNotNone(stats['last_run'])
+    
+    def test_lease_is_renewed_during_long_runs(self):
+        """Uzun süren işte kilidin süresi dolmadan yenilendiğini test eder."""
+        with LeaderLease('sweep', ttl=1) as acquired:
+            self.assertTrue(acquired)
+            time.sleep(1.5)
+            self.assertFalse(LeaderLease('sweep').acquire())
+        self.assertTrue(LeaderLease('sweep').acquire())
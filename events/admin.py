@@ -1,5 +1,25 @@
 from django.contrib import admin
-from .models import Event, Reservation
+from django.db.models import Q
+
+from core.paginators import EstimatedCountPaginator
+from users.models import User
+from .models import Event, EventSalesSummary, InventoryBucket, Reservation, WebhookDelivery, WebhookSubscription
+from .services import ReservationService
+
+
+class InventoryBucketInline(admin.TabularInline):
+    """
+    Etkinliğin envanter kovalarını salt okunur olarak gösterir.
+    Kova kapasiteleri ReservationService.rebalance_inventory() ile yönetilir.
+    """
+    model = InventoryBucket
+    fields = ['index', 'capacity', 'reserved', 'updated_at']
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+
+    def has_add_permission(self, request, obj=None):
+        return False
 
 
 @admin.register(Event)
@@ -7,10 +27,51 @@ class EventAdmin(admin.ModelAdmin):
     """
     Event modeli için admin arayüzü.
     """
-    list_display = ['name', 'capacity', 'start_time', 'end_time', 'is_active', 'created_at']
+    list_display = [
+        'name', 'capacity', 'held', 'confirmed', 'available', 'start_time', 'end_time',
+        'is_active', 'max_per_user', 'inventory_shards', 'created_at'
+    ]
     list_filter = ['is_active', 'start_time', 'created_at']
     search_fields = ['name', 'description']
     date_hierarchy = 'start_time'
+    readonly_fields = ['capacity_status']
+    inlines = [InventoryBucketInline]
+
+    @admin.display(description='Capacity status')
+    def capacity_status(self, obj):
+        """
+        Etkinliğin anlık HOLD, CONFIRMED ve kalan kapasitesini gösterir.
+        """
+        if obj.pk is None:
+            return '-'
+        snapshot = obj.capacity_snapshot()
+        return f'Held: {snapshot.held}, Confirmed: {snapshot.confirmed}, Available: {snapshot.available}'
+
+    def get_queryset(self, request):
+        """
+        Kapasite sütunları sayfa başına tek sorguda hesaplanır (EventQuerySet.with_capacity).
+        """
+        return super().get_queryset(request).with_capacity()
+
+    @admin.display(description='Held', ordering='held_quantity')
+    def held(self, obj):
+        return obj.capacity_snapshot().held
+
+    @admin.display(description='Confirmed', ordering='confirmed_quantity')
+    def confirmed(self, obj):
+        return obj.capacity_snapshot().confirmed
+
+    @admin.display(description='Available')
+    def available(self, obj):
+        return obj.capacity_snapshot().available
+
+    def save_model(self, request, obj, form, change):
+        """
+        Etkinliği kaydeder ve kapasiteyi envanter kovalarına yeniden dağıtır.
+        """
+        super().save_model(request, obj, form, change)
+        if obj.inventory_shards or change:
+            ReservationService.rebalance_inventory(obj.id)
 
 
 @admin.register(Reservation)
@@ -19,8 +80,74 @@ class ReservationAdmin(admin.ModelAdmin):
     Reservation modeli için admin arayüzü.
     """
     list_display = ['id', 'user', 'event', 'status', 'quantity', 'expires_at', 'created_at']
+    list_select_related = ['user', 'event']
     list_filter = ['status', 'created_at', 'expires_at']
+    # Arama get_search_results() içinde indeksli alt sorgularla yapılır
     search_fields = ['user__username', 'event__name']
-    date_hierarchy = 'created_at'
-    readonly_fields = ['created_at', 'updated_at']
+    search_help_text = 'Reservation id, username or event name'
+    readonly_fields = ['bucket', 'created_at', 'updated_at']
+    raw_id_fields = ['user', 'event']
+    # Milyonlarca satırda COUNT(*) yerine tahmini sayı kullanılır
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Kullanıcı adı ve etkinlik adını JOIN + OR ILIKE yerine ayrı alt sorgularla arar.
+        
+        Her alt sorgu kendi tablosundaki trigram indeksini, dış sorgu ise
+        reservations.user_id / event_id indekslerini kullanabilir.
+        """
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        condition = (
+            Q(user_id__in=User.objects.filter(username__icontains=search_term).values('id'))
+            | Q(event_id__in=Event.objects.filter(name__icontains=search_term).values('id'))
+        )
+        if search_term.isdigit():
+            condition |= Q(pk=int(search_term))
+        return queryset.filter(condition), False
+
+
+
+@admin.register(EventSalesSummary)
+class EventSalesSummaryAdmin(admin.ModelAdmin):
+    """
+    Arşivlenmiş etkinlik özetleri için salt okunur admin arayüzü.
+    """
+    list_display = ['event', 'reservation_count', 'confirmed_quantity', 'cancelled_quantity', 'expired_quantity', 'archived_at']
+    list_select_related = ['event']
+    readonly_fields = list_display
+
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(WebhookSubscription)
+class WebhookSubscriptionAdmin(admin.ModelAdmin):
+    """
+    İş ortağı webhook abonelikleri.
+    """
+    list_display = ['owner', 'url', 'topics', 'event', 'is_active', 'created_at']
+    list_filter = ['is_active']
+    list_select_related = ['owner', 'event']
+    raw_id_fields = ['owner', 'event']
+    search_fields = ['url', 'owner__username']
+
+
+@admin.register(WebhookDelivery)
+class WebhookDeliveryAdmin(admin.ModelAdmin):
+    """
+    Webhook teslimleri için salt okunur admin arayüzü.
+    """
+    list_display = ['message_id', 'topic', 'subscription', 'status', 'attempts', 'next_attempt_at', 'last_error']
+    list_filter = ['status', 'topic']
+    list_select_related = ['subscription']
+    readonly_fields = [
+        'subscription', 'message_id', 'topic', 'payload', 'status', 'attempts',
+        'next_attempt_at', 'last_error', 'created_at', 'delivered_at'
+    ]
 
+    def has_add_permission(self, request):
+        return False
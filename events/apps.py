@@ -10,5 +10,6 @@ class EventsConfig(AppConfig):
         Uygulama hazır olduğunda signal ve task'ları import eder.
         Celery görevlerinin kayıt edilmesini sağlar.
         """
+        import events.signals  # noqa
         import events.tasks  # noqa
 
@@ -0,0 +1,66 @@
+"""
+Bitmiş etkinliklerin rezervasyonlarını arşivlemek için Django yönetim komutu.
+
+Etkinlik başına son sayıları EventSalesSummary tablosuna yazar; ardından isteğe bağlı olarak
+partition'ları ayırır (--detach) veya rezervasyon satırlarını parça parça siler (--purge).
+
+Kullanım: python manage.py archive_reservations [--days 30] [--detach] [--purge]
+"""
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from events import partitioning
+from events.services import ReservationArchiveService
+
+
+class Command(BaseCommand):
+    help = 'Bitmiş etkinliklerin rezervasyonlarını özetler ve canlı tablodan çıkarır'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=30,
+            help='Bitişinin üzerinden en az bu kadar gün geçmiş etkinlikler arşivlenir (varsayılan: 30)'
+        )
+        parser.add_argument(
+            '--detach',
+            action='store_true',
+            help='Sadece arşivlenmiş etkinliklere ait partition\'ları ayır (PostgreSQL)'
+        )
+        parser.add_argument(
+            '--purge',
+            action='store_true',
+            help='Arşivlenmiş etkinliklerin rezervasyonlarını canlı tablodan sil'
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=ReservationArchiveService.PURGE_BATCH_SIZE,
+            help='Silme işlemi başına rezervasyon sayısı'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Arşivleme mantığını çalıştırır.
+        Service katmanı metodlarını çağırır.
+        """
+        cutoff = timezone.now() - timedelta(days=options['days'])
+        
+        summarized = ReservationArchiveService.summarize_ended_events(cutoff)
+        self.stdout.write(self.style.SUCCESS(f'Summarized {summarized} ended event(s)'))
+        
+        if options['detach']:
+            detached = partitioning.detach_archived_partitions(cutoff.date())
+            if detached:
+                self.stdout.write(
+                    self.style.SUCCESS(f'Detached partition(s): {", ".join(detached)}')
+                )
+            else:
+                self.stdout.write('No partitions to detach')
+        
+        if options['purge']:
+            deleted = ReservationArchiveService.purge_archived_reservations(options['batch_size'])
+            self.stdout.write(self.style.SUCCESS(f'Purged {deleted} archived reservation(s)'))
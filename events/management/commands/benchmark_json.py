@@ -0,0 +1,102 @@
+"""
+JSON renderer/parser'ları karşılaştırmak için Django yönetim komutu.
+
+Geçici etkinlik ve rezervasyonlar oluşturur, EventSerializer ve ReservationSerializer
+çıktılarını DRF'in standart JSONRenderer/JSONParser sınıfları ve core'daki orjson tabanlı
+sınıflarla tekrar tekrar serileştirip çözer ve istek başına süreleri raporlar.
+Oluşturulan veriler transaction sonunda geri alınır.
+
+Kullanım: python manage.py benchmark_json [--events 100] [--reservations 1000] [--iterations 200]
+"""
+import io
+import time
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from core.parsers import FastJSONParser
+from core.renderers import FastJSONRenderer, orjson
+from events.models import Event, Reservation
+from events.serializers import EventSerializer, ReservationSerializer
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = 'Standart ve orjson tabanlı JSON renderer/parser sınıflarını etkinlik ve rezervasyon yükleriyle karşılaştırır'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--events', type=int, default=100, help='Etkinlik listesi yükündeki etkinlik sayısı')
+        parser.add_argument(
+            '--reservations', type=int, default=1000, help='Rezervasyon listesi yükündeki rezervasyon sayısı'
+        )
+        parser.add_argument('--iterations', type=int, default=200, help='Her ölçüm için tekrar sayısı')
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            self.stdout.write(self.style.WARNING('orjson is not installed; FastJSON classes use the stdlib fallback'))
+        
+        with transaction.atomic():
+            payloads = self._build_payloads(options['events'], options['reservations'])
+            transaction.set_rollback(True)
+        
+        for title, data in payloads:
+            body = JSONRenderer().render(data)
+            if FastJSONRenderer().render(data) != body:
+                self.stdout.write(self.style.WARNING(f'{title}: rendered output differs from JSONRenderer'))
+            
+            self.stdout.write(self.style.SUCCESS(f'{title} ({len(body) / 1024:.1f} KiB)'))
+            for name, render in (('JSONRenderer', JSONRenderer().render), ('FastJSONRenderer', FastJSONRenderer().render)):
+                self._report(f'render {name}', self._time(lambda: render(data), options['iterations']))
+            for name, parser in (('JSONParser', JSONParser()), ('FastJSONParser', FastJSONParser())):
+                self._report(
+                    f'parse  {name}', self._time(lambda: parser.parse(io.BytesIO(body)), options['iterations'])
+                )
+
+    def _build_payloads(self, event_count, reservation_count):
+        prefix = f'bench-{uuid.uuid4().hex[:8]}'
+        user = User.objects.create_user(username=prefix, email=f'{prefix}@example.com', password=None)
+        now = timezone.now()
+        events = Event.objects.bulk_create(
+            Event(
+                name=f'{prefix} event {i}',
+                description='Benchmark event description ' * 4,
+                capacity=reservation_count + 1,
+                start_time=now + timedelta(days=1, minutes=i),
+                end_time=now + timedelta(days=1, hours=3, minutes=i),
+            )
+            for i in range(max(event_count, 1))
+        )
+        Reservation.objects.bulk_create(
+            Reservation(
+                event=events[i % len(events)],
+                user=user,
+                status=Reservation.Status.CONFIRMED,
+                quantity=1,
+            )
+            for i in range(reservation_count)
+        )
+        
+        event_data = EventSerializer(
+            Event.objects.filter(name__startswith=prefix).with_capacity(), many=True
+        ).data
+        reservation_data = ReservationSerializer(
+            Reservation.objects.filter(user=user).select_related('event', 'user'), many=True
+        ).data
+        return [
+            (f'EventSerializer x {len(event_data)}', {'count': len(event_data), 'results': event_data}),
+            (f'ReservationSerializer x {len(reservation_data)}', reservation_data),
+        ]
+
+    def _time(self, func, iterations):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        return (time.perf_counter() - started) / iterations
+
+    def _report(self, title, seconds):
+        self.stdout.write(f'  {title:<24} {seconds * 1000:8.3f} ms')
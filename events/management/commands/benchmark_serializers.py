@@ -0,0 +1,96 @@
+"""
+Liste endpoint'lerinin okuma yollarını karşılaştırmak için Django yönetim komutu.
+
+Geçici etkinlik ve rezervasyonlar oluşturur; aynı sayfayı DRF serializer'ları
+(EventSerializer, ReservationSerializer) ve values() tabanlı hızlı okuma yolu
+(EventValuesSerializer, ReservationValuesSerializer) ile tekrar tekrar okuyup satır/sn raporlar.
+Sorgu ve serileştirme birlikte ölçülür. Oluşturulan veriler transaction sonunda geri alınır.
+
+Kullanım: python manage.py benchmark_serializers [--rows 1000] [--iterations 20]
+"""
+import time
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from events.models import Event, Reservation
+from events.serializers import (
+    EventSerializer,
+    EventValuesSerializer,
+    ReservationSerializer,
+    ReservationValuesSerializer,
+)
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = 'DRF serializer ve values() tabanlı okuma yollarını etkinlik ve rezervasyon listeleriyle karşılaştırır'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1000, help='Listedeki etkinlik ve rezervasyon sayısı')
+        parser.add_argument('--iterations', type=int, default=20, help='Her ölçüm için tekrar sayısı')
+
+    def handle(self, *args, **options):
+        rows, iterations = options['rows'], options['iterations']
+        with transaction.atomic():
+            prefix = f'bench-{uuid.uuid4().hex[:8]}'
+            user = self._create_data(prefix, rows)
+            events = Event.objects.filter(name__startswith=prefix).with_capacity()
+            reservations = Reservation.objects.filter(user=user)
+            
+            cases = [
+                ('Events', [
+                    ('EventSerializer', lambda: EventSerializer(events.all(), many=True).data),
+                    ('EventValuesSerializer', lambda: self._values(EventValuesSerializer(), events)),
+                ]),
+                ('Reservations', [
+                    (
+                        'ReservationSerializer',
+                        lambda: ReservationSerializer(reservations.select_related('event', 'user'), many=True).data
+                    ),
+                    ('ReservationValuesSerializer', lambda: self._values(ReservationValuesSerializer(), reservations)),
+                ]),
+            ]
+            for title, runs in cases:
+                self.stdout.write(self.style.SUCCESS(f'{title} ({rows} rows)'))
+                for name, run in runs:
+                    seconds = self._time(run, iterations)
+                    self.stdout.write(f'  {name:<28} {seconds * 1000:9.2f} ms  {rows / seconds:12,.0f} rows/sec')
+            transaction.set_rollback(True)
+
+    def _create_data(self, prefix, rows):
+        user = User.objects.create_user(username=prefix, email=f'{prefix}@example.com', password=None)
+        now = timezone.now()
+        events = Event.objects.bulk_create(
+            Event(
+                name=f'{prefix} event {i}',
+                description='Benchmark event description',
+                capacity=10,
+                start_time=now + timedelta(days=1, minutes=i),
+                end_time=now + timedelta(days=1, hours=3, minutes=i),
+            )
+            for i in range(rows)
+        )
+        Reservation.objects.bulk_create(
+            Reservation(
+                event=event,
+                user=user,
+                status=Reservation.Status.HOLD,
+                quantity=1,
+                expires_at=now + timedelta(minutes=5),
+            )
+            for event in events
+        )
+        return user
+
+    def _values(self, serializer, queryset):
+        return serializer.to_representation(serializer.values(queryset))
+
+    def _time(self, func, iterations):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            func()
+        return (time.perf_counter() - started) / iterations
@@ -1,9 +1,13 @@
 """
 Süresi dolmuş HOLD rezervasyonları işaretlemek için Django yönetim komutu.
 
+expire_old_hold_reservations görevi ile aynı liderlik kilidini kullanır; başka bir düğüm
+veya görev o anda tarama yapıyorsa komut hiçbir şey yapmadan çıkar.
+
 Kullanım: python manage.py expire_holds
 """
 from django.core.management.base import BaseCommand
+from core.locks import LeaderLease
 from events.services import ReservationService
 
 
@@ -15,7 +19,11 @@ class Command(BaseCommand):
         Süre dolma mantığını çalıştırır.
         Service katmanı metodunu çağırır.
         """
-        expired_count = ReservationService.expire_old_holds()
+        with LeaderLease('expire_old_hold_reservations') as acquired:
+            if not acquired:
+                self.stdout.write('Another node is already expiring holds, skipped')
+                return
+            expired_count = ReservationService.expire_old_holds()
         
         if expired_count > 0:
             self.stdout.write(
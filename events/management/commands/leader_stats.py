@@ -0,0 +1,30 @@
+"""
+Liderlik kilidi ile korunan periyodik işlerin sayaçlarını gösteren Django yönetim komutu.
+
+Her iş için kilidi alan (çalışan), kilit başka düğümde olduğu için atlanan ve iş sürerken
+kilidi kaybeden çalışma sayılarını ve son çalışma zamanını yazar. Sayaçlar önbellekte
+tutulur; CACHE_URL paylaşılan bir Redis'i gösteriyorsa tüm düğümlerin toplamıdır.
+
+Kullanım: python manage.py leader_stats
+"""
+from datetime import datetime, timezone as dt_timezone
+
+from django.core.management.base import BaseCommand
+
+from core.locks import LeaderLease, registered_leases
+
+
+class Command(BaseCommand):
+    help = 'Liderlik kilidi ile korunan periyodik işlerin çalışan/atlanan sayılarını gösterir'
+
+    def handle(self, *args, **options):
+        for name in sorted(registered_leases):
+            stats = LeaderLease.stats(name)
+            last_run = (
+                datetime.fromtimestamp(stats['last_run'], dt_timezone.utc).isoformat()
+                if stats['last_run'] else 'never'
+            )
+            self.stdout.write(
+                f'{name}: acquired={stats["acquired"]} skipped={stats["skipped"]} '
+                f'lost={stats["lost"]} last_run={last_run}'
+            )
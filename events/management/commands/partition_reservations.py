@@ -0,0 +1,45 @@
+"""
+Rezervasyon tablosunu aylık PostgreSQL partition'larına bölmek için Django yönetim komutu.
+
+İlk çalıştırmada `reservations` tablosunu created_at üzerinden RANGE partition'lı bir
+tabloya dönüştürür; sonraki çalıştırmalarda gelecek aylar için partition'ları oluşturur.
+
+Kullanım: python manage.py partition_reservations [--months-ahead 3]
+"""
+from django.core.management.base import BaseCommand
+
+from events import partitioning
+
+
+class Command(BaseCommand):
+    help = 'Rezervasyon tablosunu aylık partition\'lara böler ve gelecek ayların partition\'larını oluşturur'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--months-ahead',
+            type=int,
+            default=3,
+            help='Önceden oluşturulacak gelecek ay sayısı (varsayılan: 3)'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Partitioning yardımcılarını çalıştırır.
+        """
+        if not partitioning.is_supported():
+            self.stdout.write('Partitioning is only supported on PostgreSQL, skipping')
+            return
+        
+        months_ahead = options['months_ahead']
+        if partitioning.convert_to_partitioned(months_ahead=months_ahead):
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f'Converted reservations to a partitioned table '
+                    f'(old table kept as {partitioning.LEGACY_TABLE})'
+                )
+            )
+        
+        partitions = partitioning.ensure_monthly_partitions(months_ahead=months_ahead)
+        self.stdout.write(
+            self.style.SUCCESS(f'{len(partitions)} monthly partition(s) present')
+        )
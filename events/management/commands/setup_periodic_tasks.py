@@ -57,6 +57,119 @@ class Command(BaseCommand):
                 )
             )
         
+        # Envanter kovalarını dengeleme görevi (sadece kovalı etkinlikleri etkiler)
+        _, created = PeriodicTask.objects.update_or_create(
+            name='Rebalance Inventory Buckets',
+            defaults={
+                'task': 'rebalance_inventory_buckets',
+                'interval': schedule,
+                'enabled': True,
+            }
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'{"Created" if created else "Updated"} periodic task: "Rebalance Inventory Buckets"'
+            )
+        )
+        
+        # Öne çıkan etkinlik listesinin önbellekte yeniden derlenmesi
+        _, created = PeriodicTask.objects.update_or_create(
+            name='Build Featured Events',
+            defaults={
+                'task': 'build_featured_events',
+                'interval': schedule,
+                'enabled': True,
+            }
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'{"Created" if created else "Updated"} periodic task: "Build Featured Events"'
+            )
+        )
+        
+        # Outbox mesajlarının iletilmesi (birkaç saniyede bir)
+        every_5_seconds, _ = IntervalSchedule.objects.get_or_create(
+            every=5,
+            period=IntervalSchedule.SECONDS,
+        )
+        _, created = PeriodicTask.objects.update_or_create(
+            name='Relay Outbox',
+            defaults={
+                'task': 'relay_outbox',
+                'interval': every_5_seconds,
+                'enabled': True,
+            }
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'{"Created" if created else "Updated"} periodic task: "Relay Outbox"'
+            )
+        )
+        
+        # İş ortağı webhook teslimleri (outbox ile aynı sıklıkta)
+        _, created = PeriodicTask.objects.update_or_create(
+            name='Deliver Webhooks',
+            defaults={
+                'task': 'deliver_webhooks',
+                'interval': every_5_seconds,
+                'enabled': True,
+            }
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'{"Created" if created else "Updated"} periodic task: "Deliver Webhooks"'
+            )
+        )
+        
+        # Rezervasyon partition bakımı (günde bir, sadece partition'lı kurulumlarda etkili)
+        daily, _ = IntervalSchedule.objects.get_or_create(
+            every=1,
+            period=IntervalSchedule.DAYS,
+        )
+        _, created = PeriodicTask.objects.update_or_create(
+            name='Maintain Reservation Partitions',
+            defaults={
+                'task': 'maintain_reservation_partitions',
+                'interval': daily,
+                'enabled': True,
+            }
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'{"Created" if created else "Updated"} periodic task: "Maintain Reservation Partitions"'
+            )
+        )
+        
+        # Delta senkronizasyon günlüğünün temizlenmesi
+        _, created = PeriodicTask.objects.update_or_create(
+            name='Purge Event Changes',
+            defaults={
+                'task': 'purge_event_changes',
+                'interval': daily,
+                'enabled': True,
+            }
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'{"Created" if created else "Updated"} periodic task: "Purge Event Changes"'
+            )
+        )
+        
+        # Süresi dolmuş refresh token'ların temizlenmesi (OutstandingToken/BlacklistedToken)
+        _, created = PeriodicTask.objects.update_or_create(
+            name='Purge Expired Tokens',
+            defaults={
+                'task': 'purge_expired_tokens',
+                'interval': daily,
+                'enabled': True,
+            }
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'{"Created" if created else "Updated"} periodic task: "Purge Expired Tokens"'
+            )
+        )
+        
         self.stdout.write(
             self.style.SUCCESS(
                 '\n✅ Periodic task setup complete!'
@@ -64,6 +177,13 @@ class Command(BaseCommand):
                 '\n  - Runs every 1 minute to CHECK for expired reservations'
                 '\n  - Only expires reservations where 5 minutes have passed'
                 '\n  - Reservations still within 5-minute window remain as HOLD'
+                '\n  - Inventory buckets of sharded events are rebalanced every 1 minute'
+                '\n  - The featured events list is rebuilt every 1 minute'
+                '\n  - Reservation outbox messages are relayed every 5 seconds'
+                '\n  - Pending partner webhooks are delivered every 5 seconds'
+                '\n  - Upcoming reservation partitions are created daily (PostgreSQL only)'
+                '\n  - Event change log entries past their retention are purged daily'
+                '\n  - Expired refresh tokens are purged daily'
                 '\n\nTo start Celery Beat, run: celery -A reservation_system beat -l info'
             )
         )
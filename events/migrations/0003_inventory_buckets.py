@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='inventory_shards',
+            field=models.PositiveSmallIntegerField(default=0, help_text='Number of inventory buckets the capacity is split into (0 = no sharding)'),
+        ),
+        migrations.CreateModel(
+            name='InventoryBucket',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('index', models.PositiveSmallIntegerField()),
+                ('capacity', models.PositiveIntegerField(default=0)),
+                ('reserved', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='inventory_buckets', to='events.event')),
+            ],
+            options={
+                'db_table': 'inventory_buckets',
+                'ordering': ['event', 'index'],
+            },
+        ),
+        migrations.AddField(
+            model_name='reservation',
+            name='bucket',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='reservations', to='events.inventorybucket'),
+        ),
+        migrations.AddConstraint(
+            model_name='inventorybucket',
+            constraint=models.UniqueConstraint(fields=('event', 'index'), name='uniq_inventory_bucket_event_index'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:53
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_inventory_buckets'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventSalesSummary',
+            fields=[
+                ('event', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='sales_summary', serialize=False, to='events.event')),
+                ('reservation_count', models.PositiveIntegerField(default=0)),
+                ('confirmed_quantity', models.PositiveIntegerField(default=0)),
+                ('cancelled_quantity', models.PositiveIntegerField(default=0)),
+                ('expired_quantity', models.PositiveIntegerField(default=0)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'db_table': 'event_sales_summaries',
+                'ordering': ['-archived_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:56
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Q, Sum
+from django.utils import timezone
+
+
+def backfill_user_summaries(apps, schema_editor):
+    """
+    Mevcut rezervasyonlardan kullanıcı özet satırlarını oluşturur.
+    """
+    Reservation = apps.get_model('events', 'Reservation')
+    EventUserSummary = apps.get_model('events', 'EventUserSummary')
+
+    rows = (
+        Reservation.objects.filter(status__in=['HOLD', 'CONFIRMED'])
+        .values('event_id', 'user_id')
+        .annotate(
+            held=Sum('quantity', filter=Q(status='HOLD', expires_at__gt=timezone.now())),
+            confirmed=Sum('quantity', filter=Q(status='CONFIRMED')),
+        )
+        .order_by()
+    )
+    EventUserSummary.objects.bulk_create(
+        [
+            EventUserSummary(
+                event_id=row['event_id'],
+                user_id=row['user_id'],
+                held_quantity=row['held'] or 0,
+                confirmed_quantity=row['confirmed'] or 0,
+            )
+            for row in rows.iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0004_event_sales_summary'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='max_per_user',
+            field=models.PositiveIntegerField(blank=True, help_text='Maximum quantity a single user can hold or confirm for this event (empty = unlimited)', null=True),
+        ),
+        migrations.CreateModel(
+            name='EventUserSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('held_quantity', models.PositiveIntegerField(default=0)),
+                ('confirmed_quantity', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='user_summaries', to='events.event')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='event_summaries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'event_user_summaries',
+                'constraints': [models.UniqueConstraint(fields=('event', 'user'), name='uniq_event_user_summary')],
+            },
+        ),
+        migrations.RunPython(backfill_user_summaries, migrations.RunPython.noop),
+    ]
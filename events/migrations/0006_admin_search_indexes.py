@@ -0,0 +1,39 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:14
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """
+    Admin aramasındaki `UPPER(name::text) LIKE` sorguları için trigram indeksi (sadece PostgreSQL).
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS events_name_trgm_idx '
+        'ON events USING gin ((UPPER(("name")::text)) gin_trgm_ops)'
+    )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS events_name_trgm_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0005_event_user_summary'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['created_at'], name='reservations_created_at_idx'),
+        ),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:18
+
+import django.contrib.postgres.search
+from django.conf import settings
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations
+
+
+def create_search_indexes(apps, schema_editor):
+    """
+    Arama vektörü için GIN indeksi ve ad üzerinde trigram benzerliği indeksi oluşturur,
+    mevcut etkinliklerin arama vektörlerini doldurur (sadece PostgreSQL).
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS events_search_vector_idx ON events USING gin ("search_vector")'
+    )
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS events_name_similarity_idx ON events USING gin ("name" gin_trgm_ops)'
+    )
+    Event = apps.get_model('events', 'Event')
+    Event.objects.using(schema_editor.connection.alias).update(
+        search_vector=(
+            SearchVector('name', weight='A', config=settings.EVENT_SEARCH_CONFIG)
+            + SearchVector('description', weight='B', config=settings.EVENT_SEARCH_CONFIG)
+        )
+    )
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS events_search_vector_idx')
+    schema_editor.execute('DROP INDEX IF EXISTS events_name_similarity_idx')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0006_admin_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
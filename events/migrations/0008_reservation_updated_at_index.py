@@ -0,0 +1,19 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0007_event_search'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='reservation',
+            index=models.Index(fields=['updated_at'], name='reservations_updated_at_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:43
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0008_reservation_updated_at_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_id', models.BigIntegerField()),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'db_table': 'event_changes',
+            },
+        ),
+    ]
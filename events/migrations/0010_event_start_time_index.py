@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0009_event_changes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['start_time'], name='events_start_time_idx'),
+        ),
+    ]
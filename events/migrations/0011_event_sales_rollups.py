@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0010_event_start_time_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventSalesRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('minute', models.DateTimeField()),
+                ('shard', models.PositiveSmallIntegerField(default=0)),
+                ('held', models.PositiveIntegerField(default=0)),
+                ('confirmed', models.PositiveIntegerField(default=0)),
+                ('cancelled', models.PositiveIntegerField(default=0)),
+                ('expired', models.PositiveIntegerField(default=0)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sales_rollups', to='events.event')),
+            ],
+            options={
+                'db_table': 'event_sales_rollups',
+                'indexes': [models.Index(fields=['minute'], name='event_sales_rollups_minute_idx')],
+                'constraints': [models.UniqueConstraint(fields=('event', 'minute', 'shard'), name='uniq_event_sales_rollup')],
+            },
+        ),
+    ]
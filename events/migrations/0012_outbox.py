@@ -0,0 +1,38 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:56
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0011_event_sales_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxPartition',
+            fields=[
+                ('number', models.PositiveSmallIntegerField(primary_key=True, serialize=False)),
+            ],
+            options={
+                'db_table': 'outbox_partitions',
+            },
+        ),
+        migrations.CreateModel(
+            name='OutboxMessage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('partition', models.PositiveSmallIntegerField()),
+                ('topic', models.CharField(max_length=64)),
+                ('key', models.BigIntegerField()),
+                ('payload', models.JSONField()),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'db_table': 'outbox_messages',
+                'indexes': [models.Index(fields=['partition', 'id'], name='outbox_partition_id_idx')],
+            },
+        ),
+    ]
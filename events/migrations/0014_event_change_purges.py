@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 00:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0013_webhooks'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventChangePurge',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('max_purged_id', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'event_change_purges',
+            },
+        ),
+    ]
@@ -1,10 +1,180 @@
-from django.db import models
-from django.db.models import Sum
+import random
+from typing import Dict, Iterable, List, Optional
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, SearchVectorField, TrigramSimilarity
+from django.db import connections, models, router
+from django.db.models import Case, Count, F, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce, NullIf, TruncDate
+from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
 from django.utils import timezone
 from users.models import User
 
 
+class CapacitySnapshot:
+    """
+    Bir etkinliğin belirli bir andaki kapasite durumu (değiştirilemez).
+    
+    held: Süresi dolmamış HOLD miktarı
+    confirmed: CONFIRMED miktarı
+    available: Kalan kapasite
+    as_of: Değerlerin hesaplandığı an
+    """
+    __slots__ = ('held', 'confirmed', 'available', 'as_of')
+
+    def __init__(self, held: int, confirmed: int, available: int, as_of):
+        object.__setattr__(self, 'held', held)
+        object.__setattr__(self, 'confirmed', confirmed)
+        object.__setattr__(self, 'available', available)
+        object.__setattr__(self, 'as_of', as_of)
+
+    @classmethod
+    def from_values(cls, capacity: int, end_time, inventory_shards: int, held_quantity, confirmed_quantity,
+                    bucket_free, archived_confirmed, capacity_as_of) -> 'CapacitySnapshot':
+        """
+        Etkinlik alanlarından ve with_capacity() anotasyonlarından anlık görüntü oluşturur.
+        Model örneği olmadan values() satırlarından da kullanılabilir.
+        """
+        confirmed = confirmed_quantity or 0
+        if not confirmed and archived_confirmed is not None and end_time < capacity_as_of:
+            # Arşivlenmiş etkinliklerin rezervasyonları canlı tablodan çıkarılmış olabilir
+            confirmed = archived_confirmed
+        held = held_quantity or 0
+        if inventory_shards and bucket_free is not None:
+            available = bucket_free
+        else:
+            available = capacity - (held + confirmed)
+        return cls(held, confirmed, available, capacity_as_of)
+
+    def __setattr__(self, name, value):
+        raise AttributeError('CapacitySnapshot is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError('CapacitySnapshot is immutable')
+
+    def __repr__(self) -> str:
+        return (
+            f"CapacitySnapshot(held={self.held}, confirmed={self.confirmed}, "
+            f"available={self.available}, as_of={self.as_of.isoformat()})"
+        )
+
+
+def event_search_vector() -> SearchVector:
+    """Etkinlik arama vektörü: ad ağırlık A, açıklama ağırlık B."""
+    return (
+        SearchVector('name', weight='A', config=settings.EVENT_SEARCH_CONFIG)
+        + SearchVector('description', weight='B', config=settings.EVENT_SEARCH_CONFIG)
+    )
+
+
+# EventQuerySet.with_capacity() tarafından eklenen alanlar
+CAPACITY_ANNOTATIONS = ('held_quantity', 'confirmed_quantity', 'bucket_free', 'archived_confirmed', 'capacity_as_of')
+
+
+def reserved_quantity(**filters) -> Subquery:
+    """Dış sorgudaki etkinliğin (OuterRef('pk')) koşullara uyan rezervasyon miktarı toplamı; yoksa NULL."""
+    return Subquery(
+        Reservation.objects.filter(event=OuterRef('pk'), **filters).order_by().values('event').annotate(
+            total=Sum('quantity')
+        ).values('total')
+    )
+
+
+class EventQuerySet(models.QuerySet):
+    """
+    Event sorguları için özel QuerySet.
+    """
+
+    def _is_postgresql(self) -> bool:
+        return connections[self.db].vendor == 'postgresql'
+
+    def search(self, query: str):
+        """
+        Etkinlikleri ad ve açıklamaya göre arar.
+        
+        PostgreSQL'de `search_vector` (GIN indeksli) tam metin araması ile ad üzerinde trigram
+        benzerliği (yazım hataları için) birleştirilir ve sonuçlar sıralanır.
+        Diğer veritabanlarında (testlerde SQLite) icontains aramasına düşülür.
+        """
+        if not self._is_postgresql():
+            return self.filter(Q(name__icontains=query) | Q(description__icontains=query))
+        
+        search_query = SearchQuery(query, search_type='websearch', config=settings.EVENT_SEARCH_CONFIG)
+        return self.filter(
+            Q(search_vector=search_query) | Q(name__trigram_similar=query)
+        ).annotate(
+            search_rank=SearchRank(F('search_vector'), search_query),
+            search_similarity=TrigramSimilarity('name', query),
+        ).order_by('-search_rank', '-search_similarity', 'start_time')
+
+    def update_search_vector(self) -> int:
+        """
+        Seçilen etkinliklerin `search_vector` alanını ad (A) ve açıklamadan (B) yeniden oluşturur.
+        Sadece PostgreSQL'de çalışır.
+        """
+        if not self._is_postgresql():
+            return 0
+        return self.update(search_vector=event_search_vector())
+
+    def with_capacity(self, now=None):
+        """
+        Her etkinliğe HOLD/CONFIRMED miktarlarını etkinlik başına koşullu alt sorgularla ekler.
+        
+        Rezervasyonlar JOIN edilmez ve GROUP BY yapılmaz: alt sorgular sadece dönen satırlar için
+        (sayfalamada sayfadaki etkinlikler) çalışır, sayfalamanın COUNT sorgusu rezervasyonlara
+        hiç gitmez. Kovalı etkinliklerin boş kapasitesi ve arşiv özetleri de alt sorgu olarak eklenir.
+        Event.capacity_snapshot() bu anotasyonları kullanır.
+        """
+        now = now or timezone.now()
+        bucket_free = InventoryBucket.objects.filter(event=OuterRef('pk')).order_by().values('event').annotate(
+            total=Sum(F('capacity') - F('reserved'))
+        ).values('total')
+        archived_confirmed = EventSalesSummary.objects.filter(event=OuterRef('pk')).order_by().values('confirmed_quantity')
+        return self.annotate(
+            held_quantity=Coalesce(reserved_quantity(status='HOLD', expires_at__gt=now), Value(0)),
+            confirmed_quantity=Coalesce(reserved_quantity(status='CONFIRMED'), Value(0)),
+            bucket_free=Subquery(bucket_free),
+            archived_confirmed=Subquery(archived_confirmed),
+            capacity_as_of=Value(now, output_field=models.DateTimeField()),
+        )
+
+    def daily_availability(self, now=None):
+        """
+        Etkinlikleri başlangıç gününe (geçerli saat dilimi) göre gruplayıp gün başına
+        etkinlik sayısı, toplam kapasite ve toplam kalan kapasiteyi tek sorguda döndürür.
+        
+        Rezervasyon toplamları etkinlik başına koşullu alt sorgularla hesaplanır; rezervasyonlar
+        JOIN edilmediği için kapasite toplamı satır çoğalmasından etkilenmez. Kalan kapasite
+        Event.capacity_snapshot() ile aynı kurallarla (kovalar, arşiv özetleri) hesaplanır ve
+        her alt sorgu ifadede bir kez geçer.
+        
+        Returns:
+            {'day', 'events', 'capacity', 'available'} sözlükleri döndüren values() queryset'i
+        """
+        now = now or timezone.now()
+        bucket_free = InventoryBucket.objects.filter(event=OuterRef('pk')).order_by().values('event').annotate(
+            total=Sum(F('capacity') - F('reserved'))
+        ).values('total')
+        archived_confirmed = EventSalesSummary.objects.filter(event=OuterRef('pk')).order_by().values('confirmed_quantity')
+        # Canlı CONFIRMED toplamı yoksa arşiv özeti kullanılır (özetler sadece bitmiş etkinlikler için vardır)
+        confirmed = Coalesce(
+            NullIf(reserved_quantity(status='CONFIRMED'), Value(0)), Subquery(archived_confirmed), Value(0)
+        )
+        available = Coalesce(
+            Case(When(inventory_shards__gt=0, then=Subquery(bucket_free))),
+            F('capacity') - Coalesce(reserved_quantity(status='HOLD', expires_at__gt=now), Value(0)) - confirmed,
+            output_field=models.IntegerField(),
+        )
+        return self.annotate(
+            day=TruncDate('start_time'),
+        ).order_by().values('day').annotate(
+            # `available` önce çözülmeli: içindeki F('capacity') aşağıdaki `capacity` toplamını değil sütunu göstermeli
+            available=Sum(available),
+            events=Count('id'),
+            capacity=Sum('capacity'),
+        ).order_by('day')
+
+
 class Event(models.Model):
     """
     Rezervasyon yapılabilen etkinlik modeli.
@@ -15,36 +185,82 @@ class Event(models.Model):
     start_time = models.DateTimeField()
     end_time = models.DateTimeField()
     is_active = models.BooleanField(default=True, help_text='Whether the event is active and can accept reservations')
+    max_per_user = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        help_text='Maximum quantity a single user can hold or confirm for this event (empty = unlimited)'
+    )
+    inventory_shards = models.PositiveSmallIntegerField(
+        default=0,
+        help_text='Number of inventory buckets the capacity is split into (0 = no sharding)'
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
+    # Tam metin arama vektörü (sadece PostgreSQL'de doldurulur, bkz. save())
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    objects = EventQuerySet.as_manager()
+
+    # Arama vektörünü etkileyen alanlar
+    SEARCH_FIELDS = ('name', 'description')
 
     class Meta:
         db_table = 'events'
         ordering = ['start_time']
+        indexes = [
+            # Varsayılan sıralama, tarih filtreleri ve takvim özetleri için
+            models.Index(fields=['start_time'], name='events_start_time_idx'),
+        ]
 
     def __str__(self) -> str:
         return self.name
 
+    def save(self, *args, **kwargs):
+        """
+        Etkinliği kaydeder; ad veya açıklama yazıldıysa arama vektörünü günceller.
+        """
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or set(update_fields) & set(self.SEARCH_FIELDS):
+            Event.objects.filter(pk=self.pk).update_search_vector()
+
+    def capacity_snapshot(self, refresh: bool = False) -> 'CapacitySnapshot':
+        """
+        HOLD, CONFIRMED ve kalan kapasiteyi aynı andaki tek bir sorgudan döndürür.
+        
+        Sonuç örnek üzerinde saklanır; aynı istek içindeki tekrar çağrılar sorgu atmaz.
+        Queryset `with_capacity()` ile alındıysa anotasyonlar kullanılır, sorgu atılmaz.
+        Kapasite kontrolü yapan servisler kilit altında `refresh=True` ile çağırmalıdır.
+        """
+        snapshot = getattr(self, '_capacity_snapshot', None)
+        if snapshot is not None and not refresh:
+            return snapshot
+        
+        if refresh or not hasattr(self, 'held_quantity'):
+            now = timezone.now()
+            row = Event.objects.filter(pk=self.pk).with_capacity(now).values(*CAPACITY_ANNOTATIONS).first()
+            for name in CAPACITY_ANNOTATIONS:
+                setattr(self, name, row[name] if row else None)
+        
+        self._capacity_snapshot = CapacitySnapshot.from_values(
+            self.capacity, self.end_time, self.inventory_shards,
+            **{name: getattr(self, name) for name in CAPACITY_ANNOTATIONS}
+        )
+        return self._capacity_snapshot
+
     def get_hold_count(self) -> int:
         """
         Aktif HOLD rezervasyonların toplam miktarını döndürür (süresi dolmamış).
         Rezervasyon sayısı değil, miktar toplamı döner.
         """
-        active_holds_quantity = self.reservations.filter(
-            status='HOLD',
-            expires_at__gt=timezone.now()
-        ).aggregate(total=Sum('quantity'))['total'] or 0
-        return active_holds_quantity
+        return self.capacity_snapshot(refresh=True).held
 
     def get_confirmed_count(self) -> int:
         """
         CONFIRMED rezervasyonların toplam miktarını döndürür.
         Rezervasyon sayısı değil, miktar toplamı döner.
         """
-        confirmed_quantity = self.reservations.filter(
-            status='CONFIRMED'
-        ).aggregate(total=Sum('quantity'))['total'] or 0
-        return confirmed_quantity
+        return self.capacity_snapshot(refresh=True).confirmed
 
     def get_available_capacity(self) -> int:
         """
@@ -52,10 +268,118 @@ class Event(models.Model):
         Transaction içinde select_for_update() ile kullanılmalıdır.
         
         Önemli: Rezervasyon sayısı değil, miktar toplamı hesaplanır.
+        Envanter kovalarına bölünmüş etkinliklerde kovaların boş kapasitesi toplanır.
         """
-        active_holds_quantity = self.get_hold_count()
-        confirmed_quantity = self.get_confirmed_count()
-        return self.capacity - (active_holds_quantity + confirmed_quantity)
+        return self.capacity_snapshot(refresh=True).available
+
+
+class InventoryBucket(models.Model):
+    """
+    Çok yoğun etkinlikler için kapasitenin bölündüğü envanter kovası.
+
+    HOLD işlemleri tek bir event satırını kilitlemek yerine rastgele bir kovayı
+    SKIP LOCKED ile kilitler. `reserved` alanı kovadaki HOLD + CONFIRMED miktar toplamıdır.
+    """
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='inventory_buckets')
+    index = models.PositiveSmallIntegerField()
+    capacity = models.PositiveIntegerField(default=0)
+    reserved = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'inventory_buckets'
+        ordering = ['event', 'index']
+        constraints = [
+            models.UniqueConstraint(fields=['event', 'index'], name='uniq_inventory_bucket_event_index'),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.event_id}#{self.index} ({self.reserved}/{self.capacity})"
+
+    @property
+    def free(self) -> int:
+        """Kovada kalan boş kapasite."""
+        return max(self.capacity - self.reserved, 0)
+
+
+class ReservationQuerySet(models.QuerySet):
+    """
+    Reservation sorguları için özel QuerySet.
+    """
+
+    def _transition_values(self, to_status: str, from_statuses: Iterable[str], values: dict) -> dict:
+        """
+        Geçişi Reservation.TRANSITIONS tablosuna göre doğrular ve yazılacak alanları döndürür.
+        Sadece status, expires_at ve updated_at yazılabilir.
+        """
+        for from_status in from_statuses:
+            self.model.check_transition(from_status, to_status)
+        unknown = set(values) - set(self.model.TRANSITION_FIELDS)
+        if unknown:
+            raise ValueError(f"Transitions can only write {self.model.TRANSITION_FIELDS}, got {sorted(unknown)}")
+        return {'status': to_status, 'updated_at': timezone.now(), **values}
+
+    def transition(self, to_status: str, from_statuses: Iterable[str], returning_previous: bool = False,
+                   **values) -> List['Reservation']:
+        """
+        Filtrelenmiş rezervasyonları tek bir koşullu UPDATE ... RETURNING ile yeni duruma geçirir.
+        
+        Satır kilitlenmez ve event satırı kilitlenmez; geçiş yalnızca rezervasyon hala
+        `from_statuses` durumlarından birindeyse uygulanır. Böylece eşzamanlı bir onay,
+        iptal veya süre dolma işlemi diğerinin sonucunu ezemez (lost update olmaz).
+        
+        returning_previous=True ise satırlar aynı UPDATE'in CTE'sinde kilitlenip
+        (FOR UPDATE) okunur ve her rezervasyonun geçişten önceki durumu `previous_status`
+        olarak döner; birden çok kaynak durum için ayrı UPDATE gerekmez.
+        
+        Args:
+            to_status: Yeni durum
+            from_statuses: Geçişe izin verilen mevcut durumlar
+            returning_previous: Geçişten önceki durumu da döndür
+            **values: Durumla birlikte yazılacak ek alanlar (sadece expires_at)
+            
+        Returns:
+            Geçişi uygulanan rezervasyonların güncel halleri (koşul sağlanmadıysa boş liste)
+            
+        Raises:
+            ValidationError: Geçiş Reservation.TRANSITIONS tablosunda yoksa
+        """
+        from_statuses = list(from_statuses)
+        values = self._transition_values(to_status, from_statuses, values)
+        using = self._db or router.db_for_write(self.model, **self._hints)
+        connection = connections[using]
+        opts = self.model._meta
+        quote_name = connection.ops.quote_name
+        
+        query = self.filter(status__in=from_statuses).query
+        if any(count for alias, count in query.alias_refcount.items() if alias != opts.db_table):
+            raise ValueError('transition() only supports filters on reservation columns.')
+        where_sql, where_params = query.get_compiler(using).compile(query.where)
+        
+        set_sql = []
+        set_params = []
+        for name, value in values.items():
+            field = opts.get_field(name)
+            set_sql.append(f'{quote_name(field.column)} = %s')
+            set_params.append(field.get_db_prep_save(value, connection))
+        
+        table = quote_name(opts.db_table)
+        returning = ', '.join(f'{table}.{quote_name(field.column)}' for field in opts.concrete_fields)
+        if returning_previous:
+            pk = quote_name(opts.pk.column)
+            status = quote_name(opts.get_field('status').column)
+            lock = ' FOR UPDATE' if connection.features.has_select_for_update else ''
+            # SQLite'ta RETURNING FROM tablolarına başvuramaz; önceki durum CTE'den alt sorguyla okunur
+            sql = (
+                f'WITH previous AS MATERIALIZED (SELECT {pk}, {status} FROM {table} WHERE {where_sql}{lock}) '
+                f'UPDATE {table} SET {", ".join(set_sql)} FROM previous '
+                f'WHERE {table}.{pk} = previous.{pk} '
+                f'RETURNING {returning}, '
+                f'(SELECT p.{status} FROM previous p WHERE p.{pk} = {table}.{pk}) AS previous_status'
+            )
+            return list(self.raw(sql, [*where_params, *set_params], using=using))
+        sql = f'UPDATE {table} SET {", ".join(set_sql)} WHERE {where_sql} RETURNING {returning}'
+        return list(self.raw(sql, [*set_params, *where_params], using=using))
 
 
 class Reservation(models.Model):
@@ -68,18 +392,391 @@ class Reservation(models.Model):
         CANCELLED = 'CANCELLED', 'Cancelled'
         EXPIRED = 'EXPIRED', 'Expired'
 
+    # İzin verilen durum geçişleri (kaynak -> hedefler)
+    TRANSITIONS = {
+        Status.HOLD: (Status.CONFIRMED, Status.CANCELLED, Status.EXPIRED),
+        Status.CONFIRMED: (Status.CANCELLED,),
+    }
+    # Durum geçişlerinde yazılan tek alanlar
+    TRANSITION_FIELDS = ('status', 'expires_at', 'updated_at')
+
     event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='reservations')
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='reservations')
+    bucket = models.ForeignKey(
+        InventoryBucket, on_delete=models.SET_NULL, null=True, blank=True, related_name='reservations'
+    )  # Sadece envanter kovası kullanan etkinlikler için
     status = models.CharField(max_length=20, choices=Status.choices, default=Status.HOLD)
     quantity = models.PositiveIntegerField(validators=[MinValueValidator(1)], default=1)
     expires_at = models.DateTimeField(null=True, blank=True)  # HOLD durumu için
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ReservationQuerySet.as_manager()
+
     class Meta:
         db_table = 'reservations'
         ordering = ['-created_at']
+        indexes = [
+            # Varsayılan sıralama ve admin tarih filtreleri için
+            models.Index(fields=['created_at'], name='reservations_created_at_idx'),
+            # Öne çıkan etkinlik listesinin artımlı derlemesi (son değişen rezervasyonlar) için
+            models.Index(fields=['updated_at'], name='reservations_updated_at_idx'),
+        ]
 
     def __str__(self) -> str:
         return f"{self.user.username} - {self.event.name} ({self.status})"
 
+    @classmethod
+    def check_transition(cls, from_status: str, to_status: str) -> None:
+        """
+        Durum geçişinin izinli olup olmadığını kontrol eder.
+        
+        Raises:
+            ValidationError: Geçiş TRANSITIONS tablosunda yoksa
+        """
+        if to_status not in cls.TRANSITIONS.get(from_status, ()):
+            raise ValidationError(f"Invalid status transition: {from_status} -> {to_status}")
+
+    @classmethod
+    def sources_for(cls, to_status: str) -> List[str]:
+        """
+        Verilen hedef duruma geçişe izin veren kaynak durumları döndürür.
+        """
+        return [source for source, targets in cls.TRANSITIONS.items() if to_status in targets]
+
+    def transition_to(self, to_status: str, conditions: Optional[Q] = None, **values) -> bool:
+        """
+        Rezervasyonu yeni duruma geçirir.
+        
+        Geçiş TRANSITIONS tablosuna göre doğrulanır ve sadece status, expires_at ve
+        updated_at alanları, rezervasyon hala mevcut durumundaysa yazılır. Diğer
+        sütunlar (quantity, event, user) asla yeniden yazılmaz.
+        
+        Args:
+            to_status: Yeni durum
+            conditions: UPDATE'in WHERE koşuluna eklenecek ek koşullar (örn. süresi dolmamış olma)
+            **values: Ek olarak yazılacak alanlar (sadece expires_at)
+            
+        Returns:
+            Geçiş uygulandıysa True, durum bu arada değiştiyse veya koşullar sağlanmadıysa False
+        """
+        queryset = type(self).objects.filter(pk=self.pk)
+        if self.created_at is not None:
+            # Partition'lı tabloda (bkz. events/partitioning.py) UPDATE tek partition'a iner
+            queryset = queryset.filter(created_at=self.created_at)
+        if conditions is not None:
+            queryset = queryset.filter(conditions)
+        updated = queryset.transition(to_status, [self.status], **values)
+        if not updated:
+            return False
+        for name in self.TRANSITION_FIELDS:
+            setattr(self, name, getattr(updated[0], name))
+        return True
+
+
+
+class EventUserSummary(models.Model):
+    """
+    Kullanıcının bir etkinlikteki HOLD ve CONFIRMED miktarlarının özet satırı.
+    
+    ReservationService'teki her durum geçişiyle güncellenir; kullanıcı başına
+    limit kontrolü rezervasyonlar üzerinde SUM yerine tek bir satır okumasıyla yapılır.
+    """
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='user_summaries')
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='event_summaries')
+    held_quantity = models.PositiveIntegerField(default=0)
+    confirmed_quantity = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        db_table = 'event_user_summaries'
+        constraints = [
+            models.UniqueConstraint(fields=['event', 'user'], name='uniq_event_user_summary'),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.event_id}/{self.user_id} (held={self.held_quantity}, confirmed={self.confirmed_quantity})"
+
+    @property
+    def total_quantity(self) -> int:
+        """Kullanıcının etkinlikte tuttuğu toplam miktar."""
+        return self.held_quantity + self.confirmed_quantity
+
+
+class EventSalesSummary(models.Model):
+    """
+    Bitmiş ve arşivlenmiş etkinliklerin sıkıştırılmış son rezervasyon sayıları.
+    
+    Arşivlenen rezervasyon satırları silindikten veya partition'ları ayrıldıktan
+    sonra etkinliğin sonuçları bu tablodan okunur.
+    """
+    event = models.OneToOneField(Event, on_delete=models.CASCADE, primary_key=True, related_name='sales_summary')
+    reservation_count = models.PositiveIntegerField(default=0)
+    confirmed_quantity = models.PositiveIntegerField(default=0)
+    cancelled_quantity = models.PositiveIntegerField(default=0)
+    expired_quantity = models.PositiveIntegerField(default=0)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'event_sales_summaries'
+        ordering = ['-archived_at']
+
+    def __str__(self) -> str:
+        return f"{self.event_id} ({self.confirmed_quantity} confirmed)"
+
+
+class EventChange(models.Model):
+    """
+    Etkinlik değişiklik günlüğü; `GET /api/events/changes/?since=` delta senkronizasyonunu besler.
+    
+    Etkinlik meta verisi (kayıt/silme) veya rezervasyon durumu değiştiğinde aynı transaction
+    içinde bir satır eklenir; artan birincil anahtar istemcinin cursor'ıdır. Tek bir sayaç satırı
+    güncellenmediği için eşzamanlı rezervasyonlar birbirini beklemez. Eski satırlar
+    purge_event_changes görevi ile silinir.
+    """
+    # FK değil: silinen etkinliklerin kayıtları da günlükte kalır
+    event_id = models.BigIntegerField()
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'event_changes'
+
+    def __str__(self) -> str:
+        return f"#{self.id} event={self.event_id}"
+
+    @classmethod
+    def record(cls, event_ids: Iterable[int]) -> None:
+        """Verilen etkinlikler için değişiklik kaydı ekler (tekrarlar bir kez yazılır)."""
+        now = timezone.now()
+        cls.objects.bulk_create([cls(event_id=event_id, created_at=now) for event_id in sorted(set(event_ids))])
+
+
+class EventChangePurge(models.Model):
+    """
+    Değişiklik günlüğünden silinen kayıtların sınırı (tek satır, pk=1).
+    
+    EventChangeService.purge() sildiği en büyük ID'yi yazar; changes_since() sadece bu sınırın
+    altındaki cursor'ları süresi dolmuş sayar. Geri alınan transaction'ların sequence'te
+    bıraktığı ID boşlukları böylece silinmiş kayıt sanılmaz.
+    """
+    max_purged_id = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = 'event_change_purges'
+
+    def __str__(self) -> str:
+        return f"purged through #{self.max_purged_id}"
+
+    @classmethod
+    def boundary(cls) -> int:
+        """Silinmiş en büyük EventChange ID'si (henüz silme yapılmadıysa 0)."""
+        return cls.objects.filter(pk=1).values_list('max_purged_id', flat=True).first() or 0
+
+
+class EventSalesRollup(models.Model):
+    """
+    Etkinlik başına dakikalık satış sayaçları (HOLD, onay, iptal ve süre dolma miktarları).
+    
+    ReservationService geçişleri aynı transaction içinde sayaçları artırır; satış hızı
+    grafikleri rezervasyon tablosu taranmadan bu tablodan okunur. Satış açılışında aynı
+    dakikadaki eşzamanlı geçişler tek satırda beklememesi için her (etkinlik, dakika)
+    EVENT_SALES_ROLLUP_SHARDS parçaya bölünür; okumalar parçaları toplar.
+    """
+    COUNTERS = ('held', 'confirmed', 'cancelled', 'expired')
+
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name='sales_rollups')
+    minute = models.DateTimeField()  # Dakika başına yuvarlanmış zaman
+    shard = models.PositiveSmallIntegerField(default=0)
+    held = models.PositiveIntegerField(default=0)
+    confirmed = models.PositiveIntegerField(default=0)
+    cancelled = models.PositiveIntegerField(default=0)
+    expired = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = 'event_sales_rollups'
+        constraints = [
+            models.UniqueConstraint(fields=['event', 'minute', 'shard'], name='uniq_event_sales_rollup'),
+        ]
+        indexes = [
+            # Tüm etkinliklerin bir zaman aralığındaki toplamları için
+            models.Index(fields=['minute'], name='event_sales_rollups_minute_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.event_id}@{self.minute:%Y-%m-%d %H:%M}#{self.shard}"
+
+    @classmethod
+    def record(cls, counters: Dict[int, Dict[str, int]]) -> None:
+        """
+        Etkinliklerin geçerli dakikadaki sayaçlarını tek bir INSERT ... ON CONFLICT DO UPDATE ile artırır.
+        
+        Args:
+            counters: {event_id: {'held': 3, 'expired': 1}} biçiminde artışlar
+        """
+        rows = [
+            (event_id, [values.get(name, 0) for name in cls.COUNTERS])
+            for event_id, values in sorted(counters.items())
+            if any(values.values())
+        ]
+        if not rows:
+            return
+        
+        connection = connections[router.db_for_write(cls)]
+        opts = cls._meta
+        quote_name = connection.ops.quote_name
+        minute = opts.get_field('minute').get_db_prep_save(
+            timezone.now().replace(second=0, microsecond=0), connection
+        )
+        shard = random.randrange(max(settings.EVENT_SALES_ROLLUP_SHARDS, 1))
+        
+        table = quote_name(opts.db_table)
+        columns = ['event_id', 'minute', 'shard', *cls.COUNTERS]
+        placeholders = ', '.join(['(' + ', '.join(['%s'] * len(columns)) + ')'] * len(rows))
+        updates = ', '.join(
+            f'{quote_name(name)} = {table}.{quote_name(name)} + EXCLUDED.{quote_name(name)}'
+            for name in cls.COUNTERS
+        )
+        sql = (
+            f'INSERT INTO {table} ({", ".join(quote_name(column) for column in columns)}) '
+            f'VALUES {placeholders} '
+            f'ON CONFLICT ({quote_name("event_id")}, {quote_name("minute")}, {quote_name("shard")}) '
+            f'DO UPDATE SET {updates}'
+        )
+        params = [value for event_id, values in rows for value in (event_id, minute, shard, *values)]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+
+
+class OutboxMessage(models.Model):
+    """
+    Rezervasyon durum değişikliklerinin dış tüketicilere (bildirim, analitik, önbellek
+    temizleme) iletilmeyi bekleyen mesajları (transactional outbox).
+    
+    Geçişle aynı transaction içinde yazılır; geçiş geri alınırsa mesaj da yazılmaz.
+    relay_outbox görevi mesajları partition sırasıyla OUTBOX_SINKS hedeflerine iletir ve siler
+    (bkz. OutboxRelayService). Aynı etkinliğin mesajları hep aynı partition'a düşer.
+    """
+    partition = models.PositiveSmallIntegerField()
+    topic = models.CharField(max_length=64)
+    key = models.BigIntegerField()  # Sıralama anahtarı (etkinlik ID'si)
+    payload = models.JSONField()
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        db_table = 'outbox_messages'
+        indexes = [
+            models.Index(fields=['partition', 'id'], name='outbox_partition_id_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f"#{self.id} {self.topic} key={self.key}"
+
+    @staticmethod
+    def partition_for(key: int) -> int:
+        return key % max(settings.OUTBOX_PARTITIONS, 1)
+
+    @classmethod
+    def add_reservations(cls, reservations: Iterable['Reservation']) -> None:
+        """Rezervasyonların güncel durumları için 'reservation.<durum>' mesajları ekler."""
+        now = timezone.now()
+        cls.objects.bulk_create([
+            cls(
+                partition=cls.partition_for(reservation.event_id),
+                topic=f'reservation.{reservation.status.lower()}',
+                key=reservation.event_id,
+                payload={
+                    'reservation_id': reservation.id,
+                    'event_id': reservation.event_id,
+                    'user_id': reservation.user_id,
+                    'quantity': reservation.quantity,
+                    'status': reservation.status,
+                },
+                created_at=now,
+            )
+            for reservation in reservations
+        ])
+
+
+class OutboxPartition(models.Model):
+    """
+    Outbox partition'larının kilit satırları.
+    
+    Relay bir partition'ı işlemeden önce satırını SKIP LOCKED ile kilitler; böylece aynı anda
+    çalışan relay'ler farklı partition'ları işler ve bir etkinliğin mesajları sırayla iletilir.
+    """
+    number = models.PositiveSmallIntegerField(primary_key=True)
+
+    class Meta:
+        db_table = 'outbox_partitions'
+
+    def __str__(self) -> str:
+        return f"outbox partition {self.number}"
+
+
+class WebhookSubscription(models.Model):
+    """
+    Bir iş ortağının rezervasyon olayları için webhook aboneliği.
+    
+    Eşleşen outbox mesajları için WebhookDelivery satırları oluşturulur (bkz. events/webhooks.py).
+    İstek gövdeleri `secret` ile HMAC-SHA256 olarak imzalanır.
+    """
+    TOPICS = ('reservation.confirmed', 'reservation.cancelled')
+
+    owner = models.ForeignKey(User, on_delete=models.CASCADE, related_name='webhook_subscriptions')
+    url = models.URLField(max_length=500)
+    secret = models.CharField(max_length=128)
+    topics = models.JSONField(default=list)  # Boşsa TOPICS içindeki tüm olaylar
+    event = models.ForeignKey(
+        Event, on_delete=models.CASCADE, null=True, blank=True, related_name='webhook_subscriptions'
+    )  # Boşsa tüm etkinlikler
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'webhook_subscriptions'
+
+    def __str__(self) -> str:
+        return f"{self.owner_id} -> {self.url}"
+
+    def matches(self, topic: str, event_id: int) -> bool:
+        """Aboneliğin verilen olayı alıp almayacağını döndürür."""
+        if topic not in (self.topics or self.TOPICS):
+            return False
+        return self.event_id is None or self.event_id == event_id
+
+
+class WebhookDelivery(models.Model):
+    """
+    Bir outbox mesajının bir aboneliğe teslimi.
+    
+    (subscription, message_id) tekildir; relay aynı mesajı tekrar iletse bile tek teslim oluşur.
+    Başarısız teslimler artan aralıklarla WEBHOOK_MAX_ATTEMPTS kez denenir.
+    """
+    class Status(models.TextChoices):
+        PENDING = 'PENDING', 'Pending'
+        DELIVERED = 'DELIVERED', 'Delivered'
+        FAILED = 'FAILED', 'Failed'
+
+    subscription = models.ForeignKey(WebhookSubscription, on_delete=models.CASCADE, related_name='deliveries')
+    message_id = models.BigIntegerField()  # OutboxMessage ID'si (alıcı için tekrar anahtarı)
+    topic = models.CharField(max_length=64)
+    payload = models.JSONField()
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.CharField(max_length=255, blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    delivered_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'webhook_deliveries'
+        constraints = [
+            models.UniqueConstraint(fields=['subscription', 'message_id'], name='uniq_webhook_delivery'),
+        ]
+        indexes = [
+            # Zamanı gelmiş bekleyen teslimlerin taranması için
+            models.Index(fields=['status', 'next_attempt_at'], name='webhook_deliveries_due_idx'),
+        ]
+
+    def __str__(self) -> str:
+        return f"#{self.message_id} {self.topic} -> {self.subscription_id} ({self.status})"
@@ -0,0 +1,92 @@
+"""
+Outbox mesajlarının iletildiği hedefler (sink).
+
+OUTBOX_SINKS ayarındaki sınıflar sırayla çağrılır. Bir hedef hata fırlatırsa mesajlar
+silinmez ve bir sonraki relay çalışmasında tekrar iletilir (en az bir kez teslim);
+tüketiciler mesaj `id`'si ile tekrarları ayıklamalıdır.
+"""
+import json
+import logging
+import threading
+from typing import List
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxSink:
+    """
+    Hedeflerin temel sınıfı. Mesajlar {id, topic, key, payload, created_at} sözlükleridir
+    ve aynı partition içinde id sırasıyla gelir.
+    """
+
+    def publish(self, messages: List[dict]) -> None:
+        raise NotImplementedError
+
+
+class LoggingSink(OutboxSink):
+    """Mesajları 'events.outbox' logger'ına yazar (geliştirme ve denetim için)."""
+
+    def publish(self, messages: List[dict]) -> None:
+        for message in messages:
+            logger.info('outbox %s key=%s id=%s %s', message['topic'], message['key'], message['id'], message['payload'])
+
+
+class RedisStreamSink(OutboxSink):
+    """
+    Mesajları OUTBOX_REDIS_STREAM Redis stream'ine tek bir pipeline ile ekler (XADD).
+    Stream yaklaşık OUTBOX_REDIS_STREAM_MAXLEN kayıtta kırpılır.
+    """
+
+    def __init__(self):
+        import redis
+
+        self.client = redis.Redis.from_url(settings.OUTBOX_REDIS_URL)
+
+    def publish(self, messages: List[dict]) -> None:
+        pipeline = self.client.pipeline(transaction=False)
+        for message in messages:
+            pipeline.xadd(
+                settings.OUTBOX_REDIS_STREAM,
+                {
+                    'id': message['id'],
+                    'topic': message['topic'],
+                    'key': message['key'],
+                    'payload': json.dumps(message['payload']),
+                    'created_at': message['created_at'],
+                },
+                maxlen=settings.OUTBOX_REDIS_STREAM_MAXLEN,
+                approximate=True,
+            )
+        pipeline.execute()
+
+
+class InMemorySink(OutboxSink):
+    """İletilen mesajları süreç içinde bir listede tutar (testler için)."""
+
+    messages: List[dict] = []
+
+    def publish(self, messages: List[dict]) -> None:
+        InMemorySink.messages.extend(messages)
+
+    @classmethod
+    def clear(cls) -> None:
+        cls.messages.clear()
+
+
+_lock = threading.Lock()
+_sinks = None
+_config = None
+
+
+def get_sinks() -> List[OutboxSink]:
+    """OUTBOX_SINKS ayarındaki hedefleri oluşturur; ayar değişmedikçe aynı nesneler kullanılır."""
+    global _sinks, _config
+    config = tuple(settings.OUTBOX_SINKS)
+    with _lock:
+        if _config != config:
+            _sinks = [import_string(path)() for path in config]
+            _config = config
+        return _sinks
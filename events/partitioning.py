@@ -0,0 +1,216 @@
+"""
+Reservation tablosu için isteğe bağlı PostgreSQL declarative partitioning yardımcıları.
+
+`reservations` tablosu created_at üzerinden aylık RANGE partition'lara bölünür.
+Bitmiş etkinliklerin rezervasyonları özetlendikten sonra eski partition'lar ayrılır
+(DETACH) ve `reservations_archive_<ay>` adıyla saklanır; böylece capacity toplamları,
+süre dolma taraması ve kullanıcı geçmişi sadece canlı partition'lara dokunur.
+
+Not: Partition anahtarı birincil anahtarın parçası olmak zorunda olduğu için
+partition'lı tabloda birincil anahtar (id, created_at) olur. Bu nedenle başka
+tablolar `reservations` tablosuna veritabanı seviyesinde FOREIGN KEY tanımlamamalıdır.
+
+Sadece `id` ile yapılan tek satır sorguları (Reservation.objects.get(pk=...), onay ve
+iptalin koşullu UPDATE'leri) partition budaması (pruning) yapamaz ve her canlı
+partition'ın birincil anahtar indeksine bakar; maliyet partition sayısıyla artar.
+created_at bilindiğinde (Reservation.transition_to) koşula eklenir ve sorgu tek
+partition'a iner. Ayrılan (DETACH) partition'lar bu sorgulara hiç dahil olmaz.
+"""
+from datetime import date, datetime, timezone as dt_timezone
+from typing import List, Tuple
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .models import EventSalesSummary, Reservation
+
+TABLE = Reservation._meta.db_table
+LEGACY_TABLE = f'{TABLE}_unpartitioned'
+DEFAULT_PARTITION = f'{TABLE}_default'
+
+
+def is_supported() -> bool:
+    """Partitioning sadece PostgreSQL üzerinde desteklenir."""
+    return connection.vendor == 'postgresql'
+
+
+def is_partitioned() -> bool:
+    """`reservations` tablosunun partition'lı olup olmadığını döndürür."""
+    if not is_supported():
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table pt "
+            "JOIN pg_class c ON c.oid = pt.partrelid "
+            "WHERE c.relname = %s AND pg_table_is_visible(c.oid)",
+            [TABLE]
+        )
+        return cursor.fetchone() is not None
+
+
+def _month_start(value: date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def _next_month(value: date) -> date:
+    return date(value.year + value.month // 12, value.month % 12 + 1, 1)
+
+
+def _bounds(month: date) -> Tuple[datetime, datetime]:
+    start = datetime(month.year, month.month, 1, tzinfo=dt_timezone.utc)
+    end_month = _next_month(month)
+    end = datetime(end_month.year, end_month.month, 1, tzinfo=dt_timezone.utc)
+    return start, end
+
+
+@transaction.atomic
+def convert_to_partitioned(months_ahead: int = 3) -> bool:
+    """
+    Mevcut `reservations` tablosunu aylık partition'lı bir tabloya dönüştürür.
+
+    Eski tablo `reservations_unpartitioned` adıyla saklanır; veriler tek transaction
+    içinde kopyalanır. Tablo zaten partition'lıysa hiçbir şey yapılmaz.
+
+    Returns:
+        Dönüştürme yapıldıysa True
+    """
+    if is_partitioned():
+        return False
+
+    quote_name = connection.ops.quote_name
+    staging = f'{TABLE}_partitioned'
+    table = quote_name(TABLE)
+    new_table = quote_name(staging)
+    sequence = f'{TABLE}_id_seq_partitioned'
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE')
+        cursor.execute(
+            f'CREATE TABLE {new_table} (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS) '
+            f'PARTITION BY RANGE ("created_at")'
+        )
+        cursor.execute(f'ALTER TABLE {new_table} ADD PRIMARY KEY ("id", "created_at")')
+        cursor.execute(f'CREATE SEQUENCE {quote_name(sequence)} OWNED BY {new_table}."id"')
+        cursor.execute(f"ALTER TABLE {new_table} ALTER COLUMN \"id\" SET DEFAULT nextval('{sequence}')")
+
+        # İlişkiler ve sık kullanılan indeksler (Django'nun oluşturduklarına karşılık gelir)
+        for field in Reservation._meta.concrete_fields:
+            if field.is_relation:
+                column = quote_name(field.column)
+                target = quote_name(field.related_model._meta.db_table)
+                cursor.execute(f'CREATE INDEX ON {new_table} ({column})')
+                cursor.execute(
+                    f'ALTER TABLE {new_table} ADD FOREIGN KEY ({column}) '
+                    f'REFERENCES {target} ("id") DEFERRABLE INITIALLY DEFERRED'
+                )
+
+        cursor.execute(f'SELECT MIN("created_at") FROM {table}')
+        oldest = cursor.fetchone()[0]
+        cursor.execute(f'CREATE TABLE {quote_name(f"{staging}_default")} PARTITION OF {new_table} DEFAULT')
+        _create_monthly_partitions(cursor, new_table, oldest, months_ahead, prefix=staging)
+
+        cursor.execute(f'INSERT INTO {new_table} SELECT * FROM {table}')
+        cursor.execute(f"SELECT setval('{sequence}', COALESCE(MAX(\"id\"), 0) + 1, false) FROM {new_table}")
+
+        cursor.execute(f'ALTER TABLE {table} RENAME TO {quote_name(LEGACY_TABLE)}')
+        # Meta.indexes adları migration durumunda kayıtlıdır; eski tablonun indeksleri yeniden
+        # adlandırılır, böylece sonraki RemoveIndex/AlterIndex yeni tablodaki indekslere uygulanır
+        for index in Reservation._meta.indexes:
+            cursor.execute(
+                f'ALTER INDEX {quote_name(index.name)} RENAME TO {quote_name(f"{index.name}_unpartitioned")}'
+            )
+        cursor.execute(f'ALTER TABLE {new_table} RENAME TO {table}')
+
+        # Partition adlarını kalıcı adlarına çevir
+        for old_name in _partition_names(cursor):
+            if old_name.startswith(staging):
+                new_name = old_name.replace(staging, TABLE, 1)
+                cursor.execute(f'ALTER TABLE {quote_name(old_name)} RENAME TO {quote_name(new_name)}')
+
+    # Partition'lı tabloda her partition için indeks oluşturulur
+    with connection.schema_editor(atomic=False) as schema_editor:
+        for index in Reservation._meta.indexes:
+            schema_editor.execute(index.create_sql(Reservation, schema_editor))
+
+    return True
+
+
+def _partition_names(cursor) -> List[str]:
+    cursor.execute(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "JOIN pg_class p ON p.oid = i.inhparent "
+        "WHERE p.relname = %s ORDER BY c.relname",
+        [TABLE]
+    )
+    return [row[0] for row in cursor.fetchall()]
+
+
+def _create_monthly_partitions(cursor, parent: str, oldest, months_ahead: int, prefix: str = TABLE) -> List[str]:
+    quote_name = connection.ops.quote_name
+    today = _month_start(timezone.now().date())
+    month = _month_start(oldest.date()) if oldest else today
+    last = today
+    for _ in range(months_ahead):
+        last = _next_month(last)
+
+    created = []
+    while month <= last:
+        name = f'{prefix}_p{month:%Y_%m}'
+        start, end = _bounds(month)
+        cursor.execute(
+            f'CREATE TABLE IF NOT EXISTS {quote_name(name)} PARTITION OF {parent} '
+            f'FOR VALUES FROM (%s) TO (%s)',
+            [start, end]
+        )
+        created.append(name)
+        month = _next_month(month)
+    return created
+
+
+def ensure_monthly_partitions(months_ahead: int = 3) -> List[str]:
+    """
+    Bu ay ve sonraki `months_ahead` ay için partition'ların var olmasını sağlar.
+    Tablo partition'lı değilse hiçbir şey yapmaz.
+    """
+    if not is_partitioned():
+        return []
+    with connection.cursor() as cursor:
+        return _create_monthly_partitions(
+            cursor, connection.ops.quote_name(TABLE), None, months_ahead
+        )
+
+
+@transaction.atomic
+def detach_archived_partitions(before: date) -> List[str]:
+    """
+    `before` ayından önce biten ve sadece özetlenmiş (arşivlenmiş) etkinliklere ait
+    rezervasyonları içeren partition'ları ayırır ve `reservations_archive_<ay>` olarak saklar.
+
+    Returns:
+        Ayrılan partition adları
+    """
+    if not is_partitioned():
+        return []
+
+    quote_name = connection.ops.quote_name
+    summary_table = quote_name(EventSalesSummary._meta.db_table)
+    detached = []
+    with connection.cursor() as cursor:
+        for name in _partition_names(cursor):
+            if name == DEFAULT_PARTITION or not name.startswith(f'{TABLE}_p'):
+                continue
+            month = datetime.strptime(name[len(f'{TABLE}_p'):], '%Y_%m').date()
+            if _next_month(month) > before:
+                continue
+            cursor.execute(
+                f'SELECT 1 FROM {quote_name(name)} r WHERE NOT EXISTS '
+                f'(SELECT 1 FROM {summary_table} s WHERE s."event_id" = r."event_id") LIMIT 1'
+            )
+            if cursor.fetchone():
+                continue
+            cursor.execute(f'ALTER TABLE {quote_name(TABLE)} DETACH PARTITION {quote_name(name)}')
+            archive_name = name.replace(f'{TABLE}_p', f'{TABLE}_archive_', 1)
+            cursor.execute(f'ALTER TABLE {quote_name(name)} RENAME TO {quote_name(archive_name)}')
+            detached.append(archive_name)
+    return detached
@@ -1,8 +1,13 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
 from rest_framework import serializers
-from .models import Event, Reservation
+from core.serializers import SparseFieldsetMixin, ValuesSerializer
+from .models import CAPACITY_ANNOTATIONS, CapacitySnapshot, Event, Reservation
 
 
-class EventSerializer(serializers.ModelSerializer):
+class EventSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Etkinlik okuma/yazma işlemleri için serializer.
     
@@ -10,7 +15,16 @@ class EventSerializer(serializers.ModelSerializer):
     - available_capacity: Kalan kapasite
     - hold_count: HOLD rezervasyon sayısı (miktar toplamı)
     - confirmed_count: CONFIRMED rezervasyon sayısı (miktar toplamı)
+    
+    Üç alan da Event.capacity_snapshot() üzerinden tek sorguyla (veya queryset anotasyonlarından) hesaplanır.
+    `?fields=` / `?omit=` ile istenmedikleri okumalarda hiç hesaplanmazlar (bkz. SparseFieldsetMixin).
     """
+    # Kapasite anotasyonlarına (Event.capacity_snapshot) ihtiyaç duyan alanlar
+    CAPACITY_FIELDS = {'available_capacity', 'hold_count', 'confirmed_count'}
+    sparse_field_sources = {
+        name: ('capacity', 'end_time', 'inventory_shards') for name in CAPACITY_FIELDS
+    }
+
     available_capacity = serializers.SerializerMethodField()
     hold_count = serializers.SerializerMethodField()
     confirmed_count = serializers.SerializerMethodField()
@@ -20,7 +34,7 @@ class EventSerializer(serializers.ModelSerializer):
         fields = [
             'id', 'name', 'description', 'capacity', 'available_capacity',
             'hold_count', 'confirmed_count',
-            'start_time', 'end_time', 'is_active', 'created_at', 'updated_at'
+            'start_time', 'end_time', 'is_active', 'max_per_user', 'inventory_shards', 'created_at', 'updated_at'
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
 
@@ -29,24 +43,25 @@ class EventSerializer(serializers.ModelSerializer):
         Serializasyon için kalan kapasiteyi hesaplar.
         Not: Sadece görüntüleme içindir. Gerçek kapasite kontrolü servislerde yapılır.
         """
-        return obj.get_available_capacity()
+        return obj.capacity_snapshot().available
 
     def get_hold_count(self, obj) -> int:
         """
         Aktif HOLD rezervasyonların toplam miktarını döndürür.
         """
-        return obj.get_hold_count()
+        return obj.capacity_snapshot().held
 
     def get_confirmed_count(self, obj) -> int:
         """
         CONFIRMED rezervasyonların toplam miktarını döndürür.
         """
-        return obj.get_confirmed_count()
+        return obj.capacity_snapshot().confirmed
 
 
-class ReservationSerializer(serializers.ModelSerializer):
+class ReservationSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Rezervasyon okuma işlemleri için serializer.
+    `?fields=` / `?omit=` ile alan seçimi desteklenir (bkz. SparseFieldsetMixin).
     """
     event_name = serializers.CharField(source='event.name', read_only=True)
     user_username = serializers.CharField(source='user.username', read_only=True)
@@ -60,6 +75,109 @@ class ReservationSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'user', 'status', 'created_at', 'updated_at']
 
 
+class EventValuesSerializer(ValuesSerializer):
+    """
+    Etkinlik listesi için values() tabanlı hızlı okuma yolu; çıktısı EventSerializer ile aynıdır.
+    Kapasite alanları için queryset `with_capacity()` ile anotasyonlanmış olmalıdır.
+    """
+    serializer_class = EventSerializer
+    computed_fields = {
+        name: ('capacity', 'end_time', 'inventory_shards', *CAPACITY_ANNOTATIONS)
+        for name in EventSerializer.CAPACITY_FIELDS
+    }
+
+    def prepare(self, row: dict) -> dict:
+        snapshot = CapacitySnapshot.from_values(
+            row['capacity'], row['end_time'], row['inventory_shards'],
+            **{name: row[name] for name in CAPACITY_ANNOTATIONS}
+        )
+        row['available_capacity'] = snapshot.available
+        row['hold_count'] = snapshot.held
+        row['confirmed_count'] = snapshot.confirmed
+        return row
+
+
+class ReservationValuesSerializer(ValuesSerializer):
+    """
+    Rezervasyon listesi için values() tabanlı hızlı okuma yolu; çıktısı ReservationSerializer ile aynıdır.
+    """
+    serializer_class = ReservationSerializer
+
+
+class EventAvailabilityQuerySerializer(serializers.Serializer):
+    """
+    Toplu kapasite sorgusunun (?ids=1,2,3&cached=true) parametrelerini doğrular.
+    """
+    ids = serializers.CharField()
+    cached = serializers.BooleanField(default=False)
+
+    def validate_ids(self, value):
+        try:
+            # Tekrarlanan id'ler ilk geçtikleri sırayla bir kez alınır
+            ids = list(dict.fromkeys(int(part) for part in value.split(',') if part.strip()))
+        except ValueError:
+            raise serializers.ValidationError("ids must be a comma separated list of integers")
+        if not ids:
+            raise serializers.ValidationError("At least one event id is required")
+        if len(ids) > settings.EVENT_AVAILABILITY_MAX_IDS:
+            raise serializers.ValidationError(
+                f"At most {settings.EVENT_AVAILABILITY_MAX_IDS} event ids can be requested at once"
+            )
+        return ids
+
+
+class EventChangesQuerySerializer(serializers.Serializer):
+    """
+    Delta senkronizasyon isteğinin (?since=<cursor>) parametresini doğrular.
+    """
+    since = serializers.IntegerField(min_value=0, required=False)
+
+
+class EventCalendarQuerySerializer(serializers.Serializer):
+    """
+    Takvim özeti isteğinin (?from=2025-06-01&to=2025-06-30) parametrelerini doğrular.
+    """
+
+    def get_fields(self):
+        # 'from' Python'da anahtar kelime olduğundan alanlar sınıf özniteliği olarak tanımlanamaz
+        return {'from': serializers.DateField(), 'to': serializers.DateField()}
+
+    def validate(self, attrs):
+        if attrs['from'] > attrs['to']:
+            raise serializers.ValidationError("'from' must be on or before 'to'")
+        if (attrs['to'] - attrs['from']).days + 1 > settings.EVENT_CALENDAR_MAX_DAYS:
+            raise serializers.ValidationError(
+                f"At most {settings.EVENT_CALENDAR_MAX_DAYS} days can be requested at once"
+            )
+        return attrs
+
+
+class EventSalesQuerySerializer(serializers.Serializer):
+    """
+    Satış analitiği isteğinin parametrelerini doğrular.
+    Aralık verilmezse son 60 dakika döner.
+    """
+    DEFAULT_MINUTES = 60
+
+    def get_fields(self):
+        return {
+            'from': serializers.DateTimeField(required=False),
+            'to': serializers.DateTimeField(required=False),
+            'limit': serializers.IntegerField(required=False, default=20, min_value=1, max_value=100),
+        }
+
+    def validate(self, attrs):
+        attrs.setdefault('to', timezone.now())
+        attrs.setdefault('from', attrs['to'] - timedelta(minutes=self.DEFAULT_MINUTES))
+        if attrs['from'] >= attrs['to']:
+            raise serializers.ValidationError("'from' must be before 'to'")
+        if attrs['to'] - attrs['from'] > timedelta(minutes=settings.EVENT_SALES_MAX_MINUTES):
+            raise serializers.ValidationError(
+                f"At most {settings.EVENT_SALES_MAX_MINUTES} minutes can be requested at once"
+            )
+        return attrs
+
+
 class CreateReservationSerializer(serializers.Serializer):
     """
     HOLD rezervasyon oluşturma için serializer.
@@ -89,3 +207,19 @@ class ConfirmReservationSerializer(serializers.Serializer):
             raise serializers.ValidationError("Reservation does not exist")
         return value
 
+
+
+class FeaturedEventSerializer(serializers.ModelSerializer):
+    """
+    Ana sayfa öne çıkan etkinlik listesi için kompakt serializer.
+    Sonuç önbellekte tutulduğundan sadece listede gösterilen alanları içerir.
+    """
+    available_capacity = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Event
+        fields = ['id', 'name', 'start_time', 'end_time', 'capacity', 'available_capacity']
+        read_only_fields = fields
+
+    def get_available_capacity(self, obj) -> int:
+        return obj.capacity_snapshot().available
@@ -1,10 +1,34 @@
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+from django.conf import settings
+from django.core.cache import cache
 from django.db import transaction
+from django.db.models import Count, F, Q, Sum, Value
+from django.db.models.functions import Greatest
 from django.utils import timezone
 from django.core.exceptions import ValidationError
-from datetime import timedelta
+from datetime import date, datetime, time, timedelta
 
-from .models import Event, Reservation
+from core.exceptions import CursorExpiredError
+from core.renderers import FastJSONRenderer
+
+from .models import (
+    CAPACITY_ANNOTATIONS,
+    CapacitySnapshot,
+    Event,
+    EventChange,
+    EventChangePurge,
+    EventSalesRollup,
+    EventSalesSummary,
+    EventUserSummary,
+    InventoryBucket,
+    OutboxMessage,
+    OutboxPartition,
+    Reservation,
+    WebhookDelivery,
+)
+from .outbox import get_sinks
+from .webhooks import send_batch
 
 
 class ReservationService:
@@ -33,41 +57,72 @@ class ReservationService:
             HOLD durumunda Reservation nesnesi
             
         Raises:
-            ValidationError: Kapasite yetersizse veya etkinlik aktif değilse
+            ValidationError: Kapasite yetersizse, kullanıcı limiti aşılıyorsa veya etkinlik aktif değilse
         """
-        # Eşzamanlı değişiklikleri önlemek için event satırını kilitle
-        event = Event.objects.select_for_update().get(id=event_id)
+        event = Event.objects.get(id=event_id)
+        
+        if not event.inventory_shards:
+            # Eşzamanlı değişiklikleri önlemek için event satırını kilitle
+            event = Event.objects.select_for_update().get(id=event_id)
         
         # Etkinliğin aktif olup olmadığını kontrol et
         if not event.is_active:
             raise ValidationError("Event is not active. Reservations cannot be made for inactive events.")
         
-        # Kalan kapasiteyi dinamik olarak hesapla
-        available = event.get_available_capacity()
-        
-        if available < quantity:
+        # Kullanıcı başına limit kontrolü: rezervasyonlar üzerinde SUM yerine özet satırı kilitlenir
+        summary, _ = EventUserSummary.objects.select_for_update().get_or_create(
+            event_id=event.id,
+            user_id=user_id
+        )
+        if event.max_per_user is not None and summary.total_quantity + quantity > event.max_per_user:
+            # Özet, tarama çalışana kadar süresi dolmuş HOLD'ları da sayar; önce kullanıcınınkiler düşülür
+            if ReservationService._expire_holds(Reservation.objects.filter(event_id=event.id, user_id=user_id)):
+                summary.refresh_from_db()
+        if event.max_per_user is not None and summary.total_quantity + quantity > event.max_per_user:
             raise ValidationError(
-                f"Insufficient capacity. Available: {available}, Requested: {quantity}"
+                f"Per-user limit exceeded. Limit: {event.max_per_user}, "
+                f"Already reserved: {summary.total_quantity}, Requested: {quantity}"
             )
         
+        bucket = None
+        if event.inventory_shards:
+            # Kovalı etkinliklerde event satırı kilitlenmez, miktar bir kovadan ayrılır
+            bucket = ReservationService._reserve_from_bucket(event, quantity)
+        else:
+            # Kalan kapasiteyi dinamik olarak hesapla
+            available = event.capacity_snapshot(refresh=True).available
+            
+            if available < quantity:
+                raise ValidationError(
+                    f"Insufficient capacity. Available: {available}, Requested: {quantity}"
+                )
+        
         # Süre dolma zamanı ile HOLD rezervasyon oluştur
         expires_at = timezone.now() + timedelta(minutes=ReservationService.HOLD_EXPIRATION_MINUTES)
         reservation = Reservation.objects.create(
             event=event,
             user_id=user_id,
+            bucket=bucket,
             status=Reservation.Status.HOLD,
             quantity=quantity,
             expires_at=expires_at
         )
+        ReservationService._adjust_user_summary(event.id, user_id, held=quantity)
+        EventChange.record([event.id])
+        EventSalesRollup.record({event.id: {'held': quantity}})
+        OutboxMessage.add_reservations([reservation])
         
         return reservation
 
     @staticmethod
-    @transaction.atomic
     def confirm_reservation(reservation_id: int, user_id: int) -> Reservation:
         """
         HOLD rezervasyonu onaylar.
         
+        Kapasite kontrolünden sonra durum geçişi koşullu UPDATE ile yapılır;
+        bu arada rezervasyon iptal edildiyse veya süresi dolduysa onay uygulanmaz.
+        Süresi dolmuş HOLD, hata fırlatılmadan önce kalıcı olarak EXPIRED yapılır.
+        
         Args:
             reservation_id: Onaylanacak rezervasyon ID'si
             user_id: Kullanıcı ID'si (yetkilendirme için)
@@ -78,7 +133,7 @@ class ReservationService:
         Raises:
             ValidationError: Rezervasyon geçersiz veya süresi dolmuşsa
         """
-        reservation = Reservation.objects.select_for_update().get(id=reservation_id)
+        reservation = Reservation.objects.get(id=reservation_id)
         
         # Yetkilendirme kontrolü
         if reservation.user_id != user_id:
@@ -90,33 +145,65 @@ class ReservationService:
         
         # Süre dolma kontrolü
         if reservation.expires_at and reservation.expires_at < timezone.now():
-            reservation.status = Reservation.Status.EXPIRED
-            reservation.save()
+            ReservationService._expire_hold(reservation)
             raise ValidationError("Reservation has expired")
         
-        # Kapasite kontrolü için event'i kilitle
-        event = Event.objects.select_for_update().get(id=reservation.event_id)
-        
-        # Etkinliğin hala aktif olup olmadığını kontrol et
-        if not event.is_active:
-            raise ValidationError("Event is not active. Cannot confirm reservation for inactive event.")
-        
-        available = event.get_available_capacity()
-        
-        if available < reservation.quantity:
-            raise ValidationError("Insufficient capacity to confirm reservation")
+        with transaction.atomic():
+            if reservation.bucket_id:
+                # Miktar HOLD sırasında kovadan ayrıldı, event satırını kilitlemeye gerek yok
+                event = Event.objects.get(id=reservation.event_id)
+            else:
+                # Kapasite kontrolü için event'i kilitle
+                event = Event.objects.select_for_update().get(id=reservation.event_id)
+            
+            # Etkinliğin hala aktif olup olmadığını kontrol et
+            if not event.is_active:
+                raise ValidationError("Event is not active. Cannot confirm reservation for inactive event.")
+            
+            if not reservation.bucket_id:
+                available = event.capacity_snapshot(refresh=True).available
+                
+                if available < reservation.quantity:
+                    raise ValidationError("Insufficient capacity to confirm reservation")
+            
+            # Rezervasyonu onayla (sadece hala HOLD ise ve süresi UPDATE anında da dolmamışsa;
+            # yukarıdaki kontrolden sonra süresi dolan HOLD'un kapasitesi havuza dönmüş olabilir)
+            confirmed = reservation.transition_to(
+                Reservation.Status.CONFIRMED,
+                conditions=Q(expires_at__isnull=True) | Q(expires_at__gte=timezone.now()),
+                expires_at=None
+            )
+            if confirmed:
+                ReservationService._adjust_user_summary(
+                    reservation.event_id,
+                    reservation.user_id,
+                    held=-reservation.quantity,
+                    confirmed=reservation.quantity
+                )
+                EventChange.record([reservation.event_id])
+                EventSalesRollup.record({reservation.event_id: {'confirmed': reservation.quantity}})
+                OutboxMessage.add_reservations([reservation])
         
-        # Rezervasyonu onayla
-        reservation.status = Reservation.Status.CONFIRMED
-        reservation.expires_at = None
-        reservation.save()
+        if not confirmed:
+            reservation.refresh_from_db(fields=['status', 'expires_at'])
+            if reservation.status == Reservation.Status.HOLD:
+                # Durum değişmediyse koşulu bozan süre dolmasıdır
+                ReservationService._expire_hold(reservation)
+                raise ValidationError("Reservation has expired")
+            raise ValidationError("Reservation is no longer in HOLD status")
         
         return reservation
 
     @staticmethod
+    @transaction.atomic
     def cancel_reservation(reservation_id: int, user_id: int) -> Reservation:
         """
         Rezervasyonu iptal eder.
+        Kovalı rezervasyonlarda miktar aynı kovaya iade edilir.
+        
+        İptal, sahiplik ve durum koşullarını içeren tek bir UPDATE ile yapılır; UPDATE önceki
+        durumu da döndürdüğü için kullanıcı özetinin doğru sütunu ek sorgu olmadan seçilir.
+        Satır okunup tekrar kaydedilmediği için eşzamanlı onay veya süre dolma ezilmez.
         
         Args:
             reservation_id: İptal edilecek rezervasyon ID'si
@@ -125,19 +212,54 @@ class ReservationService:
         Returns:
             İptal edilmiş Reservation nesnesi
         """
-        reservation = Reservation.objects.get(id=reservation_id)
-        
-        if reservation.user_id != user_id:
-            raise ValidationError("You can only cancel your own reservations")
+        cancelled = Reservation.objects.filter(id=reservation_id, user_id=user_id).transition(
+            Reservation.Status.CANCELLED,
+            from_statuses=Reservation.sources_for(Reservation.Status.CANCELLED),
+            returning_previous=True
+        )
         
-        if reservation.status in [Reservation.Status.CANCELLED, Reservation.Status.EXPIRED]:
+        if not cancelled:
+            # Hata mesajı için satırı oku (sadece başarısız yolda)
+            reservation = Reservation.objects.get(id=reservation_id)
+            
+            if reservation.user_id != user_id:
+                raise ValidationError("You can only cancel your own reservations")
+            
             raise ValidationError(f"Cannot cancel reservation with status: {reservation.status}")
         
-        reservation.status = Reservation.Status.CANCELLED
-        reservation.save()
+        reservation = cancelled[0]
+        if reservation.bucket_id:
+            ReservationService._release_to_bucket(reservation.bucket_id, reservation.quantity)
+        if reservation.previous_status == Reservation.Status.HOLD:
+            ReservationService._adjust_user_summary(reservation.event_id, user_id, held=-reservation.quantity)
+        else:
+            ReservationService._adjust_user_summary(reservation.event_id, user_id, confirmed=-reservation.quantity)
+        EventChange.record([reservation.event_id])
+        EventSalesRollup.record({reservation.event_id: {'cancelled': reservation.quantity}})
+        OutboxMessage.add_reservations([reservation])
+        # Geçmiş bir etkinliğin iptali o günün önbellekteki takvim özetini değiştirir
+        EventCalendarService.invalidate_event(reservation.event_id)
         
         return reservation
 
+    @staticmethod
+    @transaction.atomic
+    def _expire_hold(reservation: Reservation) -> bool:
+        """
+        Süresi dolmuş tek bir HOLD rezervasyonu EXPIRED yapar ve kovasına iade eder.
+        """
+        expired = reservation.transition_to(Reservation.Status.EXPIRED)
+        if expired:
+            if reservation.bucket_id:
+                ReservationService._release_to_bucket(reservation.bucket_id, reservation.quantity)
+            ReservationService._adjust_user_summary(
+                reservation.event_id, reservation.user_id, held=-reservation.quantity
+            )
+            EventChange.record([reservation.event_id])
+            EventSalesRollup.record({reservation.event_id: {'expired': reservation.quantity}})
+            OutboxMessage.add_reservations([reservation])
+        return expired
+
     @staticmethod
     def expire_old_holds() -> int:
         """
@@ -151,12 +273,770 @@ class ReservationService:
         Returns:
             Süresi dolmuş olarak işaretlenen rezervasyon sayısı
         """
+        with transaction.atomic():
+            return ReservationService._expire_holds(Reservation.objects.all())
+
+    @staticmethod
+    def _expire_holds(queryset) -> int:
+        """
+        Queryset içindeki süresi dolmuş (expires_at < now) HOLD rezervasyonları tek bir koşullu
+        UPDATE ile EXPIRED yapar. Kovalara, kullanıcı özetlerine ve satış sayaçlarına iadeler
+        gruplanarak yapılır. Çağıran transaction içinde çalışmalıdır.
+        
+        Returns:
+            Süresi dolmuş olarak işaretlenen rezervasyon sayısı
+        """
+        expired = queryset.filter(expires_at__lt=timezone.now()).transition(
+            Reservation.Status.EXPIRED,
+            from_statuses=[Reservation.Status.HOLD]
+        )
+        
+        released = {}
+        held = {}
+        expired_by_event = {}
+        for reservation in expired:
+            if reservation.bucket_id:
+                released[reservation.bucket_id] = released.get(reservation.bucket_id, 0) + reservation.quantity
+            key = (reservation.event_id, reservation.user_id)
+            held[key] = held.get(key, 0) + reservation.quantity
+            expired_by_event[reservation.event_id] = (
+                expired_by_event.get(reservation.event_id, 0) + reservation.quantity
+            )
+        for bucket_id, quantity in sorted(released.items()):
+            ReservationService._release_to_bucket(bucket_id, quantity)
+        for (event_id, user_id), quantity in sorted(held.items()):
+            ReservationService._adjust_user_summary(event_id, user_id, held=-quantity)
+        EventChange.record(event_id for event_id, _ in held)
+        EventSalesRollup.record({
+            event_id: {'expired': quantity} for event_id, quantity in expired_by_event.items()
+        })
+        OutboxMessage.add_reservations(sorted(expired, key=lambda reservation: reservation.id))
+        return len(expired)
+
+    @staticmethod
+    def _reserve_from_bucket(event: Event, quantity: int) -> InventoryBucket:
+        """
+        Etkinliğin envanter kovalarından birinden miktar ayırır.
+        
+        Önce yeterli boş kapasitesi olan rastgele bir kova SKIP LOCKED ile denenir,
+        böylece eşzamanlı HOLD'lar farklı kovalara dağılır. Hepsi kilitliyse kilit
+        beklenerek tekrar denenir; kovalar tek tek kuruduysa kapasite yeniden dengelenir.
+        
+        Raises:
+            ValidationError: Kovaların toplam boş kapasitesi yetersizse
+        """
+        with_room = InventoryBucket.objects.filter(
+            event_id=event.id,
+            capacity__gte=F('reserved') + quantity
+        ).order_by('?')
+        
+        bucket = with_room.select_for_update(skip_locked=True).first()
+        if bucket is None:
+            bucket = with_room.select_for_update().first()
+        if bucket is None and ReservationService.rebalance_inventory(event.id, min_free=quantity):
+            bucket = with_room.select_for_update().first()
+        if bucket is None:
+            available = event.capacity_snapshot(refresh=True).available
+            raise ValidationError(
+                f"Insufficient capacity. Available: {available}, Requested: {quantity}"
+            )
+        
+        InventoryBucket.objects.filter(id=bucket.id).update(reserved=F('reserved') + quantity)
+        return bucket
+
+    @staticmethod
+    def _release_to_bucket(bucket_id: int, quantity: int) -> None:
+        """
+        Ayrılmış miktarı ait olduğu kovaya iade eder.
+        """
+        InventoryBucket.objects.filter(id=bucket_id).update(reserved=F('reserved') - quantity)
+
+    @staticmethod
+    def _adjust_user_summary(event_id: int, user_id: int, held: int = 0, confirmed: int = 0) -> None:
+        """
+        Kullanıcının etkinlik özet satırındaki HOLD/CONFIRMED miktarlarını değiştirir.
+        Servis dışında oluşturulmuş rezervasyonlar için değerler sıfırın altına inmez.
+        """
+        updates = {}
+        if held:
+            updates['held_quantity'] = Greatest(F('held_quantity') + held, Value(0))
+        if confirmed:
+            updates['confirmed_quantity'] = Greatest(F('confirmed_quantity') + confirmed, Value(0))
+        if updates:
+            EventUserSummary.objects.filter(event_id=event_id, user_id=user_id).update(
+                updated_at=timezone.now(),
+                **updates
+            )
+
+    @staticmethod
+    @transaction.atomic
+    def rebalance_inventory(event_id: int, min_free: int = 0) -> bool:
+        """
+        Etkinliğin boş kapasitesini envanter kovaları arasında eşit olarak dağıtır.
+        
+        Eksik kovaları oluşturur, fazlalık boş kovaları siler. Kovası olmayan
+        (sharding öncesi oluşturulmuş) aktif rezervasyonlar dağıtılabilir kapasiteden düşülür.
+        Kovalar index sırasıyla kilitlendiği için eşzamanlı dengelemeler kilitlenmez.
+        
+        Args:
+            event_id: Kovaları dengelenecek etkinlik ID'si
+            min_free: En az bir kovada bulunması gereken boş kapasite (HOLD geri dönüşü için)
+            
+        Returns:
+            Herhangi bir kovanın kapasitesi değiştiyse True
+        """
+        event = Event.objects.get(id=event_id)
+        buckets = list(
+            InventoryBucket.objects.select_for_update().filter(event_id=event_id).order_by('index')
+        )
+        
+        if not event.inventory_shards:
+            InventoryBucket.objects.filter(event_id=event_id, reserved=0).delete()
+            return False
+        
+        existing = {bucket.index for bucket in buckets}
+        missing = [
+            InventoryBucket(event_id=event_id, index=index)
+            for index in range(event.inventory_shards)
+            if index not in existing
+        ]
+        if missing:
+            InventoryBucket.objects.bulk_create(missing)
+            buckets = list(
+                InventoryBucket.objects.select_for_update().filter(event_id=event_id).order_by('index')
+            )
+        
+        unbucketed = Reservation.objects.filter(event_id=event_id, bucket__isnull=True).filter(
+            Q(status=Reservation.Status.CONFIRMED) |
+            Q(status=Reservation.Status.HOLD, expires_at__gt=timezone.now())
+        ).aggregate(total=Sum('quantity'))['total'] or 0
+        
+        reserved = sum(bucket.reserved for bucket in buckets)
+        free = max(event.capacity - reserved - unbucketed, 0)
+        
+        # Fazlalık kovalar yeni kapasite almaz, boşaldıklarında silinir
+        active = [bucket for bucket in buckets if bucket.index < event.inventory_shards]
+        if min_free and len(active) > 1 and min_free <= free and free // len(active) < min_free:
+            # Eşit paylar isteği karşılamıyorsa, istenen miktar tek bir kovada toplanır
+            rest, remainder = divmod(free - min_free, len(active) - 1)
+            shares = [min_free] + [rest + (1 if position < remainder else 0) for position in range(len(active) - 1)]
+        else:
+            share, remainder = divmod(free, len(active))
+            shares = [share + (1 if position < remainder else 0) for position in range(len(active))]
+        targets = {bucket.id: bucket.reserved + share for bucket, share in zip(active, shares)}
+        
         now = timezone.now()
-        # Sadece expires_at < now olan rezervasyonları işaretle (5 dakika geçmiş)
-        expired_count = Reservation.objects.filter(
-            status=Reservation.Status.HOLD,
-            expires_at__lt=now
-        ).update(status=Reservation.Status.EXPIRED)
+        changed = []
+        for bucket in buckets:
+            target = targets.get(bucket.id, bucket.reserved)
+            if bucket.capacity != target:
+                bucket.capacity = target
+                bucket.updated_at = now
+                changed.append(bucket)
+        
+        if changed:
+            InventoryBucket.objects.bulk_update(changed, ['capacity', 'updated_at'])
+        InventoryBucket.objects.filter(
+            event_id=event_id, index__gte=event.inventory_shards, reserved=0
+        ).delete()
+        
+        return bool(changed)
+
+
+class ReservationArchiveService:
+    """
+    Bitmiş etkinliklerin rezervasyonlarını özetleyip canlı tablodan çıkaran servis.
+    """
+
+    PURGE_BATCH_SIZE = 5000
+
+    @staticmethod
+    @transaction.atomic
+    def summarize_ended_events(ended_before) -> int:
+        """
+        `ended_before` tarihinden önce biten ve henüz özetlenmemiş etkinlikler için
+        tek bir gruplu sorgu ile EventSalesSummary satırları oluşturur.
+        
+        Returns:
+            Özetlenen etkinlik sayısı
+        """
+        event_ids = list(
+            Event.objects.filter(end_time__lt=ended_before, sales_summary__isnull=True)
+            .values_list('id', flat=True)
+        )
+        if not event_ids:
+            return 0
+        
+        totals = {
+            row['event_id']: row
+            for row in Reservation.objects.filter(event_id__in=event_ids)
+            .values('event_id')
+            .annotate(
+                reservation_count=Count('id'),
+                confirmed_quantity=Sum('quantity', filter=Q(status=Reservation.Status.CONFIRMED)),
+                cancelled_quantity=Sum('quantity', filter=Q(status=Reservation.Status.CANCELLED)),
+                expired_quantity=Sum('quantity', filter=Q(
+                    status__in=[Reservation.Status.EXPIRED, Reservation.Status.HOLD]
+                )),
+            )
+            .order_by()
+        }
+        
+        summaries = []
+        for event_id in event_ids:
+            row = totals.get(event_id, {})
+            summaries.append(EventSalesSummary(
+                event_id=event_id,
+                reservation_count=row.get('reservation_count') or 0,
+                confirmed_quantity=row.get('confirmed_quantity') or 0,
+                cancelled_quantity=row.get('cancelled_quantity') or 0,
+                expired_quantity=row.get('expired_quantity') or 0,
+            ))
+        EventSalesSummary.objects.bulk_create(summaries, ignore_conflicts=True)
+        return len(summaries)
+
+    @staticmethod
+    def purge_archived_reservations(batch_size: int = PURGE_BATCH_SIZE) -> int:
+        """
+        Özetlenmiş etkinliklerin rezervasyonlarını canlı tablodan parça parça siler.
+        Partition'sız kurulumlar için DETACH yerine kullanılır.
+        
+        Returns:
+            Silinen rezervasyon sayısı
+        """
+        archived = Reservation.objects.filter(event__sales_summary__isnull=False)
+        deleted = 0
+        while True:
+            ids = list(archived.values_list('id', flat=True)[:batch_size])
+            if not ids:
+                return deleted
+            with transaction.atomic():
+                deleted += Reservation.objects.filter(id__in=ids).delete()[0]
+
+
+class FeaturedEventsService:
+    """
+    Ana sayfadaki öne çıkan etkinlik listesini önceden hesaplayıp önbellekte tutan servis.
+    
+    Liste yaklaşan aktif etkinlikleri başlangıç zamanına göre sıralı ve kalan kapasiteleriyle
+    içerir; yanıt gövdesi JSON olarak hazır saklanır, endpoint ORM'e dokunmadan döndürür.
+    
+    Durumda sadece ilk FEATURED_EVENTS_LIMIT + FEATURED_EVENTS_BUFFER etkinlik ve bunların
+    sonuncusunun başlangıç zamanı (ufuk) tutulur. Her derlemede sadece son derlemeden beri
+    değişen etkinlikler (etkinlik veya rezervasyon satırı güncellenenler) yeniden hesaplanır;
+    ufuktan sonra başlayanlar listeye giremeyeceği için atlanır. Çıkanlar yüzünden liste
+    FEATURED_EVENTS_LIMIT'in altına düşerse ilk sayfa tek bir LIMIT'li sorguyla yeniden derlenir.
+    """
+
+    PAYLOAD_KEY = 'events:featured'
+    STATE_KEY = 'events:featured:state'
+    # Derleme sırasında commit edilen transaction'ları kaçırmamak için geriye taşma payı
+    CHANGE_LAG = timedelta(seconds=5)
+
+    @staticmethod
+    def get_payload() -> Optional[bytes]:
+        """Hazır JSON yanıt gövdesini döndürür (henüz derlenmediyse None)."""
+        return cache.get(FeaturedEventsService.PAYLOAD_KEY)
+
+    @staticmethod
+    def _full_state(upcoming, now) -> dict:
+        """İlk FEATURED_EVENTS_LIMIT + FEATURED_EVENTS_BUFFER etkinliği baştan hesaplar."""
+        from .serializers import FeaturedEventSerializer
+        
+        size = settings.FEATURED_EVENTS_LIMIT + settings.FEATURED_EVENTS_BUFFER
+        events = list(upcoming.order_by('start_time', 'id').with_capacity(now)[:size])
+        return {
+            'entries': {data['id']: dict(data) for data in FeaturedEventSerializer(events, many=True).data},
+            # Liste kesilmediyse tüm yaklaşan etkinlikler durumdadır, ufuk yoktur
+            'horizon': events[-1].start_time if len(events) == size else None,
+        }
+
+    @staticmethod
+    def build(full: bool = False) -> bytes:
+        """
+        Öne çıkan etkinlik listesini derler ve önbelleğe yazar.
+        
+        Args:
+            full: True ise önceki durum yok sayılır ve tüm liste baştan hesaplanır
+        
+        Returns:
+            Önbelleğe yazılan JSON yanıt gövdesi
+        """
+        from .serializers import FeaturedEventSerializer
+        
+        now = timezone.now()
+        state = None if full else cache.get(FeaturedEventsService.STATE_KEY)
+        upcoming = Event.objects.filter(is_active=True, start_time__gt=now)
+        
+        if state is not None:
+            entries, horizon = state['entries'], state['horizon']
+            since = state['built_at'] - FeaturedEventsService.CHANGE_LAG
+            changed_ids = set(
+                Event.objects.filter(updated_at__gte=since).values_list('id', flat=True)
+            ) | set(
+                Reservation.objects.filter(updated_at__gte=since).order_by()
+                .values_list('event_id', flat=True).distinct()
+            )
+            # Değişenler aşağıda yeniden hesaplanır; silinen, pasifleştirilen veya başlamış etkinlikler çıkar
+            kept = set(upcoming.filter(id__in=set(entries) - changed_ids).values_list('id', flat=True))
+            entries = {event_id: data for event_id, data in entries.items() if event_id in kept}
+            changed = upcoming.filter(id__in=changed_ids)
+            if horizon is not None:
+                changed = changed.filter(start_time__lte=horizon)
+            for data in FeaturedEventSerializer(changed.with_capacity(now), many=True).data:
+                entries[data['id']] = dict(data)
+            
+            size = settings.FEATURED_EVENTS_LIMIT + settings.FEATURED_EVENTS_BUFFER
+            if len(entries) > size or (horizon is not None and len(entries) < settings.FEATURED_EVENTS_LIMIT):
+                state = None
+            else:
+                state = {'entries': entries, 'horizon': horizon}
+        
+        if state is None:
+            state = FeaturedEventsService._full_state(upcoming, now)
+        state['built_at'] = now
+        
+        results = sorted(state['entries'].values(), key=lambda data: data['start_time'])[:settings.FEATURED_EVENTS_LIMIT]
+        payload = FastJSONRenderer().render({'generated_at': now.isoformat(), 'results': results})
+        
+        timeout = settings.FEATURED_EVENTS_TIMEOUT
+        cache.set(FeaturedEventsService.STATE_KEY, state, timeout)
+        cache.set(FeaturedEventsService.PAYLOAD_KEY, payload, timeout)
+        return payload
+
+
+class EventAvailabilityService:
+    """
+    Birden çok etkinliğin kapasite durumunu tek sorguda döndüren servis.
+    
+    Koltuk seçici ve takvim gibi bileşenler onlarca etkinliğin durumunu aynı anda ister;
+    etkinlik başına detay isteği yerine tüm id'ler tek bir gruplanmış aggregate sorgusuyla
+    (Event.objects.with_capacity()) hesaplanır.
+    """
+
+    CACHE_KEY = 'events:availability:{}'
+
+    @staticmethod
+    def get_availability(event_ids: List[int], cached: bool = False) -> List[dict]:
+        """
+        Verilen etkinliklerin kapasite durumunu istek sırasıyla döndürür.
+        
+        Args:
+            event_ids: Etkinlik ID'leri (bulunamayanlar sonuçta yer almaz)
+            cached: True ise EVENT_AVAILABILITY_CACHE_TIMEOUT saniyeye kadar eski değerler kabul edilir
+        
+        Returns:
+            {id, capacity, held, confirmed, available} sözlüklerinin listesi
+        """
+        results = {}
+        if cached:
+            keys = {EventAvailabilityService.CACHE_KEY.format(event_id): event_id for event_id in event_ids}
+            results = {keys[key]: value for key, value in cache.get_many(keys).items()}
+        
+        missing = [event_id for event_id in event_ids if event_id not in results]
+        if missing:
+            rows = Event.objects.filter(id__in=missing).order_by().with_capacity().values(
+                'id', 'capacity', 'end_time', 'inventory_shards', *CAPACITY_ANNOTATIONS
+            )
+            fresh = {}
+            for row in rows:
+                snapshot = CapacitySnapshot.from_values(
+                    row['capacity'], row['end_time'], row['inventory_shards'],
+                    **{name: row[name] for name in CAPACITY_ANNOTATIONS}
+                )
+                fresh[row['id']] = {
+                    'id': row['id'],
+                    'capacity': row['capacity'],
+                    'held': snapshot.held,
+                    'confirmed': snapshot.confirmed,
+                    'available': snapshot.available,
+                }
+            results.update(fresh)
+            if cached and fresh:
+                cache.set_many(
+                    {EventAvailabilityService.CACHE_KEY.format(event_id): data for event_id, data in fresh.items()},
+                    settings.EVENT_AVAILABILITY_CACHE_TIMEOUT
+                )
+        
+        return [results[event_id] for event_id in event_ids if event_id in results]
+
+
+class EventChangeService:
+    """
+    Değişiklik günlüğü (EventChange) üzerinden delta senkronizasyonu.
+    
+    İstemci son aldığı cursor'dan sonra değişen etkinlik ID'lerini alır; maliyet katalog
+    boyutuna değil değişiklik sayısına bağlıdır. ID'ler commit sırasına göre değil ekleme
+    sırasına göre verildiğinden, cursor sadece EVENT_CHANGES_LAG_SECONDS saniyeden eski
+    kayıtlara kadar ilerletilir; bu süre içinde commit edilen daha küçük ID'li kayıtlar
+    bir sonraki istekte kaçırılmaz (son kayıtlar tekrar gelebilir, istemci upsert yapar).
+    """
+
+    @staticmethod
+    def _safe_before():
+        return timezone.now() - timedelta(seconds=settings.EVENT_CHANGES_LAG_SECONDS)
+
+    @staticmethod
+    def current_cursor() -> int:
+        """Tam liste indirmeden önce alınacak başlangıç cursor'ı."""
+        cursor = EventChange.objects.filter(
+            created_at__lte=EventChangeService._safe_before()
+        ).order_by('-id').values_list('id', flat=True).first()
+        # Silinmiş aralığın altındaki bir cursor hemen süresi dolmuş sayılırdı
+        return max(cursor or 0, EventChangePurge.boundary())
+
+    @staticmethod
+    def changes_since(since: int, limit: Optional[int] = None):
+        """
+        Cursor'dan sonra değişen etkinlikleri döndürür.
+        
+        Args:
+            since: İstemcinin son cursor'ı
+            limit: En fazla okunacak günlük kaydı (varsayılan EVENT_CHANGES_PAGE_SIZE)
+        
+        Returns:
+            (event_ids, cursor, has_more): değişen etkinlik ID'leri (ilk değişiklik sırasıyla),
+            bir sonraki istekte kullanılacak cursor ve sayfanın dolup dolmadığı
+        
+        Raises:
+            CursorExpiredError: Cursor'dan sonraki kayıtlar silinmişse (istemci tam listeyi yeniden indirmeli)
+        """
+        limit = limit or settings.EVENT_CHANGES_PAGE_SIZE
+        # Sadece gerçekten silinmiş kayıtlar sayılır; ID boşlukları (geri alınan transaction'lar) değil
+        if since < EventChangePurge.boundary():
+            raise CursorExpiredError()
+        
+        rows = list(
+            EventChange.objects.filter(id__gt=since).order_by('id').values_list('id', 'event_id', 'created_at')[:limit]
+        )
+        safe_before = EventChangeService._safe_before()
+        cursor = since
+        for change_id, _, created_at in rows:
+            if created_at > safe_before:
+                break
+            cursor = change_id
+        
+        event_ids = list(dict.fromkeys(event_id for _, event_id, _ in rows))
+        # Cursor ilerlemediyse (sayfadaki tüm kayıtlar çok yeni) hemen tekrar istemenin anlamı yoktur
+        return event_ids, cursor, len(rows) == limit and cursor > since
+
+    @staticmethod
+    def purge(batch_size: int = 5000) -> int:
+        """
+        EVENT_CHANGES_RETENTION_HOURS saatten eski günlük kayıtlarını parça parça siler.
+        
+        Her parça silinmeden önce aynı transaction içinde silinen en büyük ID EventChangePurge'a
+        yazılır; changes_since() bu sınırın altındaki cursor'ları süresi dolmuş olarak tanır.
+        En yeni kayıt her zaman korunur.
+        
+        Returns:
+            Silinen kayıt sayısı
+        """
+        cutoff = timezone.now() - timedelta(hours=settings.EVENT_CHANGES_RETENTION_HOURS)
+        last_id = EventChange.objects.order_by('-id').values_list('id', flat=True).first()
+        if last_id is None:
+            return 0
+        EventChangePurge.objects.get_or_create(pk=1)
+        
+        deleted = 0
+        while True:
+            # Eski kayıtlar tablonun başında olduğundan birincil anahtar sırasıyla okunur
+            ids = list(
+                EventChange.objects.filter(created_at__lt=cutoff, id__lt=last_id)
+                .order_by('id').values_list('id', flat=True)[:batch_size]
+            )
+            if not ids:
+                return deleted
+            with transaction.atomic():
+                EventChangePurge.objects.filter(pk=1).update(
+                    max_purged_id=Greatest(F('max_purged_id'), Value(ids[-1]))
+                )
+                deleted += EventChange.objects.filter(id__in=ids).delete()[0]
+
+
+class EventCalendarService:
+    """
+    Takvim görünümü için gün başına etkinlik sayısı, toplam kapasite ve toplam kalan kapasite.
+    
+    Özetler tek bir gruplanmış sorguyla hesaplanır (EventQuerySet.daily_availability).
+    Geçmiş günlerin özetleri EVENT_CALENDAR_CACHE_TIMEOUT boyunca önbellekte tutulur; sadece
+    bugün ve sonraki günler her istekte yeniden hesaplanır. Bir etkinlik kaydedildiğinde veya
+    silindiğinde (events/signals.py) ve rezervasyon iptalinde etkinliğin günü önbellekten silinir.
+    QuerySet.update() ile yapılan değişiklikler ve geçmiş günlerde süresi dolan HOLD'lar
+    en geç EVENT_CALENDAR_CACHE_TIMEOUT sonra yansır.
+    """
+
+    CACHE_KEY = 'events:calendar:{timezone}:{day}'
+
+    @staticmethod
+    def _delete_days(start_times) -> None:
+        """Başlangıç zamanlarının günlerine ait özetleri geçerli ve varsayılan saat dilimi için siler."""
+        timezones = {timezone.get_current_timezone(), timezone.get_default_timezone()}
+        cache.delete_many([
+            EventCalendarService.CACHE_KEY.format(
+                timezone=current_timezone, day=timezone.localdate(start_time, current_timezone).isoformat()
+            )
+            for start_time in start_times if start_time is not None
+            for current_timezone in timezones
+        ])
+
+    @staticmethod
+    def invalidate(*start_times) -> None:
+        """
+        Verilen başlangıç zamanlarının günlerine ait önbellekteki özetleri transaction commit
+        edildikten sonra siler (None değerler atlanır).
+        """
+        transaction.on_commit(lambda: EventCalendarService._delete_days(start_times))
+
+    @staticmethod
+    def invalidate_event(event_id: int) -> None:
+        """
+        Etkinliğin gününe ait özeti commit sonrasında siler. Başlangıç zamanı da commit sonrasında
+        okunur; çağıran transaction'a sorgu eklenmez.
+        """
+        transaction.on_commit(lambda: EventCalendarService._delete_days(
+            Event.objects.filter(pk=event_id).values_list('start_time', flat=True)
+        ))
+
+    @staticmethod
+    def get_calendar(start: date, end: date) -> List[dict]:
+        """
+        Aktif etkinliklerin [start, end] aralığındaki günlük özetlerini döndürür.
+        Günler geçerli saat dilimine göre belirlenir; etkinliği olmayan günler sıfırla döner.
+        
+        Returns:
+            {date, events, capacity, available} sözlüklerinin gün sırasıyla listesi
+        """
+        current_timezone = timezone.get_current_timezone()
+        today = timezone.localdate()
+        days = [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+        
+        past_keys = {
+            EventCalendarService.CACHE_KEY.format(timezone=current_timezone, day=day.isoformat()): day
+            for day in days if day < today
+        }
+        rollups = {past_keys[key]: value for key, value in cache.get_many(past_keys).items()}
+        missing = [day for day in days if day not in rollups]
         
-        return expired_count
+        if missing:
+            # Önbellekte olmayan ilk günden aralık sonuna kadar tek sorgu
+            rows = Event.objects.filter(
+                is_active=True,
+                start_time__gte=timezone.make_aware(datetime.combine(missing[0], time.min)),
+                start_time__lt=timezone.make_aware(datetime.combine(end + timedelta(days=1), time.min)),
+            ).daily_availability()
+            fresh = {
+                row['day']: {'events': row['events'], 'capacity': row['capacity'], 'available': row['available']}
+                for row in rows
+            }
+            for day in missing:
+                rollups[day] = fresh.get(day, {'events': 0, 'capacity': 0, 'available': 0})
+            cache.set_many(
+                {key: rollups[day] for key, day in past_keys.items() if day in missing},
+                settings.EVENT_CALENDAR_CACHE_TIMEOUT
+            )
+        
+        return [{'date': day, **rollups[day]} for day in days]
+
+
+class EventSalesService:
+    """
+    Satış hızı zaman serileri; sadece EventSalesRollup dakikalık sayaçlarından okunur.
+    
+    Rezervasyon tablosu taranmaz: bir etkinliğin bir günlük serisi en fazla
+    1440 x EVENT_SALES_ROLLUP_SHARDS satırın gruplanmasıdır.
+    """
+
+    @staticmethod
+    def _totals(queryset):
+        return queryset.annotate(**{
+            f'{name}_total': Sum(name) for name in EventSalesRollup.COUNTERS
+        })
+
+    @staticmethod
+    def _counters(row: dict) -> dict:
+        return {name: row[f'{name}_total'] or 0 for name in EventSalesRollup.COUNTERS}
+
+    @staticmethod
+    def series(event_id: int, start, end) -> dict:
+        """
+        Etkinliğin [start, end) aralığındaki dakikalık sayaçlarını ve toplamlarını döndürür.
+        Hareket olmayan dakikalar seride yer almaz.
+        """
+        rows = EventSalesService._totals(
+            EventSalesRollup.objects.filter(event_id=event_id, minute__gte=start, minute__lt=end)
+            .order_by().values('minute')
+        ).order_by('minute')
+        results = [{'minute': row['minute'], **EventSalesService._counters(row)} for row in rows]
+        totals = {
+            name: sum(minute[name] for minute in results) for name in EventSalesRollup.COUNTERS
+        }
+        return {'event_id': event_id, 'from': start, 'to': end, 'totals': totals, 'results': results}
 
+    @staticmethod
+    def top_events(start, end, limit: int) -> List[dict]:
+        """
+        [start, end) aralığında en çok onay alan etkinlikleri toplam sayaçlarıyla döndürür.
+        """
+        rows = EventSalesService._totals(
+            EventSalesRollup.objects.filter(minute__gte=start, minute__lt=end)
+            .order_by().values('event_id', 'event__name')
+        ).order_by('-confirmed_total', '-held_total', 'event_id')[:limit]
+        return [
+            {'event_id': row['event_id'], 'name': row['event__name'], **EventSalesService._counters(row)}
+            for row in rows
+        ]
+
+
+class OutboxRelayService:
+    """
+    Outbox mesajlarını OUTBOX_SINKS hedeflerine iletir (relay_outbox görevi).
+    
+    Her partition ayrı transaction'larda işlenir: partition satırı SKIP LOCKED ile kilitlenir,
+    en eski mesajlar id sırasıyla iletilir ve aynı transaction içinde silinir. Başka bir relay'in
+    tuttuğu partition atlanır; böylece bir etkinliğin mesajları hep sırayla iletilir. Hedef hata
+    fırlatırsa transaction geri alınır ve mesajlar bir sonraki çalışmada tekrar iletilir
+    (en az bir kez teslim). ID'ler commit sırasına göre verilmediğinden OUTBOX_LAG_SECONDS
+    saniyeden yeni mesajlar bir sonraki çalışmaya bırakılır.
+    """
+
+    @staticmethod
+    def relay(batch_size: Optional[int] = None) -> int:
+        """
+        Bekleyen mesajları iletir.
+        
+        Returns:
+            İletilen mesaj sayısı
+        """
+        batch_size = batch_size or settings.OUTBOX_BATCH_SIZE
+        partitions = sorted(OutboxMessage.objects.order_by().values_list('partition', flat=True).distinct())
+        if not partitions:
+            return 0
+        OutboxPartition.objects.bulk_create(
+            [OutboxPartition(number=number) for number in partitions], ignore_conflicts=True
+        )
+        
+        sinks = get_sinks()
+        published = 0
+        for number in partitions:
+            while True:
+                count = OutboxRelayService._relay_batch(number, batch_size, sinks)
+                published += count
+                if count < batch_size:
+                    break
+        return published
+
+    @staticmethod
+    @transaction.atomic
+    def _relay_batch(partition: int, batch_size: int, sinks) -> int:
+        """
+        Partition'ın en eski mesajlarından bir grubu iletir ve siler.
+        Partition başka bir relay tarafından tutuluyorsa hiçbir şey yapmaz.
+        """
+        claimed = OutboxPartition.objects.select_for_update(skip_locked=True).filter(number=partition)
+        if not claimed.values_list('number', flat=True):
+            return 0
+        
+        safe_before = timezone.now() - timedelta(seconds=settings.OUTBOX_LAG_SECONDS)
+        messages = []
+        for message in OutboxMessage.objects.filter(partition=partition).order_by('id')[:batch_size]:
+            if message.created_at > safe_before:
+                break
+            messages.append({
+                'id': message.id,
+                'topic': message.topic,
+                'key': message.key,
+                'payload': message.payload,
+                'created_at': message.created_at.isoformat(),
+            })
+        if not messages:
+            return 0
+        
+        for sink in sinks:
+            sink.publish(messages)
+        OutboxMessage.objects.filter(id__in=[message['id'] for message in messages]).delete()
+        return len(messages)
+
+
+class WebhookDeliveryService:
+    """
+    Bekleyen webhook teslimlerini uç nokta başına gruplayarak gönderir (deliver_webhooks görevi).
+    
+    Zamanı gelmiş teslimler SKIP LOCKED ile alınıp WEBHOOK_LEASE_SECONDS süresince başka
+    çalışmalardan gizlenir; HTTP istekleri transaction dışında yapılır. Her abonelik ayrı bir
+    thread'de sırayla gönderilir, en fazla WEBHOOK_MAX_CONCURRENCY uç nokta paralel işlenir.
+    Bir istek başarısız olursa aynı uç noktanın kalan teslimleri sıranın korunması için
+    onunla birlikte ertelenir.
+    """
+
+    @staticmethod
+    def retry_delay(attempts: int) -> timedelta:
+        """Deneme sayısına göre artan bekleme süresi (en fazla 1 saat)."""
+        return timedelta(seconds=min(settings.WEBHOOK_RETRY_BASE_SECONDS * 2 ** (attempts - 1), 3600))
+
+    @staticmethod
+    def deliver_pending(limit: Optional[int] = None) -> int:
+        """
+        Zamanı gelmiş bekleyen teslimleri gönderir.
+        
+        Returns:
+            Başarıyla teslim edilen webhook sayısı
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            due = list(
+                WebhookDelivery.objects.select_for_update(skip_locked=True, of=('self',))
+                .filter(
+                    status=WebhookDelivery.Status.PENDING,
+                    next_attempt_at__lte=now,
+                    subscription__is_active=True
+                )
+                .select_related('subscription')
+                .order_by('id')[:limit or settings.WEBHOOK_BATCH_SIZE]
+            )
+            if not due:
+                return 0
+            WebhookDelivery.objects.filter(id__in=[delivery.id for delivery in due]).update(
+                next_attempt_at=now + timedelta(seconds=settings.WEBHOOK_LEASE_SECONDS)
+            )
+        
+        groups = {}
+        for delivery in due:
+            groups.setdefault(delivery.subscription_id, []).append(delivery)
+        
+        def send(deliveries):
+            subscription = deliveries[0].subscription
+            return send_batch(subscription.url, subscription.secret, [
+                {'id': delivery.message_id, 'topic': delivery.topic, 'payload': delivery.payload}
+                for delivery in deliveries
+            ])
+        
+        workers = min(settings.WEBHOOK_MAX_CONCURRENCY, len(groups))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='webhooks') as executor:
+            results = list(executor.map(send, groups.values()))
+        
+        now = timezone.now()
+        delivered = []
+        for deliveries, (sent, error) in zip(groups.values(), results):
+            delivered.extend(delivery.id for delivery in deliveries[:sent])
+            if error is None:
+                continue
+            failed = deliveries[sent]
+            failed.attempts += 1
+            failed.last_error = error
+            retry_at = now + WebhookDeliveryService.retry_delay(failed.attempts)
+            if failed.attempts >= settings.WEBHOOK_MAX_ATTEMPTS:
+                failed.status = WebhookDelivery.Status.FAILED
+            failed.next_attempt_at = retry_at
+            failed.save(update_fields=['attempts', 'last_error', 'status', 'next_attempt_at'])
+            WebhookDelivery.objects.filter(id__in=[delivery.id for delivery in deliveries[sent + 1:]]).update(
+                next_attempt_at=retry_at
+            )
+        
+        WebhookDelivery.objects.filter(id__in=delivered).update(
+            status=WebhookDelivery.Status.DELIVERED,
+            attempts=F('attempts') + 1,
+            last_error='',
+            delivered_at=now
+        )
+        return len(delivered)
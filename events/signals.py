@@ -0,0 +1,35 @@
+"""
+Events uygulaması için signal'ler.
+"""
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Event, EventChange
+from .services import EventCalendarService
+
+
+@receiver(pre_save, sender=Event)
+def remember_event_start(sender, instance, raw=False, **kwargs):
+    """Güncellenen etkinliğin eski başlangıç zamanını saklar (eski günün takvim özeti de silinir)."""
+    if not raw and instance.pk:
+        instance._previous_start_time = (
+            Event.objects.filter(pk=instance.pk).values_list('start_time', flat=True).first()
+        )
+
+
+@receiver(post_save, sender=Event)
+def record_event_save(sender, instance, raw=False, **kwargs):
+    """
+    Oluşturulan veya güncellenen etkinliği değişiklik günlüğüne yazar ve günün takvim özetini siler.
+    API ve admin üzerinden yapılan tüm kayıtları kapsar.
+    """
+    if not raw:
+        EventChange.record([instance.pk])
+        EventCalendarService.invalidate(instance.start_time, getattr(instance, '_previous_start_time', None))
+
+
+@receiver(post_delete, sender=Event)
+def record_event_delete(sender, instance, **kwargs):
+    """Silinen etkinliği değişiklik günlüğüne yazar (istemciler `deleted` listesinde görür)."""
+    EventChange.record([instance.pk])
+    EventCalendarService.invalidate(instance.start_time)
@@ -1,11 +1,29 @@
 """
 Events uygulaması için Celery görevleri.
+
+Görevlerin kuyrukları reservation_system/celery.py içinde yönlendirilir. Sık çalışan ve
+sonucu okunmayan görevler ignore_result=True ile tanımlanır; dönüş değerleri sadece
+worker loglarında görünür, result backend'e yazılmaz.
+
+Tek bir düğümde çalışması gereken görevler @single_leader ile korunur (bkz. core/locks.py);
+birden çok beat/cron aynı görevi tetiklese de kilidi alamayan çalışma atlanır ve None döner.
+relay_outbox ve deliver_webhooks işi SKIP LOCKED ile paylaştığı için paralel çalışabilir.
 """
 from celery import shared_task
-from events.services import ReservationService
+from core.locks import single_leader
+from events import partitioning
+from events.models import Event
+from events.services import (
+    EventChangeService,
+    FeaturedEventsService,
+    OutboxRelayService,
+    ReservationService,
+    WebhookDeliveryService,
+)
 
 
-@shared_task(name='expire_old_hold_reservations')
+@shared_task(name='expire_old_hold_reservations', ignore_result=True)
+@single_leader('expire_old_hold_reservations')
 def expire_old_hold_reservations():
     """
     Süresi dolmuş HOLD rezervasyonları işaretlemek için periyodik görev.
@@ -24,3 +42,96 @@ def expire_old_hold_reservations():
     expired_count = ReservationService.expire_old_holds()
     return expired_count
 
+
+
+@shared_task(name='rebalance_inventory_buckets', ignore_result=True)
+@single_leader('rebalance_inventory_buckets')
+def rebalance_inventory_buckets():
+    """
+    Envanter kovalarına bölünmüş aktif etkinliklerin boş kapasitesini yeniden dengeler.
+    
+    Bazı kovalar kuruyup diğerlerinde boş kapasite kaldığında HOLD'ların
+    geri dönüş yoluna düşmesini önler. Süresi dolan HOLD'lardan iade edilen
+    miktarlar da bu sayede tüm kovalara yayılır.
+    
+    Returns:
+        Kovaları değişen etkinlik sayısı
+    """
+    event_ids = Event.objects.filter(
+        is_active=True,
+        inventory_shards__gt=0
+    ).values_list('id', flat=True)
+    
+    rebalanced = 0
+    for event_id in event_ids:
+        if ReservationService.rebalance_inventory(event_id):
+            rebalanced += 1
+    return rebalanced
+
+
+@shared_task(name='maintain_reservation_partitions')
+@single_leader('maintain_reservation_partitions')
+def maintain_reservation_partitions():
+    """
+    Partition'lı kurulumlarda gelecek aylar için rezervasyon partition'larını oluşturur.
+    
+    Tablo partition'lı değilse hiçbir şey yapmaz.
+    
+    Returns:
+        Mevcut aylık partition sayısı
+    """
+    return len(partitioning.ensure_monthly_partitions())
+
+
+@shared_task(name='build_featured_events', ignore_result=True)
+@single_leader('build_featured_events')
+def build_featured_events():
+    """
+    Ana sayfa öne çıkan etkinlik listesini önbellekte yeniden derler.
+    
+    Sadece son derlemeden beri değişen etkinlikler yeniden hesaplanır
+    (bkz. FeaturedEventsService.build).
+    
+    Returns:
+        Oluşturulan yanıt gövdesinin bayt cinsinden boyutu
+    """
+    return len(FeaturedEventsService.build())
+
+
+@shared_task(name='purge_event_changes')
+@single_leader('purge_event_changes')
+def purge_event_changes():
+    """
+    Saklama süresini (EVENT_CHANGES_RETENTION_HOURS) aşan etkinlik değişiklik kayıtlarını siler.
+    
+    Returns:
+        Silinen kayıt sayısı
+    """
+    return EventChangeService.purge()
+
+
+@shared_task(name='relay_outbox', ignore_result=True)
+def relay_outbox():
+    """
+    Rezervasyon durum değişikliği mesajlarını outbox'tan OUTBOX_SINKS hedeflerine iletir.
+    
+    Birden çok worker'da aynı anda çalışabilir; partition'lar SKIP LOCKED ile paylaşılır.
+    
+    Returns:
+        İletilen mesaj sayısı
+    """
+    return OutboxRelayService.relay()
+
+
+@shared_task(name='deliver_webhooks', ignore_result=True)
+def deliver_webhooks():
+    """
+    Zamanı gelmiş webhook teslimlerini iş ortaklarının uç noktalarına gönderir.
+    
+    Teslimler uç nokta başına gruplanır ve paylaşılan keep-alive bağlantılarla gönderilir
+    (bkz. WebhookDeliveryService.deliver_pending).
+    
+    Returns:
+        Başarıyla teslim edilen webhook sayısı
+    """
+    return WebhookDeliveryService.deliver_pending()
@@ -1,15 +1,49 @@
-from django.test import TestCase, TransactionTestCase
+from django.core.management import call_command
+from core.locks import LeaderLease
+from django.test import TestCase, TransactionTestCase, override_settings
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from django.core.exceptions import ValidationError
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Sum
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
-from datetime import timedelta
+from rest_framework_simplejwt.tokens import RefreshToken
+from datetime import datetime, time as dt_time, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+from unittest import mock, skipIf, skipUnless
+import json
 import threading
 import time
 
-from .models import Event, Reservation
-from .services import ReservationService
+from .models import (
+    Event,
+    EventChange,
+    EventChangePurge,
+    EventSalesRollup,
+    EventSalesSummary,
+    EventUserSummary,
+    InventoryBucket,
+    OutboxMessage,
+    Reservation,
+    WebhookDelivery,
+    WebhookSubscription,
+)
+from .outbox import InMemorySink, OutboxSink
+from .tasks import expire_old_hold_reservations
+from . import partitioning, webhooks
+from .serializers import EventSerializer, EventValuesSerializer, ReservationSerializer, ReservationValuesSerializer
+from .services import (
+    EventChangeService,
+    EventSalesService,
+    FeaturedEventsService,
+    OutboxRelayService,
+    ReservationService,
+    WebhookDeliveryService,
+)
 
 User = get_user_model()
 
@@ -165,6 +199,149 @@ class EventModelTestCase(TestCase):
         hold_count = self.event.get_hold_count()
         self.assertEqual(hold_count, 5)  # Sadece aktif HOLD sayıldı
 
+    def _create_mixed_reservations(self):
+        user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        Reservation.objects.create(
+            event=self.event,
+            user=user,
+            status=Reservation.Status.HOLD,
+            quantity=20,
+            expires_at=timezone.now() + timedelta(minutes=10)
+        )
+        Reservation.objects.create(
+            event=self.event,
+            user=user,
+            status=Reservation.Status.HOLD,
+            quantity=7,
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+        Reservation.objects.create(
+            event=self.event,
+            user=user,
+            status=Reservation.Status.CONFIRMED,
+            quantity=30
+        )
+    
+    def test_capacity_snapshot_single_query(self):
+        """Kapasite özetinin tek sorguyla hesaplanıp örnek üzerinde saklandığını test eder."""
+        self._create_mixed_reservations()
+        
+        with self.assertNumQueries(1):
+            snapshot = self.event.capacity_snapshot()
+            self.assertIs(self.event.capacity_snapshot(), snapshot)
+        
+        self.assertEqual((snapshot.held, snapshot.confirmed, snapshot.available), (20, 30, 50))
+        self.assertIsNotNone(snapshot.as_of)
+        with self.assertRaises(AttributeError):
+            snapshot.available = 0
+    
+    def test_capacity_snapshot_refresh(self):
+        """refresh=True ile özetin yeniden hesaplandığını test eder."""
+        self.assertEqual(self.event.capacity_snapshot().available, 100)
+        self._create_mixed_reservations()
+        
+        self.assertEqual(self.event.capacity_snapshot().available, 100)
+        self.assertEqual(self.event.capacity_snapshot(refresh=True).available, 50)
+    
+    def test_capacity_snapshot_uses_queryset_annotations(self):
+        """with_capacity() anotasyonlarıyla özet için ek sorgu atılmadığını test eder."""
+        self._create_mixed_reservations()
+        Event.objects.create(
+            name='Other Event',
+            capacity=10,
+            start_time=timezone.now() + timedelta(days=2),
+            end_time=timezone.now() + timedelta(days=2, hours=3)
+        )
+        
+        with self.assertNumQueries(1):
+            snapshots = {event.name: event.capacity_snapshot() for event in Event.objects.with_capacity()}
+        
+        self.assertEqual(snapshots['Test Event'].available, 50)
+        self.assertEqual(snapshots['Other Event'].available, 10)
+    
+    def test_with_capacity_count_skips_reservations(self):
+        """with_capacity() sorgusunun COUNT'unun rezervasyonlara gitmediğini ve gruplama yapılmadığını test eder."""
+        self._create_mixed_reservations()
+        queryset = Event.objects.with_capacity()
+        
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(queryset.count(), 1)
+        
+        sql = queries.captured_queries[0]['sql']
+        self.assertNotIn('"reservations"', sql)
+        self.assertIsNone(queryset.query.group_by)
+
+
+class ReservationTransitionTestCase(TestCase):
+    """
+    Reservation durum geçişleri için unit testler.
+    """
+    
+    def setUp(self):
+        """Her test metodundan önce test verilerini hazırlar."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.event = Event.objects.create(
+            name='Test Event',
+            capacity=100,
+            start_time=timezone.now() + timedelta(days=1),
+            end_time=timezone.now() + timedelta(days=1, hours=3)
+        )
+        self.reservation = Reservation.objects.create(
+            event=self.event,
+            user=self.user,
+            status=Reservation.Status.HOLD,
+            quantity=5,
+            expires_at=timezone.now() + timedelta(minutes=5)
+        )
+    
+    def _set_columns(self, sql):
+        """UPDATE ifadesinin SET kısmındaki sütun adlarını döndürür."""
+        assignments = sql.split(' SET ', 1)[1].split(' WHERE ', 1)[0]
+        return {assignment.split(' = ')[0].strip('"') for assignment in assignments.split(', ')}
+    
+    def test_transition_writes_only_transition_fields(self):
+        """Geçişin sadece status, expires_at ve updated_at yazdığını test eder."""
+        with CaptureQueriesContext(connection) as queries:
+            applied = self.reservation.transition_to(Reservation.Status.CONFIRMED, expires_at=None)
+        
+        self.assertTrue(applied)
+        self.assertEqual(len(queries.captured_queries), 1)
+        self.assertEqual(
+            self._set_columns(queries.captured_queries[0]['sql']),
+            {'status', 'expires_at', 'updated_at'}
+        )
+        self.assertEqual(self.reservation.status, Reservation.Status.CONFIRMED)
+        self.assertIsNone(self.reservation.expires_at)
+    
+    def test_invalid_transition_rejected(self):
+        """Tabloda olmayan geçişin reddedildiğini test eder."""
+        Reservation.objects.filter(id=self.reservation.id).update(status=Reservation.Status.EXPIRED)
+        self.reservation.refresh_from_db()
+        
+        with self.assertRaises(ValidationError):
+            self.reservation.transition_to(Reservation.Status.CONFIRMED)
+    
+    def test_stale_transition_not_applied(self):
+        """Durum bu arada değiştiyse geçişin uygulanmadığını test eder."""
+        Reservation.objects.filter(id=self.reservation.id).update(status=Reservation.Status.CANCELLED)
+        
+        self.assertFalse(self.reservation.transition_to(Reservation.Status.CONFIRMED, expires_at=None))
+        self.reservation.refresh_from_db()
+        self.assertEqual(self.reservation.status, Reservation.Status.CANCELLED)
+    
+    def test_transition_rejects_other_fields(self):
+        """Geçişlerin quantity gibi diğer alanları yazamadığını test eder."""
+        with self.assertRaises(ValueError):
+            self.reservation.transition_to(Reservation.Status.CONFIRMED, quantity=10)
+
 
 class ReservationServiceTestCase(TestCase):
     """
@@ -320,10 +497,28 @@ class ReservationServiceTestCase(TestCase):
         
         self.assertIn('expired', str(context.exception))
         
-        # Not: Exception nedeniyle transaction rollback olduğu için durum değişikliği geri alınır.
-        # Önemli olan exception'ın fırlatılmasıdır.
-        # Süre dolmasını doğrulamak için expire_old_holds() metodunu kullanın.
-        # Bu test, süresi dolmuş rezervasyonların onaylanamayacağını doğrular.
+        # Süre dolma geçişi exception'dan önce kalıcı olarak yazılır
+        reservation.refresh_from_db()
+        self.assertEqual(reservation.status, Reservation.Status.EXPIRED)
+    
+    def test_confirm_reservation_expiring_during_confirm(self):
+        """Kontrolden sonra, UPDATE'ten önce süresi dolan HOLD'un onaylanmadığını test eder."""
+        reservation = ReservationService.create_hold_reservation(self.event.id, self.user.id, 5)
+        capacity_snapshot = Event.capacity_snapshot
+        
+        def expire_then_snapshot(event, *args, **kwargs):
+            # Süre kontrolü geçildikten sonra HOLD'un süresi dolar
+            Reservation.objects.filter(id=reservation.id).update(expires_at=timezone.now() - timedelta(seconds=1))
+            return capacity_snapshot(event, *args, **kwargs)
+        
+        with mock.patch.object(Event, 'capacity_snapshot', autospec=True, side_effect=expire_then_snapshot):
+            with self.assertRaises(ValidationError) as context:
+                ReservationService.confirm_reservation(reservation.id, self.user.id)
+        
+        self.assertIn('expired', str(context.exception))
+        reservation.refresh_from_db()
+        self.assertEqual(reservation.status, Reservation.Status.EXPIRED)
+        self.assertEqual(self.event.capacity_snapshot(refresh=True).confirmed, 0)
     
     def test_confirm_reservation_insufficient_capacity(self):
         """Kapasite yetersiz hale geldiğinde rezervasyon onaylamayı test eder."""
@@ -409,6 +604,136 @@ class ReservationServiceTestCase(TestCase):
         
         self.assertIn('Cannot cancel', str(context.exception))
     
+    def test_cancel_reservation_after_expiry(self):
+        """Süre dolma ile yarışan iptalin eski durumu ezmediğini test eder."""
+        reservation = Reservation.objects.create(
+            event=self.event,
+            user=self.user,
+            status=Reservation.Status.HOLD,
+            quantity=5,
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+        ReservationService.expire_old_holds()
+        
+        with self.assertRaises(ValidationError) as context:
+            ReservationService.cancel_reservation(
+                reservation_id=reservation.id,
+                user_id=self.user.id
+            )
+        
+        self.assertIn('Cannot cancel', str(context.exception))
+        reservation.refresh_from_db()
+        self.assertEqual(reservation.status, Reservation.Status.EXPIRED)
+    
+    def test_cancel_reservation_single_conditional_update(self):
+        """İptalin tek bir koşullu UPDATE ... RETURNING ile yapıldığını test eder."""
+        reservation = Reservation.objects.create(
+            event=self.event,
+            user=self.user,
+            status=Reservation.Status.HOLD,
+            quantity=5,
+            expires_at=timezone.now() + timedelta(minutes=10)
+        )
+        
+        with CaptureQueriesContext(connection) as queries:
+            ReservationService.cancel_reservation(
+                reservation_id=reservation.id,
+                user_id=self.user.id
+            )
+        
+        reservation_statements = [
+            query['sql'] for query in queries.captured_queries
+            if '"reservations"' in query['sql']
+        ]
+        self.assertEqual(len(reservation_statements), 1)
+        self.assertIn('UPDATE "reservations"', reservation_statements[0])
+        self.assertIn('RETURNING', reservation_statements[0])
+        self.assertIn('"user_id"', reservation_statements[0])
+        self.assertFalse(any(query['sql'].startswith('SELECT') for query in queries.captured_queries))
+    
+    def test_cancel_confirmed_reservation_single_update(self):
+        """Onaylı rezervasyon iptalinin de tek UPDATE ile yapılıp onaylı miktarı özetten düştüğünü test eder."""
+        hold = ReservationService.create_hold_reservation(self.event.id, self.user.id, 4)
+        ReservationService.confirm_reservation(hold.id, self.user.id)
+        
+        with CaptureQueriesContext(connection) as queries:
+            reservation = ReservationService.cancel_reservation(hold.id, self.user.id)
+        
+        reservation_statements = [
+            query['sql'] for query in queries.captured_queries if '"reservations"' in query['sql']
+        ]
+        self.assertEqual(len(reservation_statements), 1)
+        self.assertEqual(reservation.previous_status, Reservation.Status.CONFIRMED)
+        self.assertEqual(reservation.status, Reservation.Status.CANCELLED)
+        summary = EventUserSummary.objects.get(event=self.event, user=self.user)
+        self.assertEqual((summary.held_quantity, summary.confirmed_quantity), (0, 0))
+    
+    def test_transition_rejects_related_filters(self):
+        """transition()'ın ilişkili tablo filtrelerini reddettiğini test eder."""
+        with self.assertRaises(ValueError):
+            Reservation.objects.filter(event__name='Test Event').transition(
+                Reservation.Status.CANCELLED,
+                from_statuses=[Reservation.Status.HOLD]
+            )
+    
+    def test_create_hold_reservation_per_user_limit(self):
+        """Kullanıcı başına limitin aşılamadığını test eder."""
+        self.event.max_per_user = 4
+        self.event.save()
+        
+        ReservationService.create_hold_reservation(event_id=self.event.id, user_id=self.user.id, quantity=3)
+        
+        with self.assertRaises(ValidationError) as context:
+            ReservationService.create_hold_reservation(event_id=self.event.id, user_id=self.user.id, quantity=2)
+        
+        self.assertIn('Per-user limit exceeded', str(context.exception))
+    
+    def test_per_user_limit_released_on_cancel(self):
+        """İptal edilen miktarın kullanıcı limitinden düşüldüğünü test eder."""
+        self.event.max_per_user = 4
+        self.event.save()
+        
+        reservation = ReservationService.create_hold_reservation(
+            event_id=self.event.id, user_id=self.user.id, quantity=4
+        )
+        ReservationService.confirm_reservation(reservation.id, self.user.id)
+        ReservationService.cancel_reservation(reservation.id, self.user.id)
+        
+        ReservationService.create_hold_reservation(event_id=self.event.id, user_id=self.user.id, quantity=4)
+    
+    def test_per_user_limit_ignores_lapsed_holds(self):
+        """Süresi dolmuş ama henüz taranmamış HOLD'ların kullanıcı limitine sayılmadığını test eder."""
+        self.event.max_per_user = 4
+        self.event.save()
+        
+        lapsed = ReservationService.create_hold_reservation(
+            event_id=self.event.id, user_id=self.user.id, quantity=4
+        )
+        Reservation.objects.filter(id=lapsed.id).update(expires_at=timezone.now() - timedelta(minutes=1))
+        
+        ReservationService.create_hold_reservation(event_id=self.event.id, user_id=self.user.id, quantity=4)
+        
+        lapsed.refresh_from_db()
+        self.assertEqual(lapsed.status, Reservation.Status.EXPIRED)
+        self.assertEqual(EventUserSummary.objects.get(event=self.event, user=self.user).held_quantity, 4)
+    
+    def test_user_summary_follows_transitions(self):
+        """Kullanıcı özet satırının tüm geçişlerle güncellendiğini test eder."""
+        confirmed = ReservationService.create_hold_reservation(
+            event_id=self.event.id, user_id=self.user.id, quantity=3
+        )
+        ReservationService.confirm_reservation(confirmed.id, self.user.id)
+        expired = ReservationService.create_hold_reservation(
+            event_id=self.event.id, user_id=self.user.id, quantity=2
+        )
+        Reservation.objects.filter(id=expired.id).update(expires_at=timezone.now() - timedelta(minutes=1))
+        ReservationService.expire_old_holds()
+        ReservationService.create_hold_reservation(event_id=self.event.id, user_id=self.user.id, quantity=1)
+        
+        summary = EventUserSummary.objects.get(event=self.event, user=self.user)
+        self.assertEqual(summary.held_quantity, 1)
+        self.assertEqual(summary.confirmed_quantity, 3)
+    
     def test_expire_old_holds(self):
         """Eski HOLD rezervasyonlarını süresi dolmuş olarak işaretlemeyi test eder."""
         # Süresi dolmuş HOLD oluştur
@@ -441,6 +766,219 @@ class ReservationServiceTestCase(TestCase):
         # Aktif rezervasyonun hala HOLD olduğunu doğrula
         active_reservation.refresh_from_db()
         self.assertEqual(active_reservation.status, Reservation.Status.HOLD)
+    
+    def test_expiry_runs_on_one_node_at_a_time(self):
+        """Liderlik kilidi başka bir düğümdeyken görevin ve komutun atlandığını test eder."""
+        cache.clear()
+        Reservation.objects.create(
+            event=self.event, user=self.user, quantity=1, expires_at=timezone.now() - timedelta(minutes=1)
+        )
+        
+        with LeaderLease('expire_old_hold_reservations') as acquired:
+            self.assertTrue(acquired)
+            self.assertIsNone(expire_old_hold_reservations())
+            out = StringIO()
+            call_command('expire_holds', stdout=out)
+            self.assertIn('skipped', out.getvalue())
+            self.assertEqual(Reservation.objects.filter(status=Reservation.Status.HOLD).count(), 1)
+        
+        self.assertEqual(expire_old_hold_reservations(), 1)
+        self.assertEqual(LeaderLease.stats('expire_old_hold_reservations')['skipped'], 2)
+
+
+class InventoryBucketTestCase(TestCase):
+    """
+    Envanter kovalarına bölünmüş etkinlikler için unit testler.
+    """
+    
+    def setUp(self):
+        """Her test metodundan önce test verilerini hazırlar."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        
+        self.event = Event.objects.create(
+            name='Sharded Event',
+            description='Test Description',
+            capacity=100,
+            start_time=timezone.now() + timedelta(days=1),
+            end_time=timezone.now() + timedelta(days=1, hours=3),
+            is_active=True,
+            inventory_shards=4
+        )
+        ReservationService.rebalance_inventory(self.event.id)
+    
+    def test_rebalance_creates_buckets(self):
+        """Kapasitenin kovalara eşit dağıtıldığını test eder."""
+        buckets = list(self.event.inventory_buckets.all())
+        
+        self.assertEqual(len(buckets), 4)
+        self.assertEqual([bucket.capacity for bucket in buckets], [25, 25, 25, 25])
+        self.assertEqual(self.event.get_available_capacity(), 100)
+    
+    def test_hold_reserves_from_bucket(self):
+        """HOLD'un bir kovadan miktar ayırdığını test eder."""
+        reservation = ReservationService.create_hold_reservation(
+            event_id=self.event.id,
+            user_id=self.user.id,
+            quantity=5
+        )
+        
+        self.assertIsNotNone(reservation.bucket_id)
+        bucket = InventoryBucket.objects.get(id=reservation.bucket_id)
+        self.assertEqual(bucket.reserved, 5)
+        self.assertEqual(self.event.get_available_capacity(), 95)
+    
+    def test_cancel_returns_quantity_to_bucket(self):
+        """İptalin miktarı aynı kovaya iade ettiğini test eder."""
+        reservation = ReservationService.create_hold_reservation(
+            event_id=self.event.id,
+            user_id=self.user.id,
+            quantity=5
+        )
+        ReservationService.confirm_reservation(reservation.id, self.user.id)
+        ReservationService.cancel_reservation(reservation.id, self.user.id)
+        
+        bucket = InventoryBucket.objects.get(id=reservation.bucket_id)
+        self.assertEqual(bucket.reserved, 0)
+        self.assertEqual(self.event.get_available_capacity(), 100)
+    
+    def test_expire_returns_quantity_to_bucket(self):
+        """Süresi dolan HOLD'un miktarı kovaya iade ettiğini test eder."""
+        reservation = ReservationService.create_hold_reservation(
+            event_id=self.event.id,
+            user_id=self.user.id,
+            quantity=5
+        )
+        Reservation.objects.filter(id=reservation.id).update(
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+        
+        self.assertEqual(ReservationService.expire_old_holds(), 1)
+        
+        reservation.refresh_from_db()
+        self.assertEqual(reservation.status, Reservation.Status.EXPIRED)
+        self.assertEqual(InventoryBucket.objects.get(id=reservation.bucket_id).reserved, 0)
+    
+    def test_hold_larger_than_bucket_triggers_rebalance(self):
+        """Tek kova yetmediğinde kapasitenin yeniden dengelendiğini test eder."""
+        reservation = ReservationService.create_hold_reservation(
+            event_id=self.event.id,
+            user_id=self.user.id,
+            quantity=40
+        )
+        
+        self.assertEqual(InventoryBucket.objects.get(id=reservation.bucket_id).reserved, 40)
+        self.assertEqual(self.event.get_available_capacity(), 60)
+    
+    def test_hold_insufficient_capacity_across_buckets(self):
+        """Toplam boş kapasite yetmediğinde HOLD'un reddedildiğini test eder."""
+        with self.assertRaises(ValidationError) as context:
+            ReservationService.create_hold_reservation(
+                event_id=self.event.id,
+                user_id=self.user.id,
+                quantity=101
+            )
+        
+        self.assertIn('Insufficient capacity', str(context.exception))
+    
+    def test_rebalance_accounts_for_unbucketed_reservations(self):
+        """Sharding öncesi rezervasyonların dağıtılabilir kapasiteden düşüldüğünü test eder."""
+        Reservation.objects.create(
+            event=self.event,
+            user=self.user,
+            status=Reservation.Status.CONFIRMED,
+            quantity=20
+        )
+        ReservationService.rebalance_inventory(self.event.id)
+        
+        self.assertEqual(self.event.get_available_capacity(), 80)
+
+
+class ReservationArchiveTestCase(TestCase):
+    """
+    Bitmiş etkinliklerin arşivlenmesi için testler.
+    """
+    
+    def setUp(self):
+        """Bitmiş ve devam eden etkinlikleri hazırlar."""
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.ended_event = Event.objects.create(
+            name='Ended Event',
+            capacity=100,
+            start_time=timezone.now() - timedelta(days=40, hours=3),
+            end_time=timezone.now() - timedelta(days=40)
+        )
+        self.upcoming_event = Event.objects.create(
+            name='Upcoming Event',
+            capacity=100,
+            start_time=timezone.now() + timedelta(days=1),
+            end_time=timezone.now() + timedelta(days=1, hours=3)
+        )
+        for event in (self.ended_event, self.upcoming_event):
+            Reservation.objects.create(event=event, user=self.user, status=Reservation.Status.CONFIRMED, quantity=7)
+            Reservation.objects.create(event=event, user=self.user, status=Reservation.Status.CANCELLED, quantity=2)
+    
+    def test_archive_summarizes_and_purges_ended_events(self):
+        """Bitmiş etkinliklerin özetlenip rezervasyonlarının silindiğini test eder."""
+        call_command('archive_reservations', '--purge', stdout=StringIO())
+        
+        summary = EventSalesSummary.objects.get(event=self.ended_event)
+        self.assertEqual(summary.reservation_count, 2)
+        self.assertEqual(summary.confirmed_quantity, 7)
+        self.assertEqual(summary.cancelled_quantity, 2)
+        self.assertFalse(Reservation.objects.filter(event=self.ended_event).exists())
+        
+        # Devam eden etkinlik etkilenmez
+        self.assertFalse(EventSalesSummary.objects.filter(event=self.upcoming_event).exists())
+        self.assertEqual(Reservation.objects.filter(event=self.upcoming_event).count(), 2)
+    
+    def test_archived_event_confirmed_count_from_summary(self):
+        """Arşivlenmiş etkinliğin onaylı sayısının özetten okunduğunu test eder."""
+        call_command('archive_reservations', '--purge', stdout=StringIO())
+        
+        self.assertEqual(self.ended_event.get_confirmed_count(), 7)
+    
+    @skipIf(connection.vendor == 'postgresql', 'PostgreSQL dışındaki veritabanları için')
+    def test_partition_command_skips_without_postgres(self):
+        """PostgreSQL dışındaki veritabanlarında partition komutunun atlandığını test eder."""
+        out = StringIO()
+        call_command('partition_reservations', stdout=out)
+        
+        self.assertIn('only supported on PostgreSQL', out.getvalue())
+    
+    @skipUnless(connection.vendor == 'postgresql', 'Partitioning sadece PostgreSQL üzerinde desteklenir')
+    def test_partition_conversion_and_detach(self):
+        """Aylık partition'lara dönüştürmeyi, indeks adlarını ve arşiv partition'larının ayrılmasını test eder."""
+        created_at = timezone.now() - timedelta(days=70)
+        Reservation.objects.filter(event=self.ended_event).update(created_at=created_at)
+        
+        self.assertTrue(partitioning.convert_to_partitioned(months_ahead=1))
+        self.assertTrue(partitioning.is_partitioned())
+        self.assertFalse(partitioning.convert_to_partitioned())
+        self.assertEqual(Reservation.objects.count(), 4)
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT indexname FROM pg_indexes WHERE tablename = %s', [Reservation._meta.db_table])
+            index_names = {row[0] for row in cursor.fetchall()}
+        self.assertLessEqual({index.name for index in Reservation._meta.indexes}, index_names)
+        
+        # Tek satır geçişleri ve yeni kayıtlar partition'lı tabloda çalışır
+        confirmed = Reservation.objects.get(event=self.upcoming_event, status=Reservation.Status.CONFIRMED)
+        self.assertTrue(confirmed.transition_to(Reservation.Status.CANCELLED))
+        ReservationService.create_hold_reservation(self.upcoming_event.id, self.user.id, 1)
+        
+        out = StringIO()
+        call_command('archive_reservations', '--detach', stdout=out)
+        
+        self.assertIn(f'reservations_archive_{created_at:%Y_%m}', out.getvalue())
+        self.assertFalse(Reservation.objects.filter(event=self.ended_event).exists())
+        self.assertEqual(Reservation.objects.filter(event=self.upcoming_event).count(), 3)
 
 
 class EventAPITestCase(APITestCase):
@@ -587,48 +1125,939 @@ class EventAPITestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['count'], 1)
         self.assertEqual(response.data['results'][0]['id'], inactive_event.id)
-
-
-class ReservationAPITestCase(APITestCase):
-    """
-    Reservation ViewSet için API testleri.
-    """
     
-    def setUp(self):
-        """Her test metodundan önce test verilerini hazırlar."""
-        self.client = APIClient()
-        self.reservations_url = '/api/reservations/'
-        
-        self.user = User.objects.create_user(
-            username='testuser',
-            email='test@example.com',
-            password='testpass123'
+    def test_search_events(self):
+        """?q= aramasının ad ve açıklamada eşleşen etkinlikleri döndürdüğünü test eder."""
+        Event.objects.create(
+            name='Jazz Night',
+            description='Live concert in the park',
+            capacity=50,
+            start_time=timezone.now() + timedelta(days=2),
+            end_time=timezone.now() + timedelta(days=2, hours=3)
         )
-        
-        self.other_user = User.objects.create_user(
-            username='otheruser',
-            email='other@example.com',
-            password='testpass123'
+        Event.objects.create(
+            name='Workshop',
+            capacity=20,
+            start_time=timezone.now() + timedelta(days=3),
+            end_time=timezone.now() + timedelta(days=3, hours=3)
         )
+        self.client.force_authenticate(user=self.user)
         
-        self.event = Event.objects.create(
-            name='Test Event',
-            description='Test Description',
-            capacity=100,
-            start_time=timezone.now() + timedelta(days=1),
-            end_time=timezone.now() + timedelta(days=1, hours=3),
-            is_active=True
-        )
+        response = self.client.get(self.events_url, {'q': 'jazz'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([event['name'] for event in response.data['results']], ['Jazz Night'])
+        
+        response = self.client.get(self.events_url, {'q': 'CONCERT'})
+        self.assertEqual([event['name'] for event in response.data['results']], ['Jazz Night'])
+        self.assertIn('available_capacity', response.data['results'][0])
+        
+        response = self.client.get(self.events_url, {'q': 'nothing-matches'})
+        self.assertEqual(response.data['count'], 0)
     
-    def test_create_hold_reservation_success(self):
-        """API üzerinden başarılı HOLD rezervasyon oluşturmayı test eder."""
+    def test_list_events_capacity_queries_do_not_scale(self):
+        """Etkinlik listesindeki kapasite alanlarının etkinlik başına sorgu atmadığını test eder."""
         self.client.force_authenticate(user=self.user)
+        with CaptureQueriesContext(connection) as single:
+            self.client.get(self.events_url)
+        
+        for i in range(5):
+            Event.objects.create(
+                name=f'Event {i}',
+                capacity=10,
+                start_time=timezone.now() + timedelta(days=2),
+                end_time=timezone.now() + timedelta(days=2, hours=3)
+            )
+        with CaptureQueriesContext(connection) as many:
+            response = self.client.get(self.events_url)
         
-        response = self.client.post(
-            f'{self.reservations_url}create_hold/',
-            {'event_id': self.event.id, 'quantity': 5},
-            format='json'
-        )
+        self.assertEqual(response.data['count'], 6)
+        self.assertEqual(len(many.captured_queries), len(single.captured_queries))
+    
+    def test_list_events_sparse_fields_skip_capacity(self):
+        """?fields= ile kapasite alanları istenmezse hesaplanmadığını test eder."""
+        self.client.force_authenticate(user=self.user)
+        
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.events_url, {'fields': 'id,name,start_time'})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data['results'][0]), {'id', 'name', 'start_time'})
+        select = queries.captured_queries[-1]['sql']
+        self.assertNotIn('reservations', select)
+        self.assertNotIn('"events"."description"', select)
+        
+        response = self.client.get(self.events_url, {'omit': 'description,hold_count'})
+        result = response.data['results'][0]
+        self.assertNotIn('description', result)
+        self.assertNotIn('hold_count', result)
+        self.assertEqual(result['available_capacity'], 100)
+        
+        response = self.client.get(f'{self.events_url}{self.event.id}/', {'fields': 'id,available_capacity'})
+        self.assertEqual(response.data, {'id': self.event.id, 'available_capacity': 100})
+    
+    def test_availability_batch(self):
+        """Birden çok etkinliğin kapasitesinin tek sorguda, istek sırasıyla döndüğünü test eder."""
+        other = Event.objects.create(
+            name='Other Event',
+            capacity=30,
+            start_time=timezone.now() + timedelta(days=2),
+            end_time=timezone.now() + timedelta(days=2, hours=3)
+        )
+        ReservationService.create_hold_reservation(self.event.id, self.user.id, 4)
+        confirmed = ReservationService.create_hold_reservation(self.event.id, self.user.id, 6)
+        ReservationService.confirm_reservation(confirmed.id, self.user.id)
+        self.client.force_authenticate(user=self.user)
+        
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                f'{self.events_url}availability/', {'ids': f'{other.id},{self.event.id},999999,{other.id}'}
+            )
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(queries.captured_queries), 1)
+        self.assertEqual(response.data['results'], [
+            {'id': other.id, 'capacity': 30, 'held': 0, 'confirmed': 0, 'available': 30},
+            {'id': self.event.id, 'capacity': 100, 'held': 4, 'confirmed': 6, 'available': 90},
+        ])
+    
+    def test_availability_validation(self):
+        """Geçersiz, boş ve limit üstü id listelerinin 400 döndürdüğünü test eder."""
+        self.client.force_authenticate(user=self.user)
+        url = f'{self.events_url}availability/'
+        
+        self.assertEqual(self.client.get(url).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(url, {'ids': '1,abc'}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(url, {'ids': ','}).status_code, status.HTTP_400_BAD_REQUEST)
+        with self.settings(EVENT_AVAILABILITY_MAX_IDS=2):
+            response = self.client.get(url, {'ids': '1,2,3'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('ids', response.data)
+    
+    def test_availability_cached(self):
+        """?cached=true ile ikinci isteğin veritabanına gitmediğini test eder."""
+        cache.clear()
+        self.client.force_authenticate(user=self.user)
+        url = f'{self.events_url}availability/'
+        params = {'ids': str(self.event.id), 'cached': 'true'}
+        
+        self.client.get(url, params)
+        ReservationService.create_hold_reservation(self.event.id, self.user.id, 5)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        
+        self.assertEqual(len(queries.captured_queries), 0)
+        self.assertEqual(response.data['results'][0]['available'], 100)
+        self.assertEqual(self.client.get(url, {'ids': str(self.event.id)}).data['results'][0]['available'], 95)
+    
+    def test_sparse_fields_ignored_on_write(self):
+        """Yazma isteklerinde ?fields= parametresinin alanları daraltmadığını test eder."""
+        self.client.force_authenticate(user=self.admin)
+        
+        response = self.client.patch(
+            f'{self.events_url}{self.event.id}/?fields=id',
+            {'name': 'Renamed'},
+            format='json'
+        )
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['name'], 'Renamed')
+
+
+class FeaturedEventsTestCase(APITestCase):
+    """
+    Öne çıkan etkinlik listesinin önceden hesaplanması için testler.
+    """
+    
+    def setUp(self):
+        """Her test metodundan önce test verilerini hazırlar."""
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='featureduser',
+            email='featured@example.com',
+            password='testpass123'
+        )
+        self.later = Event.objects.create(
+            name='Later Event',
+            capacity=10,
+            start_time=timezone.now() + timedelta(days=2),
+            end_time=timezone.now() + timedelta(days=2, hours=3)
+        )
+        self.sooner = Event.objects.create(
+            name='Sooner Event',
+            capacity=20,
+            start_time=timezone.now() + timedelta(days=1),
+            end_time=timezone.now() + timedelta(days=1, hours=3)
+        )
+        Event.objects.create(
+            name='Inactive Event',
+            capacity=10,
+            start_time=timezone.now() + timedelta(days=1),
+            end_time=timezone.now() + timedelta(days=1, hours=3),
+            is_active=False
+        )
+    
+    def _results(self):
+        return json.loads(FeaturedEventsService.get_payload())['results']
+    
+    def test_build_lists_upcoming_active_events_in_order(self):
+        """Listenin sadece yaklaşan aktif etkinlikleri başlangıç sırasıyla içerdiğini test eder."""
+        FeaturedEventsService.build()
+        
+        results = self._results()
+        self.assertEqual([event['name'] for event in results], ['Sooner Event', 'Later Event'])
+        self.assertEqual(results[0]['available_capacity'], 20)
+    
+    def test_incremental_build_refreshes_changed_and_removed_events(self):
+        """Artımlı derlemenin değişen etkinlikleri güncelleyip silinenleri çıkardığını test eder."""
+        FeaturedEventsService.build()
+        ReservationService.create_hold_reservation(self.sooner.id, self.user.id, 3)
+        self.later.delete()
+        
+        FeaturedEventsService.build()
+        
+        results = self._results()
+        self.assertEqual([event['name'] for event in results], ['Sooner Event'])
+        self.assertEqual(results[0]['available_capacity'], 17)
+    
+    def test_build_respects_limit(self):
+        """Listenin FEATURED_EVENTS_LIMIT ile sınırlandığını test eder."""
+        with self.settings(FEATURED_EVENTS_LIMIT=1):
+            FeaturedEventsService.build()
+        
+        self.assertEqual([event['name'] for event in self._results()], ['Sooner Event'])
+    
+    @override_settings(FEATURED_EVENTS_LIMIT=1, FEATURED_EVENTS_BUFFER=1)
+    def test_incremental_build_keeps_only_top_events(self):
+        """Durumda sadece limit + yedek kadar etkinlik tutulduğunu ve ufuktan sonrakilerin atlandığını test eder."""
+        FeaturedEventsService.build()
+        Event.objects.create(
+            name='Far Event',
+            capacity=10,
+            start_time=timezone.now() + timedelta(days=3),
+            end_time=timezone.now() + timedelta(days=3, hours=3)
+        )
+        
+        FeaturedEventsService.build()
+        
+        state = cache.get(FeaturedEventsService.STATE_KEY)
+        self.assertEqual(set(state['entries']), {self.sooner.id, self.later.id})
+        self.assertEqual(state['horizon'], self.later.start_time)
+    
+    @override_settings(FEATURED_EVENTS_LIMIT=1, FEATURED_EVENTS_BUFFER=1)
+    def test_incremental_build_refills_below_limit(self):
+        """Çıkanlar yüzünden liste limitin altına düşünce ilk sayfanın baştan derlendiğini test eder."""
+        FeaturedEventsService.build()
+        far = Event.objects.create(
+            name='Far Event',
+            capacity=10,
+            start_time=timezone.now() + timedelta(days=3),
+            end_time=timezone.now() + timedelta(days=3, hours=3)
+        )
+        self.sooner.delete()
+        self.later.is_active = False
+        self.later.save()
+        
+        FeaturedEventsService.build()
+        
+        self.assertEqual([event['name'] for event in self._results()], ['Far Event'])
+        self.assertEqual(set(cache.get(FeaturedEventsService.STATE_KEY)['entries']), {far.id})
+    
+    def test_featured_endpoint_serves_cached_payload(self):
+        """Endpoint'in önbellekteki listeyi veritabanına gitmeden döndürdüğünü test eder."""
+        self.client.force_authenticate(user=self.user)
+        FeaturedEventsService.build()
+        
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/events/featured/')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(queries.captured_queries), 0)
+        self.assertEqual(len(response.json()['results']), 2)
+    
+    def test_featured_endpoint_builds_on_cache_miss(self):
+        """Önbellek boşken endpoint'in listeyi derlediğini test eder."""
+        self.client.force_authenticate(user=self.user)
+        
+        response = self.client.get('/api/events/featured/')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()['results']), 2)
+        self.assertIsNotNone(FeaturedEventsService.get_payload())
+
+
+@override_settings(EVENT_CHANGES_LAG_SECONDS=0)
+class EventChangesTestCase(APITestCase):
+    """
+    Değişiklik günlüğü ve delta senkronizasyon endpoint'i için testler.
+    """
+    
+    def setUp(self):
+        """Her test metodundan önce test verilerini hazırlar."""
+        self.changes_url = '/api/events/changes/'
+        self.user = User.objects.create_user(username='syncuser', email='sync@example.com', password='x')
+        self.event = Event.objects.create(
+            name='Synced Event',
+            capacity=10,
+            start_time=timezone.now() + timedelta(days=1),
+            end_time=timezone.now() + timedelta(days=1, hours=3)
+        )
+        self.other = Event.objects.create(
+            name='Quiet Event',
+            capacity=10,
+            start_time=timezone.now() + timedelta(days=2),
+            end_time=timezone.now() + timedelta(days=2, hours=3)
+        )
+        self.client.force_authenticate(user=self.user)
+        self.cursor = self.client.get(self.changes_url).data['cursor']
+    
+    def test_changes_since_cursor(self):
+        """Sadece cursor'dan sonra değişen etkinliklerin döndüğünü ve cursor'ın ilerlediğini test eder."""
+        reservation = ReservationService.create_hold_reservation(self.event.id, self.user.id, 3)
+        ReservationService.cancel_reservation(reservation.id, self.user.id)
+        ReservationService.create_hold_reservation(self.event.id, self.user.id, 2)
+        
+        response = self.client.get(self.changes_url, {'since': self.cursor})
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([event['id'] for event in response.data['results']], [self.event.id])
+        self.assertEqual(response.data['results'][0]['available_capacity'], 8)
+        self.assertGreater(response.data['cursor'], self.cursor)
+        self.assertFalse(response.data['has_more'])
+        
+        response = self.client.get(self.changes_url, {'since': response.data['cursor']})
+        self.assertEqual(response.data['results'], [])
+    
+    def test_event_writes_and_deletes_are_recorded(self):
+        """Etkinlik güncelleme ve silmelerinin günlüğe yazıldığını test eder."""
+        self.other.name = 'Renamed'
+        self.other.save()
+        event_id = self.event.id
+        self.event.delete()
+        
+        response = self.client.get(self.changes_url, {'since': self.cursor, 'fields': 'id,name'})
+        
+        self.assertEqual(response.data['results'], [{'id': self.other.id, 'name': 'Renamed'}])
+        self.assertEqual(response.data['deleted'], [event_id])
+    
+    def test_expired_holds_are_recorded(self):
+        """Süre dolma görevinin etkilenen etkinlikleri günlüğe yazdığını test eder."""
+        Reservation.objects.create(
+            event=self.other, user=self.user, quantity=1, expires_at=timezone.now() - timedelta(minutes=1)
+        )
+        ReservationService.expire_old_holds()
+        
+        event_ids, _, _ = EventChangeService.changes_since(self.cursor)
+        self.assertEqual(event_ids, [self.other.id])
+    
+    def test_cursor_does_not_pass_recent_changes(self):
+        """Cursor'ın gecikme payı içindeki kayıtları geçmediğini test eder."""
+        ReservationService.create_hold_reservation(self.event.id, self.user.id, 1)
+        
+        with self.settings(EVENT_CHANGES_LAG_SECONDS=60):
+            event_ids, cursor, _ = EventChangeService.changes_since(self.cursor)
+        
+        self.assertEqual(event_ids, [self.event.id])
+        self.assertEqual(cursor, self.cursor)
+    
+    def test_paging_and_expired_cursor(self):
+        """Sayfalama ve saklama süresi dolmuş cursor'ların 410 döndürdüğünü test eder."""
+        ReservationService.create_hold_reservation(self.event.id, self.user.id, 1)
+        ReservationService.create_hold_reservation(self.other.id, self.user.id, 1)
+        
+        event_ids, cursor, has_more = EventChangeService.changes_since(self.cursor, limit=1)
+        self.assertEqual((event_ids, has_more), ([self.event.id], True))
+        
+        EventChange.objects.update(created_at=timezone.now() - timedelta(days=2))
+        # En yeni kayıt korunur
+        self.assertEqual(EventChangeService.purge(), 3)
+        self.assertEqual(EventChange.objects.count(), 1)
+        
+        response = self.client.get(self.changes_url, {'since': 0})
+        self.assertEqual(response.status_code, status.HTTP_410_GONE)
+        self.assertEqual(self.client.get(self.changes_url, {'since': -1}).status_code, status.HTTP_400_BAD_REQUEST)
+        
+        # Silinen aralıktan sonraki cursor'lar geçerli kalır
+        boundary = EventChange.objects.get().id - 1
+        self.assertEqual(EventChangePurge.boundary(), boundary)
+        self.assertEqual(self.client.get(self.changes_url, {'since': boundary}).status_code, status.HTTP_200_OK)
+    
+    def test_id_gap_is_not_expired_cursor(self):
+        """Geri alınan transaction'ların bıraktığı ID boşluklarının 410 döndürmediğini test eder."""
+        EventChange.objects.all().delete()
+        EventChange.objects.create(id=self.cursor + 10, event_id=self.event.id)
+        
+        event_ids, _, _ = EventChangeService.changes_since(self.cursor)
+        
+        self.assertEqual(event_ids, [self.event.id])
+
+
+class EventCalendarTestCase(APITestCase):
+    """
+    Günlük takvim özeti endpoint'i için testler.
+    """
+    
+    def setUp(self):
+        """Her test metodundan önce test verilerini hazırlar."""
+        cache.clear()
+        self.calendar_url = '/api/events/calendar/'
+        self.user = User.objects.create_user(username='calendaruser', email='calendar@example.com', password='x')
+        self.today = timezone.localdate()
+        self.client.force_authenticate(user=self.user)
+    
+    def _create_event(self, day, capacity, **kwargs):
+        start_time = timezone.make_aware(datetime.combine(day, dt_time(12)))
+        return Event.objects.create(
+            name=f'Event {day} {capacity}',
+            capacity=capacity,
+            start_time=start_time,
+            end_time=start_time + timedelta(hours=3),
+            **kwargs
+        )
+    
+    def _calendar(self, start, end):
+        return self.client.get(self.calendar_url, {'from': start.isoformat(), 'to': end.isoformat()})
+    
+    def test_daily_rollup(self):
+        """Günlük toplamların tek sorguda ve rezervasyonlar düşülerek hesaplandığını test eder."""
+        first_day = self.today + timedelta(days=1)
+        second_day = self.today + timedelta(days=3)
+        event = self._create_event(first_day, 10)
+        self._create_event(first_day, 20)
+        sharded = self._create_event(second_day, 40, inventory_shards=4)
+        self._create_event(second_day, 50, is_active=False)
+        ReservationService.rebalance_inventory(sharded.id)
+        
+        reservation = ReservationService.create_hold_reservation(event.id, self.user.id, 3)
+        ReservationService.confirm_reservation(reservation.id, self.user.id)
+        ReservationService.create_hold_reservation(event.id, self.user.id, 2)
+        ReservationService.create_hold_reservation(sharded.id, self.user.id, 5)
+        # Süresi dolmuş hold kapasite tüketmez
+        Reservation.objects.create(
+            event=event, user=self.user, quantity=4, expires_at=timezone.now() - timedelta(minutes=1)
+        )
+        
+        with CaptureQueriesContext(connection) as queries:
+            response = self._calendar(first_day, second_day)
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            json.loads(response.content)['results'],
+            [
+                {'date': first_day.isoformat(), 'events': 2, 'capacity': 30, 'available': 25},
+                {'date': (first_day + timedelta(days=1)).isoformat(), 'events': 0, 'capacity': 0, 'available': 0},
+                {'date': second_day.isoformat(), 'events': 1, 'capacity': 40, 'available': 35},
+            ]
+        )
+        self.assertEqual(
+            len([query for query in queries.captured_queries if 'events' in query['sql']]), 1
+        )
+    
+    def test_past_days_are_cached(self):
+        """Geçmiş günlerin önbellekten, bugünün her istekte yeniden hesaplandığını test eder."""
+        yesterday = self.today - timedelta(days=1)
+        self._create_event(yesterday, 10)
+        today_event = self._create_event(self.today, 10)
+        self._calendar(yesterday - timedelta(days=1), yesterday)
+        
+        self._create_event(yesterday, 15)
+        ReservationService.create_hold_reservation(today_event.id, self.user.id, 4)
+        response = self._calendar(yesterday - timedelta(days=1), self.today)
+        
+        self.assertEqual(
+            [(day['events'], day['capacity'], day['available']) for day in response.data['results']],
+            [(0, 0, 0), (1, 10, 10), (1, 10, 6)]
+        )
+        with self.assertNumQueries(0):
+            self._calendar(yesterday - timedelta(days=1), yesterday)
+    
+    def test_past_day_invalidated_on_change(self):
+        """Etkinlik kaydı, taşınması, silinmesi ve iptal sonrası geçmiş günün yeniden hesaplandığını test eder."""
+        yesterday = self.today - timedelta(days=1)
+        before = yesterday - timedelta(days=1)
+        event = self._create_event(yesterday, 10)
+        reservation = Reservation.objects.create(
+            event=event, user=self.user, quantity=3, status=Reservation.Status.CONFIRMED
+        )
+        
+        def days():
+            response = self._calendar(before, yesterday)
+            return [(day['events'], day['capacity'], day['available']) for day in response.data['results']]
+        
+        self.assertEqual(days(), [(0, 0, 0), (1, 10, 7)])
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            ReservationService.cancel_reservation(reservation.id, self.user.id)
+        self.assertEqual(days(), [(0, 0, 0), (1, 10, 10)])
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            event.start_time -= timedelta(days=1)
+            event.save()
+        self.assertEqual(days(), [(1, 10, 10), (0, 0, 0)])
+        
+        with self.captureOnCommitCallbacks(execute=True):
+            event.delete()
+        self.assertEqual(days(), [(0, 0, 0), (0, 0, 0)])
+    
+    def test_invalid_range(self):
+        """Geçersiz veya çok uzun aralıkların 400 döndürdüğünü test eder."""
+        self.assertEqual(
+            self._calendar(self.today, self.today - timedelta(days=1)).status_code, status.HTTP_400_BAD_REQUEST
+        )
+        with self.settings(EVENT_CALENDAR_MAX_DAYS=7):
+            self.assertEqual(
+                self._calendar(self.today, self.today + timedelta(days=7)).status_code, status.HTTP_400_BAD_REQUEST
+            )
+        self.assertEqual(
+            self.client.get(self.calendar_url, {'from': 'yesterday'}).status_code, status.HTTP_400_BAD_REQUEST
+        )
+
+
+class EventSalesAnalyticsTestCase(APITestCase):
+    """
+    Dakikalık satış sayaçları ve analitik endpoint'leri için testler.
+    """
+    
+    def setUp(self):
+        """Her test metodundan önce test verilerini hazırlar."""
+        self.user = User.objects.create_user(username='buyer', email='buyer@example.com', password='x')
+        self.admin = User.objects.create_superuser(username='salesadmin', email='sales@example.com', password='x')
+        self.event = Event.objects.create(
+            name='Hot Event',
+            capacity=100,
+            start_time=timezone.now() + timedelta(days=1),
+            end_time=timezone.now() + timedelta(days=1, hours=3)
+        )
+        self.other = Event.objects.create(
+            name='Slow Event',
+            capacity=100,
+            start_time=timezone.now() + timedelta(days=1),
+            end_time=timezone.now() + timedelta(days=1, hours=3)
+        )
+    
+    def test_transitions_update_rollups(self):
+        """HOLD, onay, iptal ve süre dolma geçişlerinin sayaçları artırdığını test eder."""
+        first = ReservationService.create_hold_reservation(self.event.id, self.user.id, 3)
+        ReservationService.confirm_reservation(first.id, self.user.id)
+        second = ReservationService.create_hold_reservation(self.event.id, self.user.id, 2)
+        ReservationService.cancel_reservation(second.id, self.user.id)
+        ReservationService.create_hold_reservation(self.event.id, self.user.id, 4)
+        ReservationService.create_hold_reservation(self.other.id, self.user.id, 1)
+        Reservation.objects.filter(status=Reservation.Status.HOLD).update(
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+        ReservationService.expire_old_holds()
+        
+        totals = EventSalesService.series(
+            self.event.id, timezone.now() - timedelta(hours=1), timezone.now() + timedelta(minutes=1)
+        )['totals']
+        
+        self.assertEqual(totals, {'held': 9, 'confirmed': 3, 'cancelled': 2, 'expired': 4})
+        self.assertEqual(
+            EventSalesRollup.objects.filter(event=self.other).aggregate(expired=Sum('expired'))['expired'], 1
+        )
+    
+    def test_concurrent_writes_in_same_minute_are_summed(self):
+        """Aynı dakikadaki artışların parça sayısından bağımsız toplandığını test eder."""
+        with self.settings(EVENT_SALES_ROLLUP_SHARDS=2):
+            for _ in range(6):
+                EventSalesRollup.record({self.event.id: {'held': 1}, self.other.id: {'confirmed': 2}})
+        
+        self.assertLessEqual(EventSalesRollup.objects.filter(event=self.event).count(), 2)
+        result = EventSalesService.series(
+            self.event.id, timezone.now() - timedelta(minutes=5), timezone.now() + timedelta(minutes=1)
+        )
+        self.assertEqual(len(result['results']), 1)
+        self.assertEqual(result['results'][0]['held'], 6)
+    
+    def test_sales_endpoints(self):
+        """Analitik endpoint'lerinin sadece admin'e açık olduğunu ve rezervasyonları okumadığını test eder."""
+        ReservationService.create_hold_reservation(self.event.id, self.user.id, 2)
+        hold = ReservationService.create_hold_reservation(self.other.id, self.user.id, 5)
+        ReservationService.confirm_reservation(hold.id, self.user.id)
+        
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(
+            self.client.get(f'/api/events/{self.event.id}/sales/').status_code, status.HTTP_403_FORBIDDEN
+        )
+        self.assertEqual(self.client.get('/api/events/sales/').status_code, status.HTTP_403_FORBIDDEN)
+        
+        self.client.force_authenticate(user=self.admin)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f'/api/events/{self.event.id}/sales/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['totals'], {'held': 2, 'confirmed': 0, 'cancelled': 0, 'expired': 0})
+        self.assertFalse(any('reservations' in query['sql'] for query in queries.captured_queries))
+        
+        response = self.client.get('/api/events/sales/')
+        self.assertEqual(
+            [(row['event_id'], row['confirmed']) for row in response.data['results']],
+            [(self.other.id, 5), (self.event.id, 0)]
+        )
+        
+        now = timezone.now()
+        response = self.client.get(
+            '/api/events/sales/', {'from': (now - timedelta(days=2)).isoformat(), 'to': now.isoformat()}
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+    
+    @override_settings(JWT_STATELESS_READS=True)
+    def test_sales_endpoints_with_stateless_reads(self):
+        """Token claim'leriyle doğrulamada da admin'in analitik endpoint'lerine erişebildiğini test eder."""
+        for user, expected in ((self.user, status.HTTP_403_FORBIDDEN), (self.admin, status.HTTP_200_OK)):
+            self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(user).access_token}')
+            self.assertEqual(self.client.get(f'/api/events/{self.event.id}/sales/').status_code, expected)
+            self.assertEqual(self.client.get('/api/events/sales/').status_code, expected)
+        
+        # Diğer salt okunur istekler token claim'leriyle doğrulanmaya devam eder
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(f'/api/events/{self.event.id}/').status_code, status.HTTP_200_OK)
+        self.assertFalse(any('FROM "users"' in query['sql'] for query in queries.captured_queries))
+
+
+class FailingSink(OutboxSink):
+    """Her iletimde hata fırlatan hedef (outbox testleri için)."""
+
+    def publish(self, messages):
+        raise ConnectionError('sink unavailable')
+
+
+@override_settings(OUTBOX_SINKS=['events.outbox.InMemorySink'], OUTBOX_LAG_SECONDS=0)
+class OutboxTestCase(TestCase):
+    """
+    Rezervasyon outbox'ı ve relay için testler.
+    """
+    
+    def setUp(self):
+        """Her test metodundan önce test verilerini hazırlar."""
+        InMemorySink.clear()
+        self.user = User.objects.create_user(username='outboxuser', email='outbox@example.com', password='x')
+        self.event = Event.objects.create(
+            name='Outbox Event',
+            capacity=5,
+            start_time=timezone.now() + timedelta(days=1),
+            end_time=timezone.now() + timedelta(days=1, hours=3)
+        )
+    
+    def test_transitions_write_messages_in_transaction(self):
+        """Başarılı geçişlerin mesaj yazdığını, başarısız geçişlerin yazmadığını test eder."""
+        reservation = ReservationService.create_hold_reservation(self.event.id, self.user.id, 2)
+        ReservationService.confirm_reservation(reservation.id, self.user.id)
+        with self.assertRaises(ValidationError):
+            ReservationService.create_hold_reservation(self.event.id, self.user.id, 10)
+        ReservationService.cancel_reservation(reservation.id, self.user.id)
+        Reservation.objects.create(
+            event=self.event, user=self.user, quantity=1, expires_at=timezone.now() - timedelta(minutes=1)
+        )
+        ReservationService.expire_old_holds()
+        
+        self.assertEqual(
+            list(OutboxMessage.objects.order_by('id').values_list('topic', flat=True)),
+            ['reservation.hold', 'reservation.confirmed', 'reservation.cancelled', 'reservation.expired']
+        )
+        self.assertEqual(
+            OutboxMessage.objects.order_by('id').first().payload,
+            {
+                'reservation_id': reservation.id,
+                'event_id': self.event.id,
+                'user_id': self.user.id,
+                'quantity': 2,
+                'status': 'HOLD',
+            }
+        )
+    
+    def test_relay_publishes_in_order_and_deletes(self):
+        """Relay'in mesajları etkinlik başına sırayla, gruplar halinde ilettiğini test eder."""
+        other = Event.objects.create(
+            name='Other Outbox Event',
+            capacity=5,
+            start_time=timezone.now() + timedelta(days=1),
+            end_time=timezone.now() + timedelta(days=1, hours=3)
+        )
+        for event in (self.event, other, self.event):
+            reservation = ReservationService.create_hold_reservation(event.id, self.user.id, 1)
+            ReservationService.cancel_reservation(reservation.id, self.user.id)
+        
+        self.assertEqual(OutboxRelayService.relay(batch_size=2), 6)
+        
+        self.assertEqual(OutboxMessage.objects.count(), 0)
+        own = [message for message in InMemorySink.messages if message['key'] == self.event.id]
+        self.assertEqual(
+            [message['topic'] for message in own],
+            ['reservation.hold', 'reservation.cancelled'] * 2
+        )
+        self.assertEqual([message['id'] for message in own], sorted(message['id'] for message in own))
+        self.assertEqual(OutboxRelayService.relay(), 0)
+    
+    def test_failed_sink_keeps_messages(self):
+        """Hedef hata verdiğinde mesajların silinmediğini ve tekrar iletildiğini test eder."""
+        ReservationService.create_hold_reservation(self.event.id, self.user.id, 1)
+        
+        with self.settings(OUTBOX_SINKS=['events.outbox.InMemorySink', 'events.tests.FailingSink']):
+            with self.assertRaises(ConnectionError):
+                OutboxRelayService.relay()
+        self.assertEqual(OutboxMessage.objects.count(), 1)
+        
+        self.assertEqual(OutboxRelayService.relay(), 1)
+        self.assertEqual([message['topic'] for message in InMemorySink.messages][-1], 'reservation.hold')
+    
+    def test_recent_messages_wait_for_lag(self):
+        """Gecikme payı içindeki mesajların bir sonraki çalışmaya bırakıldığını test eder."""
+        ReservationService.create_hold_reservation(self.event.id, self.user.id, 1)
+        
+        with self.settings(OUTBOX_LAG_SECONDS=60):
+            self.assertEqual(OutboxRelayService.relay(), 0)
+        self.assertEqual(OutboxMessage.objects.count(), 1)
+
+
+class StubWebhookHandler(BaseHTTPRequestHandler):
+    """İstekleri kaydeden ve sıradaki durum koduyla yanıt veren keep-alive webhook alıcısı."""
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        self.server.received.append({
+            'path': self.path, 'headers': self.headers, 'body': body, 'port': self.client_address[1]
+        })
+        self.send_response(self.server.statuses.pop(0) if self.server.statuses else 200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@override_settings(OUTBOX_SINKS=['events.webhooks.WebhookSink'], OUTBOX_LAG_SECONDS=0)
+class WebhookTestCase(TestCase):
+    """
+    İş ortağı webhook teslimleri için testler (yerel bir stub HTTP sunucusuna karşı).
+    """
+    
+    def setUp(self):
+        """Her test metodundan önce stub sunucuyu ve test verilerini hazırlar."""
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), StubWebhookHandler)
+        self.server.received = []
+        self.server.statuses = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        
+        self.user = User.objects.create_user(username='webhookbuyer', email='buyer@example.com', password='x')
+        self.partner = User.objects.create_user(username='partner', email='partner@example.com', password='x')
+        self.event = Event.objects.create(
+            name='Partner Event',
+            capacity=10,
+            start_time=timezone.now() + timedelta(days=1),
+            end_time=timezone.now() + timedelta(days=1, hours=3)
+        )
+        self.subscription = WebhookSubscription.objects.create(
+            owner=self.partner,
+            url=f'http://127.0.0.1:{self.server.server_port}/hooks?source=reservations',
+            secret='partner-secret'
+        )
+    
+    def tearDown(self):
+        webhooks.pool.close_all()
+        self.server.shutdown()
+        self.server.server_close()
+    
+    def _confirm_and_cancel(self):
+        reservation = ReservationService.create_hold_reservation(self.event.id, self.user.id, 2)
+        ReservationService.confirm_reservation(reservation.id, self.user.id)
+        ReservationService.cancel_reservation(reservation.id, self.user.id)
+        OutboxRelayService.relay()
+        return reservation
+    
+    def test_sink_creates_matching_deliveries_once(self):
+        """Sadece eşleşen abonelikler için ve mesaj başına bir kez teslim oluştuğunu test eder."""
+        other_event = Event.objects.create(
+            name='Unrelated Event',
+            capacity=10,
+            start_time=timezone.now() + timedelta(days=1),
+            end_time=timezone.now() + timedelta(days=1, hours=3)
+        )
+        WebhookSubscription.objects.create(owner=self.partner, url='http://example.com/', secret='x', event=other_event)
+        cancellations_only = WebhookSubscription.objects.create(
+            owner=self.partner, url='http://example.com/', secret='x', topics=['reservation.cancelled']
+        )
+        self._confirm_and_cancel()
+        
+        self.assertEqual(
+            sorted(WebhookDelivery.objects.values_list('subscription_id', 'topic')),
+            sorted([
+                (self.subscription.id, 'reservation.confirmed'),
+                (self.subscription.id, 'reservation.cancelled'),
+                (cancellations_only.id, 'reservation.cancelled'),
+            ])
+        )
+        delivery = WebhookDelivery.objects.first()
+        webhooks.WebhookSink().publish([{
+            'id': delivery.message_id, 'topic': delivery.topic, 'key': self.event.id, 'payload': delivery.payload
+        }])
+        self.assertEqual(WebhookDelivery.objects.count(), 3)
+    
+    def test_deliveries_are_signed_and_share_a_connection(self):
+        """Teslimlerin sırayla, imzalı ve aynı keep-alive bağlantı üzerinden gittiğini test eder."""
+        reservation = self._confirm_and_cancel()
+        
+        self.assertEqual(WebhookDeliveryService.deliver_pending(), 2)
+        
+        received = self.server.received
+        self.assertEqual(
+            [request['headers']['X-Webhook-Topic'] for request in received],
+            ['reservation.confirmed', 'reservation.cancelled']
+        )
+        self.assertEqual(len({request['port'] for request in received}), 1)
+        self.assertEqual(received[0]['path'], '/hooks?source=reservations')
+        for request in received:
+            expected = webhooks.sign('partner-secret', request['headers']['X-Webhook-Timestamp'], request['body'])
+            self.assertEqual(request['headers']['X-Webhook-Signature'], f'sha256={expected}')
+        body = json.loads(received[0]['body'])
+        self.assertEqual(body['data']['reservation_id'], reservation.id)
+        self.assertEqual(body['id'], int(received[0]['headers']['X-Webhook-Id']))
+        
+        self.assertEqual(
+            set(WebhookDelivery.objects.values_list('status', 'attempts')), {(WebhookDelivery.Status.DELIVERED, 1)}
+        )
+        self.assertEqual(WebhookDeliveryService.deliver_pending(), 0)
+    
+    def test_failed_delivery_is_retried_in_order(self):
+        """Başarısız teslimin ertelendiğini, sonraki teslimlerin onu beklediğini test eder."""
+        self._confirm_and_cancel()
+        self.server.statuses = [500]
+        
+        self.assertEqual(WebhookDeliveryService.deliver_pending(), 0)
+        
+        self.assertEqual(len(self.server.received), 1)
+        first, second = WebhookDelivery.objects.order_by('id')
+        self.assertEqual(
+            (first.status, first.attempts, first.last_error), (WebhookDelivery.Status.PENDING, 1, 'HTTP 500')
+        )
+        self.assertGreater(first.next_attempt_at, timezone.now())
+        self.assertEqual(second.next_attempt_at, first.next_attempt_at)
+        
+        WebhookDelivery.objects.update(next_attempt_at=timezone.now())
+        self.assertEqual(WebhookDeliveryService.deliver_pending(), 2)
+        self.assertEqual(
+            [request['headers']['X-Webhook-Topic'] for request in self.server.received[1:]],
+            ['reservation.confirmed', 'reservation.cancelled']
+        )
+    
+    def test_delivery_fails_after_max_attempts(self):
+        """Deneme sınırına ulaşan teslimin FAILED olduğunu test eder."""
+        self._confirm_and_cancel()
+        WebhookSubscription.objects.update(url='http://127.0.0.1:1/unreachable')
+        
+        with self.settings(WEBHOOK_MAX_ATTEMPTS=1):
+            self.assertEqual(WebhookDeliveryService.deliver_pending(), 0)
+        
+        first = WebhookDelivery.objects.order_by('id').first()
+        self.assertEqual(first.status, WebhookDelivery.Status.FAILED)
+        self.assertTrue(first.last_error)
+
+
+class ValuesSerializerParityTestCase(TestCase):
+    """
+    values() tabanlı hızlı okuma yolunun DRF serializer'larıyla aynı çıktıyı verdiğini test eder.
+    """
+    
+    def setUp(self):
+        """Her test metodundan önce test verilerini hazırlar."""
+        self.user = User.objects.create_user(username='parityuser', email='parity@example.com', password='x')
+        now = timezone.now()
+        plain = Event.objects.create(
+            name='Plain Event',
+            capacity=50,
+            start_time=now + timedelta(days=1),
+            end_time=now + timedelta(days=1, hours=3),
+            max_per_user=4
+        )
+        sharded = Event.objects.create(
+            name='Sharded Event',
+            description='Kovalı etkinlik',
+            capacity=40,
+            start_time=now + timedelta(days=2),
+            end_time=now + timedelta(days=2, hours=3),
+            inventory_shards=2
+        )
+        ReservationService.rebalance_inventory(sharded.id)
+        archived = Event.objects.create(
+            name='Archived Event',
+            capacity=10,
+            start_time=now - timedelta(days=40),
+            end_time=now - timedelta(days=40) + timedelta(hours=3),
+            is_active=False
+        )
+        EventSalesSummary.objects.create(event=archived, confirmed_quantity=7)
+        
+        ReservationService.create_hold_reservation(plain.id, self.user.id, 2)
+        confirmed = ReservationService.create_hold_reservation(plain.id, self.user.id, 1)
+        ReservationService.confirm_reservation(confirmed.id, self.user.id)
+        ReservationService.create_hold_reservation(sharded.id, self.user.id, 3)
+        Reservation.objects.create(
+            event=plain, user=self.user, quantity=1, expires_at=now - timedelta(minutes=1)
+        )
+    
+    def assertEventParity(self, fields=None):
+        queryset = Event.objects.with_capacity()
+        expected = EventSerializer(queryset, many=True, fields=fields).data
+        serializer = EventValuesSerializer(fields=fields)
+        self.assertEqual(serializer.to_representation(serializer.values(queryset)), expected)
+    
+    def test_event_output_matches_serializer(self):
+        """Kapasite, kova ve arşiv durumlarında etkinlik çıktısının aynı olduğunu test eder."""
+        self.assertEventParity()
+        self.assertEventParity(fields={'id', 'name', 'hold_count'})
+        with timezone.override('Europe/Istanbul'):
+            self.assertEventParity()
+    
+    def test_reservation_output_matches_serializer(self):
+        """Rezervasyon çıktısının (ilişki alanları dahil) aynı olduğunu test eder."""
+        queryset = Reservation.objects.filter(user=self.user)
+        expected = ReservationSerializer(queryset, many=True).data
+        serializer = ReservationValuesSerializer()
+        
+        self.assertEqual(len(expected), 4)
+        self.assertEqual(serializer.to_representation(serializer.values(queryset)), expected)
+
+
+class ReservationAPITestCase(APITestCase):
+    """
+    Reservation ViewSet için API testleri.
+    """
+    
+    def setUp(self):
+        """Her test metodundan önce test verilerini hazırlar."""
+        self.client = APIClient()
+        self.reservations_url = '/api/reservations/'
+        
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123'
+        )
+        
+        self.event = Event.objects.create(
+            name='Test Event',
+            description='Test Description',
+            capacity=100,
+            start_time=timezone.now() + timedelta(days=1),
+            end_time=timezone.now() + timedelta(days=1, hours=3),
+            is_active=True
+        )
+    
+    def test_create_hold_reservation_success(self):
+        """API üzerinden başarılı HOLD rezervasyon oluşturmayı test eder."""
+        self.client.force_authenticate(user=self.user)
+        
+        response = self.client.post(
+            f'{self.reservations_url}create_hold/',
+            {'event_id': self.event.id, 'quantity': 5},
+            format='json'
+        )
         
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data['status'], 'HOLD')
@@ -759,6 +2188,26 @@ class ReservationAPITestCase(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['count'], 1)
         self.assertEqual(response.data['results'][0]['user'], self.user.id)
+    
+    def test_list_reservations_sparse_fields(self):
+        """?fields= ile sadece istenen alanların ve ilişkilerin yüklendiğini test eder."""
+        Reservation.objects.create(event=self.event, user=self.user, quantity=2)
+        self.client.force_authenticate(user=self.user)
+        
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.reservations_url, {'fields': 'id,event_name,quantity'})
+        
+        self.assertEqual(response.data['results'], [
+            {'id': response.data['results'][0]['id'], 'event_name': 'Test Event', 'quantity': 2}
+        ])
+        select = queries.captured_queries[-1]['sql']
+        self.assertIn('JOIN "events"', select)
+        self.assertNotIn('JOIN "users"', select)
+        self.assertNotIn('"reservations"."expires_at"', select)
+        
+        response = self.client.get(self.reservations_url, {'omit': 'user_username,expires_at'})
+        self.assertNotIn('user_username', response.data['results'][0])
+        self.assertIn('event_name', response.data['results'][0])
 
 
 class ConcurrencyTestCase(TransactionTestCase):
@@ -866,3 +2315,98 @@ class ConcurrencyTestCase(TransactionTestCase):
         if len(errors) == 0:
             self.assertLessEqual(total_reserved, 10, 
                                 "All requests succeeded but total exceeds capacity")
+
+
+class AdminChangelistTestCase(TestCase):
+    """
+    Event ve Reservation admin listelerinin sorgu sayısı ve arama testleri.
+    """
+    
+    def setUp(self):
+        """Admin kullanıcısı, etkinlik ve rezervasyonları hazırlar."""
+        self.admin = User.objects.create_superuser(
+            username='admin',
+            email='admin@example.com',
+            password='adminpass123'
+        )
+        self.client.force_login(self.admin)
+        self.event = Event.objects.create(
+            name='Concert',
+            capacity=100,
+            start_time=timezone.now() + timedelta(days=1),
+            end_time=timezone.now() + timedelta(days=1, hours=3)
+        )
+        self.user = User.objects.create_user(
+            username='attendee',
+            email='attendee@example.com',
+            password='testpass123'
+        )
+    
+    def _reserve(self, count, event=None, user=None):
+        for _ in range(count):
+            Reservation.objects.create(
+                event=event or self.event,
+                user=user or self.user,
+                status=Reservation.Status.HOLD,
+                quantity=2,
+                expires_at=timezone.now() + timedelta(minutes=10)
+            )
+    
+    def _changelist_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response, len(queries.captured_queries)
+    
+    def test_reservation_changelist_queries_do_not_scale(self):
+        """Rezervasyon listesinde satır başına user/event sorgusu atılmadığını test eder."""
+        self._reserve(1)
+        _, single = self._changelist_queries('/admin/events/reservation/')
+        
+        other = User.objects.create_user(username='other', email='other@example.com', password='testpass123')
+        self._reserve(5, user=other)
+        _, many = self._changelist_queries('/admin/events/reservation/')
+        
+        self.assertEqual(single, many)
+    
+    def test_event_changelist_capacity_columns(self):
+        """Etkinlik listesindeki kapasite sütunlarının ek sorgu atmadan gösterildiğini test eder."""
+        self._reserve(3)
+        _, single = self._changelist_queries('/admin/events/event/')
+        
+        for i in range(4):
+            Event.objects.create(
+                name=f'Event {i}',
+                capacity=10,
+                start_time=timezone.now() + timedelta(days=2),
+                end_time=timezone.now() + timedelta(days=2, hours=3)
+            )
+        response, many = self._changelist_queries('/admin/events/event/')
+        
+        self.assertEqual(single, many)
+        changelist = response.context['cl']
+        concert = next(event for event in changelist.result_list if event.pk == self.event.pk)
+        self.assertEqual(concert.capacity_snapshot().held, 6)
+        self.assertEqual(concert.capacity_snapshot().available, 94)
+    
+    def test_reservation_search(self):
+        """Rezervasyon aramasının kullanıcı adı, etkinlik adı ve id ile çalıştığını test eder."""
+        self._reserve(1)
+        other_event = Event.objects.create(
+            name='Theatre',
+            capacity=10,
+            start_time=timezone.now() + timedelta(days=2),
+            end_time=timezone.now() + timedelta(days=2, hours=3)
+        )
+        other = User.objects.create_user(username='visitor', email='visitor@example.com', password='testpass123')
+        self._reserve(1, event=other_event, user=other)
+        theatre_reservation = Reservation.objects.get(event=other_event)
+        
+        for term, expected in [
+            ('attend', {self.event.id}),
+            ('THEAT', {other_event.id}),
+            (str(theatre_reservation.id), {other_event.id}),
+        ]:
+            response = self.client.get('/admin/events/reservation/', {'q': term})
+            found = {reservation.event_id for reservation in response.context['cl'].result_list}
+            self.assertEqual(found, expected, term)
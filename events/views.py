@@ -3,18 +3,33 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.core.exceptions import ValidationError
+from django.http import HttpResponse
+from users.authentication import StatelessReadAuthenticationMixin
 
 from .models import Event, Reservation
 from .serializers import (
     EventSerializer,
+    EventValuesSerializer,
+    EventAvailabilityQuerySerializer,
+    EventCalendarQuerySerializer,
+    EventChangesQuerySerializer,
+    EventSalesQuerySerializer,
     ReservationSerializer,
+    ReservationValuesSerializer,
     CreateReservationSerializer,
     ConfirmReservationSerializer
 )
-from .services import ReservationService
+from .services import (
+    EventAvailabilityService,
+    EventCalendarService,
+    EventChangeService,
+    EventSalesService,
+    FeaturedEventsService,
+    ReservationService,
+)
 
 
-class EventViewSet(viewsets.ModelViewSet):
+class EventViewSet(StatelessReadAuthenticationMixin, viewsets.ModelViewSet):
     """
     Etkinlik CRUD işlemleri için ViewSet.
     
@@ -23,6 +38,12 @@ class EventViewSet(viewsets.ModelViewSet):
     Endpoint'ler:
     - GET /api/events/ - Tüm etkinlikleri listele (sayfalama ile) - Tüm kimlik doğrulanmış kullanıcılar
     - GET /api/events/{id}/ - Etkinlik detaylarını getir - Tüm kimlik doğrulanmış kullanıcılar
+    - GET /api/events/featured/ - Öne çıkan yaklaşan etkinlikler - Tüm kimlik doğrulanmış kullanıcılar
+    - GET /api/events/availability/?ids=1,2,3 - Birden çok etkinliğin kapasite durumu - Tüm kimlik doğrulanmış kullanıcılar
+    - GET /api/events/changes/?since=<cursor> - Cursor'dan sonra değişen etkinlikler - Tüm kimlik doğrulanmış kullanıcılar
+    - GET /api/events/calendar/?from=&to= - Tarih aralığının günlük kapasite özeti - Tüm kimlik doğrulanmış kullanıcılar
+    - GET /api/events/sales/ - Aralıkta en çok satan etkinlikler - Sadece superuser (admin)
+    - GET /api/events/{id}/sales/ - Etkinliğin dakikalık satış serisi - Sadece superuser (admin)
     - POST /api/events/ - Etkinlik oluştur - Sadece superuser (admin)
     - PUT /api/events/{id}/ - Etkinlik güncelle - Sadece superuser (admin)
     - DELETE /api/events/{id}/ - Etkinlik sil - Sadece superuser (admin)
@@ -30,6 +51,8 @@ class EventViewSet(viewsets.ModelViewSet):
     queryset = Event.objects.all()
     serializer_class = EventSerializer
     permission_classes = [IsAuthenticated]
+    # Superuser kontrolü token claim'leriyle yapılamaz, gerçek kullanıcı gerekir
+    stateful_read_actions = ('sales_overview', 'sales')
     
     def list(self, request, *args, **kwargs):
         """
@@ -40,9 +63,20 @@ class EventViewSet(viewsets.ModelViewSet):
         - ?is_active=true - Aktif duruma göre filtrele
         - ?start_date=2024-01-01 - Başlangıç tarihine göre filtrele
         - ?end_date=2024-12-31 - Bitiş tarihine göre filtrele
+        - ?q=konser - Ad ve açıklamada ara (sonuçlar ilgiye göre sıralanır)
+        - ?fields=id,name,start_time - Sadece bu alanları döndür (kapasite alanları istenmezse hesaplanmaz)
+        - ?omit=description - Bu alanlar dışındakileri döndür
         - ?page=1 - Sayfalama (sayfa başına 20 öğe)
+        
+        Satırlar values() ile okunup EventValuesSerializer ile yazılır (EventSerializer ile aynı çıktı).
         """
-        return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = EventValuesSerializer(fields=EventSerializer.requested_fields(request))
+        rows = serializer.values(queryset)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(serializer.to_representation(page))
+        return Response(serializer.to_representation(rows))
 
     def retrieve(self, request, *args, **kwargs):
         """
@@ -120,14 +154,175 @@ class EventViewSet(viewsets.ModelViewSet):
             status=status.HTTP_200_OK
         )
 
+    def perform_create(self, serializer):
+        """
+        Etkinliği kaydeder; envanter kovası kullanılıyorsa kapasiteyi kovalara dağıtır.
+        """
+        event = serializer.save()
+        if event.inventory_shards:
+            ReservationService.rebalance_inventory(event.id)
+
+    def perform_update(self, serializer):
+        """
+        Etkinliği günceller; kapasite veya kova sayısı değişikliklerini kovalara yansıtır.
+        """
+        event = serializer.save()
+        ReservationService.rebalance_inventory(event.id)
+
+    @action(detail=False, methods=['get'])
+    def featured(self, request):
+        """
+        Ana sayfa için öne çıkan yaklaşan etkinlikleri döndürür.
+        GET /api/events/featured/
+        
+        Liste build_featured_events görevi tarafından önceden hesaplanır ve önbellekten
+        olduğu gibi döndürülür; önbellek boşsa bu istek listeyi derler.
+        """
+        payload = FeaturedEventsService.get_payload()
+        if payload is None:
+            payload = FeaturedEventsService.build()
+        return HttpResponse(payload, content_type='application/json')
+
+    @action(detail=False, methods=['get'])
+    def availability(self, request):
+        """
+        Birden çok etkinliğin kapasite durumunu tek sorguda döndürür.
+        GET /api/events/availability/?ids=1,2,3
+        
+        Query parametreleri:
+        - ?ids=1,2,3 - Etkinlik ID'leri (en fazla EVENT_AVAILABILITY_MAX_IDS adet)
+        - ?cached=true - Birkaç saniyelik (EVENT_AVAILABILITY_CACHE_TIMEOUT) önbellekli değerleri kabul et
+        
+        Bulunamayan etkinlikler sonuçta yer almaz.
+        """
+        serializer = EventAvailabilityQuerySerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        results = EventAvailabilityService.get_availability(
+            serializer.validated_data['ids'],
+            cached=serializer.validated_data['cached']
+        )
+        return Response({'results': results})
+
+    @action(detail=False, methods=['get'])
+    def changes(self, request):
+        """
+        Cursor'dan sonra meta verisi veya rezervasyon durumu değişen etkinlikleri döndürür.
+        GET /api/events/changes/?since=<cursor>
+        
+        - since verilmezse sadece güncel cursor döner (tam liste indirilmeden önce alınır)
+        - results: değişen etkinlikler (liste ile aynı alanlar, ?fields= / ?omit= desteklenir)
+        - deleted: silinen etkinliklerin ID'leri
+        - cursor: bir sonraki istekte gönderilecek değer
+        - has_more: true ise hemen tekrar istenmelidir
+        
+        Cursor'dan sonraki kayıtlar saklama süresini aşıp silinmişse 410 döner.
+        """
+        serializer = EventChangesQuerySerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        since = serializer.validated_data.get('since')
+        if since is None:
+            return Response({
+                'cursor': EventChangeService.current_cursor(), 'results': [], 'deleted': [], 'has_more': False
+            })
+        
+        event_ids, cursor, has_more = EventChangeService.changes_since(since)
+        results, deleted = [], []
+        if event_ids:
+            fields = EventSerializer.requested_fields(request)
+            queryset = Event.objects.filter(id__in=event_ids)
+            if fields is None or fields & EventSerializer.CAPACITY_FIELDS:
+                queryset = queryset.with_capacity()
+            values = EventValuesSerializer(fields=fields)
+            results = values.to_representation(values.values(queryset))
+            existing = set(Event.objects.filter(id__in=event_ids).values_list('id', flat=True))
+            deleted = [event_id for event_id in event_ids if event_id not in existing]
+        
+        return Response({'cursor': cursor, 'results': results, 'deleted': deleted, 'has_more': has_more})
+
+    @action(detail=False, methods=['get'])
+    def calendar(self, request):
+        """
+        Tarih aralığındaki her gün için etkinlik sayısı, toplam kapasite ve toplam kalan kapasite.
+        GET /api/events/calendar/?from=2025-06-01&to=2025-06-30
+        
+        Sadece aktif etkinlikler sayılır; günler sunucunun saat dilimine (TIME_ZONE) göredir.
+        Aralık en fazla EVENT_CALENDAR_MAX_DAYS gün olabilir.
+        """
+        serializer = EventCalendarQuerySerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        results = EventCalendarService.get_calendar(
+            serializer.validated_data['from'],
+            serializer.validated_data['to']
+        )
+        return Response({'results': results})
+
+    @action(detail=False, methods=['get'], url_path='sales')
+    def sales_overview(self, request):
+        """
+        Aralıkta en çok onay alan etkinlikleri toplam sayaçlarıyla döndürür.
+        GET /api/events/sales/?from=...&to=...&limit=20
+        
+        Sadece superuser (admin) erişebilir. Aralık verilmezse son 60 dakika.
+        """
+        if not request.user.is_superuser:
+            return Response(
+                {'error': 'Only superuser (admin) can view sales analytics.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
+        serializer = EventSalesQuerySerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        params = serializer.validated_data
+        results = EventSalesService.top_events(params['from'], params['to'], params['limit'])
+        return Response({'from': params['from'], 'to': params['to'], 'results': results})
+
+    @action(detail=True, methods=['get'])
+    def sales(self, request, pk=None):
+        """
+        Etkinliğin dakikalık HOLD, onay, iptal ve süre dolma miktarları.
+        GET /api/events/{id}/sales/?from=...&to=...
+        
+        Sadece superuser (admin) erişebilir. Aralık verilmezse son 60 dakika;
+        en fazla EVENT_SALES_MAX_MINUTES dakika sorgulanabilir.
+        """
+        if not request.user.is_superuser:
+            return Response(
+                {'error': 'Only superuser (admin) can view sales analytics.'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
+        serializer = EventSalesQuerySerializer(data=request.query_params)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        
+        event = self.get_object()
+        params = serializer.validated_data
+        return Response(EventSalesService.series(event.id, params['from'], params['to']))
+
     def get_queryset(self):
         """
-        Tarih aralığı ve aktif duruma göre filtreleme yapar.
+        Tarih aralığı, aktif durum ve arama terimine göre filtreleme yapar.
         """
         queryset = super().get_queryset()
+        fields = EventSerializer.requested_fields(self.request)
+        if fields is not None:
+            # ?fields= / ?omit=: sadece istenen alanların sütunları yüklenir
+            queryset = EventSerializer.sparse_queryset(queryset, fields)
+        else:
+            # Arama vektörü yanıtta kullanılmaz, her satırla birlikte yüklenmez
+            queryset = queryset.defer('search_vector')
         start_date = self.request.query_params.get('start_date')
         end_date = self.request.query_params.get('end_date')
         is_active = self.request.query_params.get('is_active')
+        search = self.request.query_params.get('q', '').strip()
         
         if start_date:
             queryset = queryset.filter(start_time__gte=start_date)
@@ -135,6 +330,11 @@ class EventViewSet(viewsets.ModelViewSet):
             queryset = queryset.filter(end_time__lte=end_date)
         if is_active is not None:
             queryset = queryset.filter(is_active=is_active.lower() == 'true')
+        if search:
+            queryset = queryset.search(search)
+        if self.action in ('list', 'retrieve') and (fields is None or fields & EventSerializer.CAPACITY_FIELDS):
+            # Kapasite alanları sayfa başına tek sorguda hesaplanır (bkz. Event.capacity_snapshot)
+            queryset = queryset.with_capacity()
         
         return queryset
 
@@ -147,11 +347,33 @@ class ReservationViewSet(viewsets.ReadOnlyModelViewSet):
     serializer_class = ReservationSerializer
     permission_classes = [IsAuthenticated]
 
+    def list(self, request, *args, **kwargs):
+        """
+        Kullanıcının rezervasyonlarını listeler.
+        GET /api/reservations/
+        
+        Satırlar values() ile okunup ReservationValuesSerializer ile yazılır (ReservationSerializer ile aynı çıktı).
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        serializer = ReservationValuesSerializer(fields=ReservationSerializer.requested_fields(request))
+        rows = serializer.values(queryset)
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(serializer.to_representation(page))
+        return Response(serializer.to_representation(rows))
+
     def get_queryset(self):
         """
         Kullanıcılar sadece kendi rezervasyonlarını görebilir.
+        
+        `?fields=` / `?omit=` verilirse sadece istenen alanların sütunları ve ilişkileri yüklenir.
         """
-        return Reservation.objects.filter(user=self.request.user)
+        queryset = Reservation.objects.filter(user=self.request.user)
+        fields = ReservationSerializer.requested_fields(self.request)
+        if fields is not None:
+            return ReservationSerializer.sparse_queryset(queryset, fields)
+        # event_name ve user_username aynı sorguda gelir
+        return queryset.select_related('event', 'user')
 
     @action(detail=False, methods=['post'])
     def create_hold(self, request):
@@ -0,0 +1,173 @@
+"""
+İş ortaklarına rezervasyon olayları için webhook teslimi.
+
+WebhookSink, outbox relay'inin ilettiği mesajlardan eşleşen aboneliklere WebhookDelivery
+satırları oluşturur; deliver_webhooks görevi bunları uç nokta başına gruplayıp gönderir
+(bkz. WebhookDeliveryService). İstekler worker süreci içinde paylaşılan keep-alive
+bağlantılar üzerinden gider; aynı uç noktaya peş peşe giden istekler için her seferinde
+yeni TCP/TLS bağlantısı kurulmaz.
+
+Her istek şu başlıkları taşır:
+- X-Webhook-Id: outbox mesaj ID'si (alıcı tekrarları bununla ayıklar)
+- X-Webhook-Topic: 'reservation.confirmed' veya 'reservation.cancelled'
+- X-Webhook-Timestamp: Unix zamanı
+- X-Webhook-Signature: 'sha256=' + HMAC-SHA256(secret, '<timestamp>.<gövde>')
+"""
+import hashlib
+import hmac
+import http.client
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from django.conf import settings
+
+from core.renderers import FastJSONRenderer
+
+from .models import WebhookDelivery, WebhookSubscription
+from .outbox import OutboxSink
+
+
+class ConnectionPool:
+    """
+    (scheme, host, port) başına boşta bekleyen keep-alive HTTP bağlantıları.
+    Bir bağlantı aynı anda tek bir thread tarafından kullanılır.
+    """
+
+    def __init__(self, max_idle_per_host: int = 8):
+        self.max_idle_per_host = max_idle_per_host
+        self._idle: Dict[tuple, List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: tuple, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        """
+        Boşta bir bağlantı veya yeni bir bağlantı döndürür.
+
+        Returns:
+            (connection, reused): bağlantı ve daha önce kullanılmış olup olmadığı
+        """
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                connection = idle.pop()
+                connection.timeout = timeout
+                if connection.sock is not None:
+                    connection.sock.settimeout(timeout)
+                return connection, True
+        scheme, host, port = key
+        connection_class = http.client.HTTPSConnection if scheme == 'https' else http.client.HTTPConnection
+        return connection_class(host, port, timeout=timeout), False
+
+    def release(self, key: tuple, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def close_all(self) -> None:
+        with self._lock:
+            connections = [connection for idle in self._idle.values() for connection in idle]
+            self._idle.clear()
+        for connection in connections:
+            connection.close()
+
+
+pool = ConnectionPool()
+
+
+def sign(secret: str, timestamp: str, body: bytes) -> str:
+    """Gövdenin HMAC-SHA256 imzası (hex)."""
+    return hmac.new(secret.encode(), timestamp.encode() + b'.' + body, hashlib.sha256).hexdigest()
+
+
+def post(url: str, body: bytes, headers: dict, timeout: float) -> int:
+    """
+    Gövdeyi havuzdaki bir bağlantı ile POST eder ve HTTP durum kodunu döndürür.
+
+    Karşı tarafın kapattığı eski bir keep-alive bağlantı ile gönderim başarısız olursa
+    yeni bir bağlantı ile bir kez tekrar denenir.
+
+    Raises:
+        OSError, http.client.HTTPException: Bağlantı hataları
+    """
+    parts = urlsplit(url)
+    key = (parts.scheme, parts.hostname, parts.port or (443 if parts.scheme == 'https' else 80))
+    path = (parts.path or '/') + (f'?{parts.query}' if parts.query else '')
+
+    while True:
+        connection, reused = pool.acquire(key, timeout)
+        try:
+            connection.request('POST', path, body=body, headers=headers)
+            response = connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            if reused:
+                continue
+            raise
+        if response.will_close:
+            connection.close()
+        else:
+            pool.release(key, connection)
+        return response.status
+
+
+def send_batch(url: str, secret: str, messages: List[dict]) -> Tuple[int, Optional[str]]:
+    """
+    Mesajları aynı uç noktaya sırayla gönderir; ilk başarısız istekte durur.
+
+    Args:
+        messages: {id, topic, payload} sözlükleri
+
+    Returns:
+        (sent, error): başarıyla gönderilen baştaki mesaj sayısı ve varsa ilk hatanın açıklaması
+    """
+    renderer = FastJSONRenderer()
+    for sent, message in enumerate(messages):
+        body = renderer.render({'id': message['id'], 'topic': message['topic'], 'data': message['payload']})
+        timestamp = str(int(time.time()))
+        headers = {
+            'Content-Type': 'application/json',
+            'User-Agent': 'reservation-system-webhooks',
+            'X-Webhook-Id': str(message['id']),
+            'X-Webhook-Topic': message['topic'],
+            'X-Webhook-Timestamp': timestamp,
+            'X-Webhook-Signature': f'sha256={sign(secret, timestamp, body)}',
+        }
+        try:
+            status = post(url, body, headers, settings.WEBHOOK_TIMEOUT)
+        except (OSError, http.client.HTTPException) as e:
+            return sent, f'{type(e).__name__}: {e}'[:255]
+        if not 200 <= status < 300:
+            return sent, f'HTTP {status}'
+    return len(messages), None
+
+
+class WebhookSink(OutboxSink):
+    """
+    Outbox mesajlarından eşleşen aktif aboneliklere teslim satırları oluşturur.
+    Relay transaction'ı içinde çalışır; aynı mesaj tekrar gelirse yeni teslim oluşmaz.
+    """
+
+    def publish(self, messages: List[dict]) -> None:
+        relevant = [message for message in messages if message['topic'] in WebhookSubscription.TOPICS]
+        if not relevant:
+            return
+        subscriptions = list(WebhookSubscription.objects.filter(is_active=True))
+        WebhookDelivery.objects.bulk_create(
+            [
+                WebhookDelivery(
+                    subscription=subscription,
+                    message_id=message['id'],
+                    topic=message['topic'],
+                    payload=message['payload'],
+                )
+                for message in relevant
+                for subscription in subscriptions
+                if subscription.matches(message['topic'], message['key'])
+            ],
+            ignore_conflicts=True
+        )
@@ -5,6 +5,7 @@ Celery arka plan işleri için kullanılır, özellikle HOLD rezervasyonlarını
 """
 import os
 from celery import Celery
+from kombu import Queue
 
 # Celery için varsayılan Django settings modülünü ayarla
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'reservation_system.settings')
@@ -15,6 +16,29 @@ app = Celery('reservation_system')
 # namespace='CELERY' tüm celery ile ilgili yapılandırma anahtarlarının 'CELERY_' öneki ile başlaması gerektiği anlamına gelir
 app.config_from_object('django.conf:settings', namespace='CELERY')
 
+# Görev kuyrukları; her kuyruk ayrı bir worker tarafından işlenir (bkz. docker-compose.yml).
+# Zaman kritik süre dolma taraması yavaş bakım işleri veya webhook gönderimlerinin arkasında beklemez.
+# -Q verilmeden başlatılan worker (geliştirme ortamı) tüm kuyrukları dinler.
+app.conf.task_queues = (
+    Queue('expiry'),          # expire_old_hold_reservations
+    Queue('notifications'),   # outbox relay ve webhook teslimleri (ağ ağırlıklı)
+    Queue('maintenance'),     # önbellek derleme, dengeleme, temizlik ve partition bakımı
+    Queue('celery'),          # yönlendirilmemiş görevler
+)
+app.conf.task_default_queue = 'celery'
+app.conf.task_routes = {
+    'expire_old_hold_reservations': {'queue': 'expiry'},
+    'relay_outbox': {'queue': 'notifications'},
+    'deliver_webhooks': {'queue': 'notifications'},
+    'rebalance_inventory_buckets': {'queue': 'maintenance'},
+    'build_featured_events': {'queue': 'maintenance'},
+    'maintain_reservation_partitions': {'queue': 'maintenance'},
+    'purge_event_changes': {'queue': 'maintenance'},
+    'purge_expired_tokens': {'queue': 'maintenance'},
+}
+# Worker process'i başına tek görev önceden alınır; uzun bir görev arkasında başka görevler bekletilmez
+app.conf.worker_prefetch_multiplier = 1
+
 # Tüm kayıtlı Django uygulamalarından task modüllerini yükle
 # Tüm kurulu uygulamalardaki tasks.py dosyalarını keşfeder
 app.autodiscover_tasks()
@@ -27,6 +27,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',  # Etkinlik araması (trigram lookup'ları)
     # Üçüncü parti uygulamalar
     'rest_framework',
     'rest_framework_simplejwt',
@@ -46,6 +47,7 @@ MIDDLEWARE = [
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'core.middleware.ReplicaRoutingMiddleware',
 ]
 
 ROOT_URLCONF = 'reservation_system.urls'
@@ -82,6 +84,34 @@ DATABASES = {
     }
 }
 
+# İsteğe bağlı okuma replikası
+# DB_REPLICA_HOST tanımlıysa salt okunur istekler replikadan okunur (core/routers.py)
+DB_REPLICA_HOST = config('DB_REPLICA_HOST', default='')
+if DB_REPLICA_HOST:
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'HOST': DB_REPLICA_HOST,
+        'PORT': config('DB_REPLICA_PORT', default=DATABASES['default']['PORT']),
+        'USER': config('DB_REPLICA_USER', default=DATABASES['default']['USER']),
+        'PASSWORD': config('DB_REPLICA_PASSWORD', default=DATABASES['default']['PASSWORD']),
+        'TEST': {'MIRROR': 'default'},
+    }
+DATABASE_ROUTERS = ['core.routers.PrimaryReplicaRouter']
+# Bir yazmadan sonra istemcinin birincilden okumaya devam edeceği süre (saniye)
+REPLICA_STICKY_SECONDS = config('REPLICA_STICKY_SECONDS', default=5, cast=int)
+
+
+# Önbellek
+# CACHE_URL tanımlıysa Redis, aksi halde süreç içi bellek önbelleği kullanılır
+CACHE_URL = config('CACHE_URL', default='')
+CACHES = {
+    'default': (
+        {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': CACHE_URL}
+        if CACHE_URL else
+        {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+    )
+}
+
 
 # Şifre doğrulama
 
@@ -100,6 +130,44 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Parola hash profilleri
+# Seçilen profilin hasher'ı yeni hash'ler için kullanılır; diğerleri eski hash'leri doğrular.
+# Profil veya parametreler değiştiğinde hash'ler bir sonraki girişte otomatik yenilenir.
+# 'argon2' profili için argon2-cffi paketi gerekir.
+PASSWORD_HASHER_PROFILES = {
+    'pbkdf2': 'users.hashers.TunedPBKDF2PasswordHasher',
+    'scrypt': 'users.hashers.TunedScryptPasswordHasher',
+    'argon2': 'users.hashers.TunedArgon2PasswordHasher',
+}
+PASSWORD_HASHER_PROFILE = config('PASSWORD_HASHER_PROFILE', default='pbkdf2')
+PASSWORD_HASHERS = [PASSWORD_HASHER_PROFILES[PASSWORD_HASHER_PROFILE]] + [
+    hasher for profile, hasher in PASSWORD_HASHER_PROFILES.items() if profile != PASSWORD_HASHER_PROFILE
+]
+# Boş bırakılan parametreler için Django varsayılanları kullanılır
+PASSWORD_HASHER_PARAMS = {
+    name: value for name, value in {
+        'PBKDF2_ITERATIONS': config('PBKDF2_ITERATIONS', default=0, cast=int),
+        'SCRYPT_WORK_FACTOR': config('SCRYPT_WORK_FACTOR', default=0, cast=int),
+        'SCRYPT_BLOCK_SIZE': config('SCRYPT_BLOCK_SIZE', default=0, cast=int),
+        'SCRYPT_PARALLELISM': config('SCRYPT_PARALLELISM', default=0, cast=int),
+        'SCRYPT_MAXMEM': config('SCRYPT_MAXMEM', default=0, cast=int),
+        'ARGON2_TIME_COST': config('ARGON2_TIME_COST', default=0, cast=int),
+        'ARGON2_MEMORY_COST': config('ARGON2_MEMORY_COST', default=0, cast=int),
+        'ARGON2_PARALLELISM': config('ARGON2_PARALLELISM', default=0, cast=int),
+    }.items() if value
+}
+
+# Parola hash'leme havuzu (users/services.py - PasswordHashingService)
+# 'inline': istek thread'inde, 'thread': thread havuzu, 'process': düşük öncelikli process havuzu
+AUTH_HASHING_MODE = config('AUTH_HASHING_MODE', default='inline')
+# Aynı anda çalışan hash sayısı ve sırada bekleyebilecek ek istek sayısı
+AUTH_HASHING_WORKERS = config('AUTH_HASHING_WORKERS', default=2, cast=int)
+AUTH_HASHING_QUEUE_SIZE = config('AUTH_HASHING_QUEUE_SIZE', default=8, cast=int)
+# Sıra doluysa bu kadar saniye beklenir, sonra 503 döner
+AUTH_HASHING_WAIT_TIMEOUT = config('AUTH_HASHING_WAIT_TIMEOUT', default=1.0, cast=float)
+# 'process' modunda hash process'lerinin nice değeri
+AUTH_HASHING_NICE = config('AUTH_HASHING_NICE', default=5, cast=int)
+
 
 # Uluslararasılaştırma
 
@@ -127,18 +195,19 @@ AUTH_USER_MODEL = 'users.User'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'users.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
+    # orjson kuruluysa onu, değilse standart json modülünü kullanır (core/renderers.py, core/parsers.py)
     'DEFAULT_RENDERER_CLASSES': (
-        'rest_framework.renderers.JSONRenderer',
+        'core.renderers.FastJSONRenderer',
     ),
     'DEFAULT_PARSER_CLASSES': (
-        'rest_framework.parsers.JSONParser',
+        'core.parsers.FastJSONParser',
     ),
 }
 
@@ -161,8 +230,92 @@ SIMPLE_JWT = {
         'rest_framework_simplejwt.tokens.AccessToken',
     ),
     'TOKEN_TYPE_CLAIM': 'token_type',
+    # Kara liste kontrolü önce önbellekten yapılır (users/tokens.py)
+    'TOKEN_REFRESH_SERIALIZER': 'users.tokens.CachedTokenRefreshSerializer',
 }
 
+# Etkinlik araması için PostgreSQL metin arama yapılandırması
+# 'simple' dilden bağımsızdır; tek dilli kurulumlarda 'turkish' veya 'english' kullanılabilir
+EVENT_SEARCH_CONFIG = config('EVENT_SEARCH_CONFIG', default='simple')
+
+# Ana sayfa öne çıkan etkinlik listesi (build_featured_events görevi ile önceden hesaplanır)
+# Listedeki en fazla etkinlik sayısı
+FEATURED_EVENTS_LIMIT = config('FEATURED_EVENTS_LIMIT', default=50, cast=int)
+# Durumda listenin ötesinde tutulan yedek etkinlik sayısı; bu kadar etkinlik çıkana kadar liste baştan derlenmez
+FEATURED_EVENTS_BUFFER = config('FEATURED_EVENTS_BUFFER', default=10, cast=int)
+# Önbellekteki listenin ömrü (saniye); görev çalışmazsa ilk istek listeyi yeniden derler
+FEATURED_EVENTS_TIMEOUT = config('FEATURED_EVENTS_TIMEOUT', default=300, cast=int)
+
+# Toplu kapasite sorgusu (GET /api/events/availability/?ids=...)
+# Tek istekte sorgulanabilecek en fazla etkinlik sayısı
+EVENT_AVAILABILITY_MAX_IDS = config('EVENT_AVAILABILITY_MAX_IDS', default=200, cast=int)
+# ?cached=true ile kabul edilen en eski kapasite değeri (saniye)
+EVENT_AVAILABILITY_CACHE_TIMEOUT = config('EVENT_AVAILABILITY_CACHE_TIMEOUT', default=5, cast=int)
+
+# Delta senkronizasyonu (GET /api/events/changes/?since=...)
+# Cursor bu kadar saniyeden eski değişikliklere kadar ilerletilir (geç commit edilen transaction'lar için pay)
+EVENT_CHANGES_LAG_SECONDS = config('EVENT_CHANGES_LAG_SECONDS', default=5, cast=int)
+# Tek istekte okunan en fazla değişiklik kaydı
+EVENT_CHANGES_PAGE_SIZE = config('EVENT_CHANGES_PAGE_SIZE', default=1000, cast=int)
+# Değişiklik kayıtlarının saklanma süresi (saat); daha eski cursor'lar 410 alır
+EVENT_CHANGES_RETENTION_HOURS = config('EVENT_CHANGES_RETENTION_HOURS', default=24, cast=int)
+
+# Takvim özeti (GET /api/events/calendar/?from=...&to=...)
+# Tek istekte istenebilecek en fazla gün sayısı
+EVENT_CALENDAR_MAX_DAYS = config('EVENT_CALENDAR_MAX_DAYS', default=62, cast=int)
+# Geçmiş günlerin özetlerinin önbellekte tutulma süresi (saniye)
+EVENT_CALENDAR_CACHE_TIMEOUT = config('EVENT_CALENDAR_CACHE_TIMEOUT', default=86400, cast=int)
+
+# Satış analitiği (dakikalık sayaçlar, GET /api/events/{id}/sales/)
+# Satış açılışında aynı dakikadaki eşzamanlı güncellemelerin dağıtıldığı parça sayısı
+EVENT_SALES_ROLLUP_SHARDS = config('EVENT_SALES_ROLLUP_SHARDS', default=8, cast=int)
+# Tek istekte sorgulanabilecek en uzun aralık (dakika)
+EVENT_SALES_MAX_MINUTES = config('EVENT_SALES_MAX_MINUTES', default=1440, cast=int)
+
+# Rezervasyon durum değişiklikleri için outbox (events/outbox.py, relay_outbox görevi)
+# Mesajların iletildiği hedefler: events.outbox.LoggingSink, RedisStreamSink, InMemorySink
+# ve webhook teslimlerini oluşturan events.webhooks.WebhookSink
+OUTBOX_SINKS = config(
+    'OUTBOX_SINKS', default='events.outbox.LoggingSink,events.webhooks.WebhookSink', cast=Csv()
+)
+# Paralel relay'lerin paylaştığı partition sayısı; bekleyen mesaj varken değiştirilmemelidir
+OUTBOX_PARTITIONS = config('OUTBOX_PARTITIONS', default=16, cast=int)
+# Bir transaction'da iletilip silinen en fazla mesaj sayısı
+OUTBOX_BATCH_SIZE = config('OUTBOX_BATCH_SIZE', default=500, cast=int)
+# Bu kadar saniyeden yeni mesajlar beklenir (geç commit edilen transaction'lar sırayı bozmasın)
+OUTBOX_LAG_SECONDS = config('OUTBOX_LAG_SECONDS', default=2, cast=int)
+# RedisStreamSink ayarları
+OUTBOX_REDIS_URL = config('OUTBOX_REDIS_URL', default='redis://localhost:6379/0')
+OUTBOX_REDIS_STREAM = config('OUTBOX_REDIS_STREAM', default='reservations')
+OUTBOX_REDIS_STREAM_MAXLEN = config('OUTBOX_REDIS_STREAM_MAXLEN', default=100000, cast=int)
+
+# İş ortağı webhook'ları (events/webhooks.py, deliver_webhooks görevi)
+# İstek başına zaman aşımı (saniye)
+WEBHOOK_TIMEOUT = config('WEBHOOK_TIMEOUT', default=5, cast=int)
+# Aynı anda gönderim yapılan en fazla uç nokta sayısı
+WEBHOOK_MAX_CONCURRENCY = config('WEBHOOK_MAX_CONCURRENCY', default=8, cast=int)
+# Bir çalışmada alınan en fazla teslim sayısı
+WEBHOOK_BATCH_SIZE = config('WEBHOOK_BATCH_SIZE', default=500, cast=int)
+# Gönderim sürerken teslimlerin başka çalışmalardan gizlendiği süre (saniye)
+WEBHOOK_LEASE_SECONDS = config('WEBHOOK_LEASE_SECONDS', default=300, cast=int)
+# Başarısız teslimler bu kadar denemeden sonra FAILED olur; bekleme her denemede iki katına çıkar
+WEBHOOK_MAX_ATTEMPTS = config('WEBHOOK_MAX_ATTEMPTS', default=8, cast=int)
+WEBHOOK_RETRY_BASE_SECONDS = config('WEBHOOK_RETRY_BASE_SECONDS', default=30, cast=int)
+
+# Periyodik işler için liderlik kilidi (core/locks.py)
+# Kilit süresi (saniye); iş sürerken üçte bir aralıkla yenilenir, düğüm çökerse bu süre sonunda düşer
+LEADER_LEASE_SECONDS = config('LEADER_LEASE_SECONDS', default=60, cast=int)
+
+# JWT kullanıcı önbelleği
+# Kimliği doğrulanmış kullanıcı bu kadar saniye önbellekte tutulur (kayıt/silmede temizlenir)
+# Sadece CACHE_URL tanımlıysa kullanılır; QuerySet.update() ile yapılan değişiklikler en geç bu süre sonra geçerli olur
+JWT_USER_CACHE_TIMEOUT = config('JWT_USER_CACHE_TIMEOUT', default=60, cast=int)
+# True ise salt okunur etkinlik istekleri veritabanına gitmeden token claim'lerinden doğrulanır
+JWT_STATELESS_READS = config('JWT_STATELESS_READS', default=False, cast=bool)
+# Kara listede olmayan refresh token sonuçlarının önbellekte tutulma süresi (saniye)
+# Sadece CACHE_URL tanımlıysa (paylaşılan önbellek) kullanılır; aksi halde bu sonuçlar önbelleğe alınmaz
+JWT_BLACKLIST_NEGATIVE_TIMEOUT = config('JWT_BLACKLIST_NEGATIVE_TIMEOUT', default=30, cast=int)
+
 # Celery Yapılandırması
 # Redis mesaj broker olarak kullanılır
 CELERY_BROKER_URL = config('CELERY_BROKER_URL', default='redis://localhost:6379/0')
@@ -172,6 +325,3 @@ CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
-
-# Görevlerin kayıt edilmesini sağlamak için açıkça import edilir
-CELERY_IMPORTS = ('events.tasks',)
@@ -0,0 +1,105 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.authentication import JWTAuthentication, JWTStatelessUserAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .models import User
+from .tokens import shared_cache_enabled
+
+
+# Only what authentication and permission checks need; the password hash never leaves the database.
+CACHED_USER_FIELDS = ('id', 'username', 'is_active', 'is_staff', 'is_superuser')
+
+
+def user_cache_key(user_id) -> str:
+    return f'auth:user:{user_id}'
+
+
+def get_cached_user(user_id):
+    """
+    Return the user with the given id built from its cached CACHED_USER_FIELDS,
+    loading them from the database on a miss. Returns None if the user does not exist.
+
+    The returned instance has every other field deferred: reading one (e.g. email) loads it
+    from the database, and save() only writes the cached fields.
+    """
+    key = user_cache_key(user_id)
+    values = cache.get(key)
+    if values is None:
+        values = User.objects.filter(**{api_settings.USER_ID_FIELD: user_id}).values(*CACHED_USER_FIELDS).first()
+        if values is None:
+            return None
+        cache.set(key, values, settings.JWT_USER_CACHE_TIMEOUT)
+    field_names = [field.attname for field in User._meta.concrete_fields if field.attname in values]
+    return User.from_db(User.objects.db, field_names, [values[name] for name in field_names])
+
+
+def invalidate_cached_user(user_id) -> None:
+    cache.delete(user_cache_key(user_id))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that resolves request.user from a short-TTL cache keyed by user id.
+    This is like Spring Security's UserCache in front of the UserDetailsService.
+
+    The default JWTAuthentication runs one users table query per authenticated request.
+    Only the fields in CACHED_USER_FIELDS are cached. Entries are dropped whenever a user is
+    saved or deleted through the ORM (see users/signals.py); changes made with
+    QuerySet.update() or bulk_update() send no signals and take effect after
+    JWT_USER_CACHE_TIMEOUT seconds.
+
+    The cache is only used when CACHE_URL points at a shared cache. With the per-process
+    LocMem fallback an invalidation would only reach one worker, so every request loads the
+    user like the stock class does. The stock path is also used with CHECK_REVOKE_TOKEN,
+    which needs the password hash.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_('Token contained no recognizable user identification')) from e
+
+        if not shared_cache_enabled() or api_settings.CHECK_REVOKE_TOKEN:
+            return super().get_user(validated_token)
+
+        user = get_cached_user(user_id)
+        if user is None:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found')
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+
+        return user
+
+
+class StatelessReadAuthenticationMixin:
+    """
+    ViewSet mixin that authenticates safe (read-only) requests from the token claims alone.
+
+    When JWT_STATELESS_READS is enabled, GET/HEAD/OPTIONS requests get a TokenUser built from
+    the access token and never touch the users table. Write requests keep the regular
+    authentication classes because they need the real user (e.g. is_superuser checks).
+    Read actions that need the real user too (e.g. admin-only reports) are listed in
+    `stateful_read_actions`.
+    """
+    stateful_read_actions = ()
+
+    def initialize_request(self, request, *args, **kwargs):
+        # self.action is only set after the authenticators are built, so it is resolved here
+        action = getattr(self, 'action_map', {}).get(request.method.lower())
+        self._stateless_read = (
+            settings.JWT_STATELESS_READS
+            and request.method in SAFE_METHODS
+            and action not in self.stateful_read_actions
+        )
+        return super().initialize_request(request, *args, **kwargs)
+
+    def get_authenticators(self):
+        if getattr(self, '_stateless_read', False):
+            return [JWTStatelessUserAuthentication()]
+        return super().get_authenticators()
@@ -0,0 +1,66 @@
+"""
+Password hashers whose work factors come from settings.
+
+The algorithm names match Django's built-in hashers, so existing hashes keep verifying.
+When a work factor changes (or PASSWORD_HASHER_PROFILE switches algorithm), Django's
+check_password() reports must_update and the hash is transparently upgraded on the next login.
+This is like configuring Spring Security's DelegatingPasswordEncoder with tuned encoders.
+"""
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    PBKDF2PasswordHasher,
+    ScryptPasswordHasher,
+)
+
+
+def _param(name, default):
+    return settings.PASSWORD_HASHER_PARAMS.get(name, default)
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 with PASSWORD_HASHER_PARAMS['PBKDF2_ITERATIONS'] iterations."""
+
+    @property
+    def iterations(self):
+        return _param('PBKDF2_ITERATIONS', PBKDF2PasswordHasher.iterations)
+
+
+class TunedScryptPasswordHasher(ScryptPasswordHasher):
+    """scrypt with work factor, block size and parallelism from PASSWORD_HASHER_PARAMS."""
+
+    @property
+    def work_factor(self):
+        return _param('SCRYPT_WORK_FACTOR', ScryptPasswordHasher.work_factor)
+
+    @property
+    def block_size(self):
+        return _param('SCRYPT_BLOCK_SIZE', ScryptPasswordHasher.block_size)
+
+    @property
+    def parallelism(self):
+        return _param('SCRYPT_PARALLELISM', ScryptPasswordHasher.parallelism)
+
+    @property
+    def maxmem(self):
+        # 0 keeps OpenSSL's 32 MiB limit; raise it together with larger work factors
+        return _param('SCRYPT_MAXMEM', ScryptPasswordHasher.maxmem)
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2id with time cost, memory cost (KiB) and parallelism from PASSWORD_HASHER_PARAMS.
+    Requires the optional argon2-cffi package.
+    """
+
+    @property
+    def time_cost(self):
+        return _param('ARGON2_TIME_COST', Argon2PasswordHasher.time_cost)
+
+    @property
+    def memory_cost(self):
+        return _param('ARGON2_MEMORY_COST', Argon2PasswordHasher.memory_cost)
+
+    @property
+    def parallelism(self):
+        return _param('ARGON2_PARALLELISM', Argon2PasswordHasher.parallelism)
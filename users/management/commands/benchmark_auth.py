@@ -0,0 +1,122 @@
+"""
+Django management command that measures login throughput against reservation latency.
+
+It first runs hold requests alone (baseline), then the same number of hold requests while
+a login burst runs in parallel, and reports logins/sec and reservation p50/p99 for both runs.
+Run it once per AUTH_HASHING_MODE / PASSWORD_HASHER_PROFILE combination to compare them.
+
+Creates temporary benchmark users and an event in the configured database and removes them
+afterwards. Do not run it against production.
+
+Usage: python manage.py benchmark_auth [--logins 200] [--reservations 200] [--concurrency 8]
+"""
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+from django.test import Client
+from django.utils import timezone
+
+from events.models import Event
+from users.models import User
+from users.tokens import CachedRefreshToken
+
+BENCHMARK_PASSWORD = 'benchmark-Passw0rd!'
+
+
+class Command(BaseCommand):
+    help = 'Measures logins/sec and reservation p99 latency with and without a login burst'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--logins', type=int, default=200, help='Number of login requests')
+        parser.add_argument('--reservations', type=int, default=200, help='Number of hold requests per run')
+        parser.add_argument('--concurrency', type=int, default=8, help='Client threads per request type')
+
+    def handle(self, *args, **options):
+        concurrency = options['concurrency']
+        prefix = f'bench-{uuid.uuid4().hex[:8]}'
+        users = [
+            User.objects.create_user(
+                username=f'{prefix}-{i}',
+                email=f'{prefix}-{i}@example.com',
+                password=BENCHMARK_PASSWORD,
+            )
+            for i in range(concurrency)
+        ]
+        event = Event.objects.create(
+            name=f'{prefix} event',
+            start_time=timezone.now() + timedelta(days=1),
+            end_time=timezone.now() + timedelta(days=2),
+            capacity=2 * options['reservations'] + 1,
+        )
+        tokens = [str(CachedRefreshToken.for_user(user).access_token) for user in users]
+
+        try:
+            baseline = self._run(event, users, tokens, options['reservations'], 0, concurrency)
+            burst = self._run(event, users, tokens, options['reservations'], options['logins'], concurrency)
+        finally:
+            event.delete()
+            User.objects.filter(username__startswith=prefix).delete()
+
+        self._report('Reservations only', baseline)
+        self._report('Reservations during login burst', burst)
+
+    def _run(self, event, users, tokens, reservations, logins, concurrency):
+        def hold(i):
+            client = Client(HTTP_AUTHORIZATION=f'Bearer {tokens[i % len(tokens)]}')
+            try:
+                started = time.perf_counter()
+                response = client.post(
+                    '/api/reservations/create_hold/',
+                    {'event_id': event.id, 'quantity': 1},
+                    content_type='application/json',
+                )
+                return time.perf_counter() - started, response.status_code
+            finally:
+                connections.close_all()
+
+        def login(i):
+            client = Client()
+            try:
+                response = client.post(
+                    '/api/auth/users/login/',
+                    {'username': users[i % len(users)].username, 'password': BENCHMARK_PASSWORD},
+                    content_type='application/json',
+                )
+                return response.status_code
+            finally:
+                connections.close_all()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as hold_pool, \
+                ThreadPoolExecutor(max_workers=concurrency) as login_pool:
+            started = time.perf_counter()
+            login_futures = [login_pool.submit(login, i) for i in range(logins)]
+            hold_results = list(hold_pool.map(hold, range(reservations)))
+            login_statuses = [future.result() for future in login_futures]
+            elapsed = time.perf_counter() - started
+
+        latencies = sorted(latency for latency, _ in hold_results)
+        return {
+            'elapsed': elapsed,
+            'logins': login_statuses.count(200),
+            'rejected_logins': login_statuses.count(503),
+            'failed_holds': sum(1 for _, code in hold_results if code != 201),
+            'p50': statistics.median(latencies) if latencies else 0,
+            'p99': latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] if latencies else 0,
+        }
+
+    def _report(self, title, result):
+        self.stdout.write(self.style.SUCCESS(title))
+        if result['logins'] or result['rejected_logins']:
+            self.stdout.write(
+                f'  logins/sec: {result["logins"] / result["elapsed"]:.1f} '
+                f'({result["rejected_logins"]} rejected with 503)'
+            )
+        self.stdout.write(
+            f'  reservation p50: {result["p50"] * 1000:.1f} ms, p99: {result["p99"] * 1000:.1f} ms '
+            f'({result["failed_holds"]} failed)'
+        )
@@ -0,0 +1,111 @@
+"""
+Django management command that provisions users in bulk from a CSV file.
+
+Used for load test datasets and corporate attendee imports, where going through
+UserRegistrationSerializer (validation + hashing + one INSERT per user) is far too slow.
+
+CSV columns (header row required): username, email, and optionally first_name, last_name,
+password (plain text, hashed here in a process pool) or password_hash (an already encoded
+Django hash, stored as-is). Rows with neither get an unusable password.
+
+The file is streamed in batches; each batch is hashed in parallel and inserted with a single
+bulk_create. Rows whose username or email already exists are skipped.
+
+Usage: python manage.py bulk_create_users users.csv [--batch-size 1000] [--workers 4]
+"""
+import csv
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.core.management.base import BaseCommand, CommandError
+
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = 'Creates users in bulk from a CSV file (username,email[,password|password_hash,...])'
+
+    def add_arguments(self, parser):
+        parser.add_argument('csv_file', help="Path to the CSV file, or '-' for stdin")
+        parser.add_argument('--batch-size', type=int, default=1000, help='Users per INSERT (default: 1000)')
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=os.cpu_count() or 1,
+            help='Hashing processes; 0 hashes in this process (default: CPU count)'
+        )
+
+    def handle(self, *args, **options):
+        if options['csv_file'] == '-':
+            return self._import(sys.stdin, options)
+        try:
+            with open(options['csv_file'], newline='', encoding='utf-8') as csv_file:
+                return self._import(csv_file, options)
+        except FileNotFoundError as e:
+            raise CommandError(f'File not found: {options["csv_file"]}') from e
+
+    def _import(self, csv_file, options):
+        reader = csv.DictReader(csv_file)
+        missing = {'username', 'email'} - set(reader.fieldnames or ())
+        if missing:
+            raise CommandError(f'Missing CSV column(s): {", ".join(sorted(missing))}')
+
+        executor = ProcessPoolExecutor(max_workers=options['workers']) if options['workers'] > 0 else None
+        users_before = User.objects.count()
+        processed = 0
+        try:
+            while True:
+                rows = list(islice(reader, options['batch_size']))
+                if not rows:
+                    break
+                users = self._build_users(rows, executor, options['workers'], reader.line_num - len(rows))
+                User.objects.bulk_create(users, batch_size=options['batch_size'], ignore_conflicts=True)
+                processed += len(rows)
+                self.stdout.write(f'Processed {processed} row(s)')
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        created = User.objects.count() - users_before
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Created {created} user(s), skipped {processed - created} existing or duplicate row(s)'
+            )
+        )
+
+    def _build_users(self, rows, executor, workers, first_line):
+        plain = [i for i, row in enumerate(rows) if not row.get('password_hash') and row.get('password')]
+        passwords = [rows[i]['password'] for i in plain]
+        if executor is not None and passwords:
+            chunksize = max(1, len(passwords) // (workers * 4))
+            hashes = list(executor.map(make_password, passwords, chunksize=chunksize))
+        else:
+            hashes = [make_password(password) for password in passwords]
+        encoded = dict(zip(plain, hashes))
+
+        users = []
+        for i, row in enumerate(rows):
+            line = first_line + i + 1
+            username = (row.get('username') or '').strip()
+            email = (row.get('email') or '').strip()
+            if not username or not email:
+                raise CommandError(f'Line {line}: username and email are required')
+
+            password = encoded.get(i) or row.get('password_hash') or make_password(None)
+            if row.get('password_hash'):
+                try:
+                    identify_hasher(password)
+                except ValueError as e:
+                    raise CommandError(f'Line {line}: password_hash is not a valid Django password hash') from e
+
+            users.append(User(
+                username=User.normalize_username(username),
+                email=User.objects.normalize_email(email),
+                first_name=(row.get('first_name') or '').strip(),
+                last_name=(row.get('last_name') or '').strip(),
+                password=password,
+            ))
+        return users
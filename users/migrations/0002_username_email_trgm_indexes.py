@@ -0,0 +1,40 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:14
+
+from django.db import migrations
+
+TRIGRAM_INDEXES = {
+    'users_username_trgm_idx': 'username',
+    'users_email_trgm_idx': 'email',
+}
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """
+    Create trigram indexes for the admin's `UPPER(column::text) LIKE` search (PostgreSQL only).
+    """
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, column in TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} '
+            f'ON users USING gin ((UPPER(("{column}")::text)) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
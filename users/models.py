@@ -22,3 +22,28 @@ class User(AbstractUser):
     def __str__(self) -> str:
         return self.username
 
+    def set_password(self, raw_password):
+        """
+        Hash the password in the bounded hashing pool (see PasswordHashingService).
+        create_user(), registration and the dummy hash for unknown usernames all go through here.
+        """
+        from .services import PasswordHashingService
+
+        self.password = PasswordHashingService.make_password(raw_password)
+        self._password = raw_password
+
+    def check_password(self, raw_password):
+        """
+        Verify the password in the bounded hashing pool.
+        Like Django's implementation, the hash is upgraded when the hasher profile changed.
+        """
+        from .services import PasswordHashingService
+
+        is_correct, must_update = PasswordHashingService.verify_password(raw_password, self.password)
+        if is_correct and must_update:
+            self.set_password(raw_password)
+            # Password hash upgrades shouldn't be considered password changes
+            self._password = None
+            self.save(update_fields=['password'])
+        return is_correct
+
@@ -0,0 +1,97 @@
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+from core.exceptions import AuthBusyError
+
+
+def _init_hashing_process():
+    # Hashing processes run at a lower priority than the request workers
+    os.nice(settings.AUTH_HASHING_NICE)
+
+
+class PasswordHashingService:
+    """
+    Service that runs password hashing in a bounded worker pool.
+    This is like a Spring @Async method backed by a bounded ThreadPoolTaskExecutor.
+
+    Hashing is deliberately CPU-expensive. Without a bound, a login burst before an on-sale
+    occupies every CPU and starves reservation requests. AUTH_HASHING_MODE selects:
+    - 'inline': hash on the request thread (Django's default behaviour)
+    - 'thread': a thread pool (hashlib and argon2 release the GIL while hashing)
+    - 'process': a process pool running at a lower priority (AUTH_HASHING_NICE)
+
+    At most AUTH_HASHING_WORKERS hashes run at once and AUTH_HASHING_QUEUE_SIZE more may wait.
+    Callers beyond that wait AUTH_HASHING_WAIT_TIMEOUT seconds for a slot and then get
+    AuthBusyError (HTTP 503), so excess logins are shed instead of queueing without limit.
+    """
+
+    _lock = threading.Lock()
+    _executor = None
+    _slots = None
+    _config = None
+
+    @classmethod
+    def _pool(cls):
+        config = (
+            settings.AUTH_HASHING_MODE,
+            settings.AUTH_HASHING_WORKERS,
+            settings.AUTH_HASHING_QUEUE_SIZE,
+        )
+        with cls._lock:
+            if cls._config != config:
+                cls.shutdown()
+                mode, workers, queue_size = config
+                if mode == 'thread':
+                    cls._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='auth-hash')
+                elif mode == 'process':
+                    cls._executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_hashing_process)
+                elif mode != 'inline':
+                    raise ValueError(f'Unknown AUTH_HASHING_MODE: {mode}')
+                cls._slots = threading.BoundedSemaphore(workers + queue_size)
+                cls._config = config
+            return cls._executor, cls._slots
+
+    @classmethod
+    def shutdown(cls):
+        """Stop the current pool (used when settings change and at test teardown)."""
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=True)
+        cls._executor = None
+        cls._slots = None
+        cls._config = None
+
+    @classmethod
+    def _run(cls, func, *args):
+        executor, slots = cls._pool()
+        if not slots.acquire(timeout=settings.AUTH_HASHING_WAIT_TIMEOUT):
+            raise AuthBusyError()
+        try:
+            if executor is None:
+                return func(*args)
+            return executor.submit(func, *args).result()
+        finally:
+            slots.release()
+
+    @classmethod
+    def make_password(cls, raw_password):
+        """
+        Hash a password with the preferred hasher (see PASSWORD_HASHER_PROFILE).
+        Unusable passwords (None) need no hashing and are created inline.
+        """
+        if raw_password is None:
+            return hashers.make_password(None)
+        return cls._run(hashers.make_password, raw_password)
+
+    @classmethod
+    def verify_password(cls, raw_password, encoded):
+        """
+        Check a password against its stored hash.
+
+        Returns:
+            (is_correct, must_update) like django.contrib.auth.hashers.verify_password
+        """
+        return cls._run(hashers.verify_password, raw_password, encoded)
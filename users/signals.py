@@ -0,0 +1,28 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from .authentication import invalidate_cached_user
+from .models import User
+from .tokens import mark_blacklisted
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance, **kwargs):
+    """
+    Drop the cached authentication user whenever the user changes.
+    This covers deactivation, password changes and deletion.
+    """
+    invalidate_cached_user(instance.pk)
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def cache_blacklisted_token(sender, instance, created, **kwargs):
+    """
+    Record newly blacklisted tokens in the cache so refresh/logout checks see them immediately.
+    Covers rotation, logout, the blacklist view and the admin.
+    """
+    if created:
+        token = instance.token
+        mark_blacklisted(token.jti, token.expires_at.timestamp())
@@ -0,0 +1,36 @@
+"""
+Celery tasks for the users app.
+"""
+from celery import shared_task
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+PURGE_BATCH_SIZE = 5000
+
+
+@shared_task(name='purge_expired_tokens')
+def purge_expired_tokens(batch_size: int = PURGE_BATCH_SIZE):
+    """
+    Periodic task that deletes expired refresh tokens from the outstanding token list.
+    This is like a Spring @Scheduled cleanup job for a token store.
+
+    Expired tokens can no longer be used, so neither their OutstandingToken rows nor their
+    BlacklistedToken rows (removed by cascade) are needed. Rows are deleted in chunks of
+    `batch_size` so a large backlog never holds a long lock on the tables.
+
+    Returns:
+        Number of outstanding tokens deleted
+    """
+    now = timezone.now()
+    deleted = 0
+    while True:
+        ids = list(
+            OutstandingToken.objects.filter(expires_at__lte=now)
+            .order_by()
+            .values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            return deleted
+        # only('id'): the token column holds the full JWT and is not needed to delete the row
+        OutstandingToken.objects.filter(id__in=ids).only('id').delete()
+        deleted += len(ids)
@@ -1,11 +1,26 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth import get_user_model
 from rest_framework.test import APITestCase, APIClient
 from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.token_blacklist.models import OutstandingToken, BlacklistedToken
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.core.management.base import CommandError
 from datetime import timedelta
 from django.utils import timezone
+from io import StringIO
+import os
+import tempfile
+from unittest import mock
+
+from .authentication import CACHED_USER_FIELDS, get_cached_user, user_cache_key
+from .services import PasswordHashingService
+from .tasks import purge_expired_tokens
+from .tokens import CachedRefreshToken, blacklist_cache_key, mark_blacklisted
 
 User = get_user_model()
 
@@ -287,3 +302,293 @@ class UserLogoutAPITestCase(APITestCase):
         )
         
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+
+@override_settings(CACHE_URL='redis://cache:6379/1')
+class CachedJWTAuthenticationTestCase(APITestCase):
+    """
+    Önbellekli JWT kullanıcı çözümlemesi için testler.
+    İstek başına sorgu sayısı ile ölçülür.
+    """
+    
+    def setUp(self):
+        """Test kullanıcısı ve access token'ı hazırlar."""
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        access = str(RefreshToken.for_user(self.user).access_token)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {access}')
+    
+    def _users_queries(self):
+        """Bir etkinlik listesi isteğinin toplam ve users tablosu sorgu sayılarını döndürür."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/events/')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        users = [q for q in queries.captured_queries if 'FROM "users"' in q['sql']]
+        return len(queries.captured_queries), len(users)
+    
+    def test_user_lookup_cached_between_requests(self):
+        """İkinci istekte users tablosuna sorgu atılmadığını test eder."""
+        first_total, first_users = self._users_queries()
+        second_total, second_users = self._users_queries()
+        
+        self.assertEqual(first_users, 1)
+        self.assertEqual(second_users, 0)
+        self.assertEqual(first_total - second_total, 1)
+    
+    def test_deactivated_user_rejected_immediately(self):
+        """Kullanıcı pasifleştirildiğinde önbelleğin temizlendiğini test eder."""
+        self._users_queries()
+        
+        self.user.is_active = False
+        self.user.save()
+        
+        response = self.client.get('/api/events/')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+    
+    def test_cached_user_excludes_password(self):
+        """Önbellekte sadece kimlik doğrulama alanlarının tutulduğunu test eder."""
+        self._users_queries()
+        
+        cached = cache.get(user_cache_key(self.user.pk))
+        self.assertEqual(set(cached), set(CACHED_USER_FIELDS))
+        self.assertEqual(get_cached_user(self.user.pk).email, 'test@example.com')
+    
+    @override_settings(CACHE_URL='')
+    def test_user_not_cached_without_shared_cache(self):
+        """Paylaşılan önbellek yoksa kullanıcının her istekte veritabanından yüklendiğini test eder."""
+        self._users_queries()
+        _, users_queries = self._users_queries()
+        
+        self.assertEqual(users_queries, 1)
+        self.assertIsNone(cache.get(user_cache_key(self.user.pk)))
+    
+    @override_settings(JWT_STATELESS_READS=True)
+    def test_stateless_reads_skip_users_table(self):
+        """Token claim'leri ile salt okunur isteklerin users tablosuna gitmediğini test eder."""
+        _, users_queries = self._users_queries()
+        
+        self.assertEqual(users_queries, 0)
+
+
+class RefreshTokenBlacklistCacheTestCase(APITestCase):
+    """
+    Önbellek destekli refresh token kara liste kontrolü ve süresi dolmuş token temizliği için testler.
+    """
+    
+    def setUp(self):
+        """Test kullanıcısı ve token'ları hazırlar."""
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+        self.refresh = RefreshToken.for_user(self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Bearer {self.refresh.access_token}')
+    
+    def _refresh(self, token):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post('/api/token/refresh/', {'refresh': str(token)}, format='json')
+        blacklist_queries = [
+            q for q in queries.captured_queries
+            if q['sql'].startswith('SELECT') and 'FROM "token_blacklist_blacklistedtoken" INNER JOIN' in q['sql']
+        ]
+        return response, len(blacklist_queries)
+    
+    def test_blacklisted_token_rejected_from_cache(self):
+        """Çıkış sonrası kara liste kontrolünün veritabanına gitmediğini test eder."""
+        self.client.post('/api/auth/users/logout/', {'refresh': str(self.refresh)}, format='json')
+        
+        response, blacklist_queries = self._refresh(self.refresh)
+        
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(blacklist_queries, 0)
+    
+    def test_rotated_token_rejected_from_cache(self):
+        """Rotasyonda kara listeye eklenen eski token'ın önbellekten reddedildiğini test eder."""
+        response, blacklist_queries = self._refresh(self.refresh)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(blacklist_queries, 1)
+        self.assertIn('refresh', response.data)
+        
+        response, blacklist_queries = self._refresh(self.refresh)
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(blacklist_queries, 0)
+    
+    def test_negative_result_not_cached_without_shared_cache(self):
+        """Süreç içi önbellekte kara listede olmayan sonucun önbelleğe alınmadığını test eder."""
+        CachedRefreshToken(str(self.refresh))
+        
+        self.assertIsNone(cache.get(blacklist_cache_key(self.refresh['jti'])))
+    
+    @override_settings(CACHE_URL='redis://cache:6379/1')
+    def test_negative_result_never_overwrites_blacklist(self):
+        """Kontrol sırasında kara listeye eklenen token'ın önbellekteki kaydının ezilmediğini test eder."""
+        jti = self.refresh['jti']
+        
+        def blacklisted_meanwhile():
+            mark_blacklisted(jti, self.refresh['exp'])
+            return False
+        
+        with mock.patch('users.tokens.BlacklistedToken.objects.filter') as blacklist_filter:
+            blacklist_filter.return_value.exists.side_effect = blacklisted_meanwhile
+            CachedRefreshToken(str(self.refresh))
+        
+        self.assertIs(cache.get(blacklist_cache_key(jti)), True)
+    
+    def test_purge_expired_tokens(self):
+        """Süresi dolmuş token'ların ve kara liste kayıtlarının parça parça silindiğini test eder."""
+        for token in OutstandingToken.objects.all():
+            BlacklistedToken.objects.create(token=token)
+        OutstandingToken.objects.update(expires_at=timezone.now() - timedelta(minutes=1))
+        for _ in range(3):
+            RefreshToken.for_user(self.user)
+        live = RefreshToken.for_user(self.user)
+        OutstandingToken.objects.exclude(jti=live['jti']).update(
+            expires_at=timezone.now() - timedelta(minutes=1)
+        )
+        
+        deleted = purge_expired_tokens(batch_size=2)
+        
+        self.assertEqual(deleted, 4)
+        self.assertEqual(list(OutstandingToken.objects.values_list('jti', flat=True)), [live['jti']])
+        self.assertFalse(BlacklistedToken.objects.exists())
+
+
+class PasswordHashingTestCase(APITestCase):
+    """
+    Hash profilleri, girişte hash yenileme ve hash'leme havuzunun geri basıncı için testler.
+    """
+    
+    def setUp(self):
+        """Test kullanıcısını düşük iterasyonlu bir PBKDF2 hash'i ile hazırlar."""
+        self.client = APIClient()
+        self.login_url = '/api/auth/users/login/'
+        with self.settings(PASSWORD_HASHER_PARAMS={'PBKDF2_ITERATIONS': 1000}):
+            self.user = User.objects.create_user(
+                username='testuser',
+                email='test@example.com',
+                password='testpass123'
+            )
+    
+    def tearDown(self):
+        PasswordHashingService.shutdown()
+    
+    def _login(self):
+        return self.client.post(
+            self.login_url,
+            {'username': 'testuser', 'password': 'testpass123'},
+            format='json'
+        )
+    
+    @override_settings(PASSWORD_HASHER_PARAMS={'PBKDF2_ITERATIONS': 2000})
+    def test_login_rehashes_with_tuned_iterations(self):
+        """Parametreler değiştiğinde hash'in girişte yenilendiğini test eder."""
+        self.assertTrue(self.user.password.startswith('pbkdf2_sha256$1000$'))
+        
+        response = self._login()
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith('pbkdf2_sha256$2000$'))
+    
+    @override_settings(
+        PASSWORD_HASHERS=[
+            'users.hashers.TunedScryptPasswordHasher',
+            'users.hashers.TunedPBKDF2PasswordHasher',
+        ],
+        PASSWORD_HASHER_PARAMS={'SCRYPT_WORK_FACTOR': 2 ** 10}
+    )
+    def test_login_migrates_to_new_profile(self):
+        """Profil değiştiğinde eski hash'in girişte yeni algoritmaya taşındığını test eder."""
+        response = self._login()
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith('scrypt$1024$'))
+        self.assertTrue(self.user.check_password('testpass123'))
+    
+    @override_settings(
+        AUTH_HASHING_MODE='thread',
+        PASSWORD_HASHER_PARAMS={'PBKDF2_ITERATIONS': 1000}
+    )
+    def test_login_in_thread_pool(self):
+        """Hash'leme thread havuzunda çalışırken girişin başarılı olduğunu test eder."""
+        response = self._login()
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+    
+    @override_settings(
+        AUTH_HASHING_MODE='thread',
+        AUTH_HASHING_WORKERS=1,
+        AUTH_HASHING_QUEUE_SIZE=0,
+        AUTH_HASHING_WAIT_TIMEOUT=0
+    )
+    def test_login_rejected_when_pool_saturated(self):
+        """Havuz doluyken girişin 503 ile reddedildiğini test eder."""
+        _, slots = PasswordHashingService._pool()
+        slots.acquire()
+        try:
+            response = self._login()
+        finally:
+            slots.release()
+        
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+
+
+@override_settings(PASSWORD_HASHER_PARAMS={'PBKDF2_ITERATIONS': 1000})
+class BulkCreateUsersCommandTestCase(TestCase):
+    """
+    bulk_create_users yönetim komutu için testler.
+    """
+    
+    def setUp(self):
+        """Mevcut bir kullanıcı oluşturur."""
+        User.objects.create_user(username='existing', email='existing@example.com', password='testpass123')
+    
+    def _run(self, content, **options):
+        with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False) as csv_file:
+            csv_file.write(content)
+        self.addCleanup(os.remove, csv_file.name)
+        out = StringIO()
+        call_command('bulk_create_users', csv_file.name, stdout=out, **options)
+        return out.getvalue()
+    
+    def test_bulk_create_users(self):
+        """Düz parola, hazır hash, parolasız ve mevcut kullanıcı satırlarının işlendiğini test eder."""
+        prehashed = make_password('hashedpass123')
+        output = self._run(
+            'username,email,password,password_hash,first_name\n'
+            'alice,alice@example.com,alicepass123,,Alice\n'
+            'bob,bob@EXAMPLE.com,bobpass123,,\n'
+            f'carol,carol@example.com,,{prehashed},\n'
+            'dave,dave@example.com,,,\n'
+            'existing,other@example.com,otherpass123,,\n',
+            batch_size=2,
+            workers=2
+        )
+        
+        self.assertIn('Created 4 user(s), skipped 1', output)
+        self.assertTrue(User.objects.get(username='alice').check_password('alicepass123'))
+        self.assertEqual(User.objects.get(username='alice').first_name, 'Alice')
+        self.assertEqual(User.objects.get(username='bob').email, 'bob@example.com')
+        self.assertEqual(User.objects.get(username='carol').password, prehashed)
+        self.assertFalse(User.objects.get(username='dave').has_usable_password())
+        self.assertFalse(User.objects.get(username='existing').check_password('otherpass123'))
+    
+    def test_bulk_create_users_rejects_invalid_hash(self):
+        """Geçersiz password_hash değerinin satır numarasıyla reddedildiğini test eder."""
+        with self.assertRaisesMessage(CommandError, 'Line 3'):
+            self._run(
+                'username,email,password_hash\n'
+                'alice,alice@example.com,\n'
+                'bob,bob@example.com,not-a-hash\n',
+                workers=0
+            )
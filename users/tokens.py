@@ -0,0 +1,94 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+
+def blacklist_cache_key(jti) -> str:
+    return f'jwt:bl:{jti}'
+
+
+def shared_cache_enabled() -> bool:
+    """True when CACHE_URL points every process at the same cache (Redis) instead of a per-process LocMem."""
+    return bool(settings.CACHE_URL)
+
+
+def _seconds_until(exp) -> int:
+    """Remaining lifetime of a token in seconds (at least 1, so the key is never permanent)."""
+    return max(int(exp - time.time()), 1)
+
+
+def mark_blacklisted(jti, exp) -> None:
+    """Record a blacklisted jti in the cache until the token would expire anyway."""
+    cache.set(blacklist_cache_key(jti), True, _seconds_until(exp))
+
+
+class CachedRefreshToken(RefreshToken):
+    """
+    Refresh token whose blacklist check is served from the cache.
+    This is like a Spring Security token store with a Redis-backed revocation list.
+
+    The default check joins BlacklistedToken and OutstandingToken on every refresh and logout.
+    Here each jti is looked up in the cache first and the database is only queried on a miss.
+    Positive results live until the token expires.
+
+    Negative results are only cached with a shared cache (see shared_cache_enabled), for at most
+    JWT_BLACKLIST_NEGATIVE_TIMEOUT seconds. They are written with cache.add(), so a concurrent
+    refresh can never overwrite the True written by the blacklist signal. With the per-process
+    LocMem fallback other workers would never see that True, so negatives always go to the database.
+    """
+
+    def check_blacklist(self) -> None:
+        jti = self.payload[api_settings.JTI_CLAIM]
+        key = blacklist_cache_key(jti)
+
+        blacklisted = cache.get(key)
+        if blacklisted is None:
+            blacklisted = BlacklistedToken.objects.filter(token__jti=jti).exists()
+            if blacklisted:
+                mark_blacklisted(jti, self.payload['exp'])
+            elif shared_cache_enabled():
+                timeout = min(_seconds_until(self.payload['exp']), settings.JWT_BLACKLIST_NEGATIVE_TIMEOUT)
+                cache.add(key, False, timeout)
+
+        if blacklisted:
+            raise TokenError(_('Token is blacklisted'))
+
+    def _outstanding_defaults(self) -> dict:
+        # The user id comes from the token itself; the stock implementation loads the user first.
+        return {
+            'user_id': self.payload.get(api_settings.USER_ID_CLAIM),
+            'created_at': self.current_time,
+            'token': str(self),
+            'expires_at': datetime_from_epoch(self.payload['exp']),
+        }
+
+    def outstand(self):
+        return OutstandingToken.objects.get_or_create(
+            jti=self.payload[api_settings.JTI_CLAIM],
+            defaults=self._outstanding_defaults(),
+        )
+
+    def blacklist(self):
+        token, _ = OutstandingToken.objects.get_or_create(
+            jti=self.payload[api_settings.JTI_CLAIM],
+            defaults=self._outstanding_defaults(),
+        )
+        # The cache entry itself is written by the post_save signal (see users/signals.py),
+        # which also covers tokens blacklisted from the admin or by other views.
+        return BlacklistedToken.objects.get_or_create(token=token)
+
+
+class CachedTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    Refresh serializer that uses CachedRefreshToken for blacklist checks and rotation.
+    Wired in through SIMPLE_JWT['TOKEN_REFRESH_SERIALIZER'].
+    """
+    token_class = CachedRefreshToken
@@ -3,11 +3,10 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from django.contrib.auth import authenticate
-from rest_framework_simplejwt.tokens import RefreshToken
-from rest_framework_simplejwt.token_blacklist.models import OutstandingToken, BlacklistedToken
 
 from .models import User
 from .serializers import UserSerializer, UserRegistrationSerializer
+from .tokens import CachedRefreshToken
 
 
 class UserViewSet(viewsets.ModelViewSet):
@@ -60,7 +59,7 @@ class UserViewSet(viewsets.ModelViewSet):
         
         user = authenticate(username=username, password=password)
         if user:
-            refresh = RefreshToken.for_user(user)
+            refresh = CachedRefreshToken.for_user(user)
             return Response({
                 'user': UserSerializer(user).data,
                 'refresh': str(refresh),
@@ -92,10 +91,11 @@ class UserViewSet(viewsets.ModelViewSet):
                 )
             
             # Get the token object
-            token = RefreshToken(refresh_token)
+            # The blacklist check is served from the cache (see users/tokens.py)
+            token = CachedRefreshToken(refresh_token)
             
             # Blacklist the refresh token
-            # This adds it to the database blacklist table
+            # This adds it to the database blacklist table and the cache
             token.blacklist()
             
             return Response(